@@ -12,9 +12,11 @@ from app.core.dependencies import AuthenticatedUser, get_current_user
 from app.core.session import (
     get_access_token,
     get_refresh_token,
+    get_token_expires_at,
     get_user_info,
     set_access_token,
     set_refresh_token,
+    set_tokens,
     set_user_info
 )
 from app.core.exceptions import (
@@ -38,7 +40,9 @@ from app.core.constants import (
     ROUTES,
     SESSION_KEYS,
     DATE_FORMAT,
-    DATE_FORMAT_DISPLAY
+    DATE_FORMAT_DISPLAY,
+    DATETIME_FORMAT_DISPLAY,
+    TIME_FORMAT_DISPLAY
 )
 
 __all__ = [
@@ -55,9 +59,11 @@ __all__ = [
     # Session
     "get_access_token",
     "get_refresh_token",
+    "get_token_expires_at",
     "get_user_info",
     "set_access_token",
     "set_refresh_token",
+    "set_tokens",
     "set_user_info",
     # Exceptions
     "BaseApplicationException",
@@ -81,4 +87,6 @@ __all__ = [
     "SESSION_KEYS",
     "DATE_FORMAT",
     "DATE_FORMAT_DISPLAY",
+    "DATETIME_FORMAT_DISPLAY",
+    "TIME_FORMAT_DISPLAY",
 ]
@@ -1,17 +1,18 @@
 """Application configuration and setup."""
 
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse, JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from fastapi.templating import Jinja2Templates
 
 from app.core.error_handler import global_exception_handler
 from app.core.exceptions import BaseApplicationException
 from app.core.middleware import SessionCookieMiddleware
 from app.core.constants import ROUTES
+from app.core.templates import get_templates, warm_up_templates
 
 
 async def not_found_handler(request: Request, exc: StarletteHTTPException):
@@ -29,8 +30,7 @@ async def not_found_handler(request: Request, exc: StarletteHTTPException):
             }
         )
     
-    templates = Jinja2Templates(directory=str(Path(__file__).resolve().parent.parent.parent / "templates"))
-    return templates.TemplateResponse(
+    return get_templates().TemplateResponse(
         "404.html",
         {"request": request, "path": request.url.path},
         status_code=404
@@ -59,6 +59,7 @@ def configure_static_files(app: FastAPI, base_dir: Path) -> None:
 def configure_routes(app: FastAPI) -> None:
     """Configure application routes."""
     from app.presentation.api.v1.worklogs import router as worklogs_router
+    from app.presentation.api.v1.metrics import router as metrics_router
     from app.presentation.web.worklogs import router as ui_router
     from app.presentation.web.auth import router as auth_router
     
@@ -67,10 +68,23 @@ def configure_routes(app: FastAPI) -> None:
         return RedirectResponse(url=ROUTES["UI_WORKLOGS"])
     
     app.include_router(worklogs_router)
+    app.include_router(metrics_router)
     app.include_router(auth_router)
     app.include_router(ui_router)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Compile templates on startup and release shared resources on shutdown."""
+    from app.core.container import Container
+
+    warm_up_templates()
+    yield
+    await Container.get_ui_summary_cache().aclose()
+    await Container.get_summary_jobs().aclose()
+    await Container.close_async_http_client()
+
+
 def create_app(environment: Optional[str] = None) -> FastAPI:
     """Create and configure FastAPI application.
     
@@ -81,7 +95,8 @@ def create_app(environment: Optional[str] = None) -> FastAPI:
         title="Jira Worklog Summary API",
         version="1.0.0",
         docs_url="/docs" if environment != "production" else None,
-        redoc_url="/redoc" if environment != "production" else None
+        redoc_url="/redoc" if environment != "production" else None,
+        lifespan=lifespan
     )
     
     base_dir = Path(__file__).resolve().parent.parent.parent
@@ -1,4 +1,6 @@
+import time
 import requests
+from typing import Dict, Optional
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from urllib.parse import urlencode
@@ -10,26 +12,50 @@ from app.core.config import (
     JIRA_OAUTH_AUTHORIZE_URL,
     JIRA_OAUTH_TOKEN_URL,
     JIRA_API_BASE_URL,
-    JIRA_DOMAIN
+    JIRA_DOMAIN,
+    AUTH_CACHE_MAX_ENTRIES,
+    AUTH_PROFILE_CACHE_TTL_SECONDS,
+    AUTH_SITE_CACHE_TTL_SECONDS
 )
+from app.core.constants import REFRESHED_TOKENS_KEEP_SECONDS, REFRESHED_TOKENS_MIN_REMAINING_SECONDS
+from app.core.cache import TTLCache
+from app.core.singleflight import SingleFlight
 from app.core.logging import get_logger
+from app.core.rate_limit import client_key, get_rate_limiter
 from app.core.exceptions import AuthenticationError, ExternalServiceError
 
 logger = get_logger(__name__)
 OAUTH_SCOPES = "read:jira-work read:jira-user offline_access"
+OAUTH_RATE_LIMIT_KEY = "oauth"
 
 _oauth_session = None
 
+# Keyed by access token fingerprint, so raw tokens are never held as keys.
+_profile_cache = TTLCache(max_entries=AUTH_CACHE_MAX_ENTRIES, ttl_seconds=AUTH_PROFILE_CACHE_TTL_SECONDS)
+# Token fingerprint -> (cloud ID, account ID or None once /myself has answered).
+_token_site_cache = TTLCache(max_entries=AUTH_CACHE_MAX_ENTRIES, ttl_seconds=AUTH_SITE_CACHE_TTL_SECONDS)
+# Account ID -> cloud ID; survives token refreshes, which issue a new fingerprint.
+_account_site_cache = TTLCache(max_entries=AUTH_CACHE_MAX_ENTRIES, ttl_seconds=AUTH_SITE_CACHE_TTL_SECONDS)
+
+# Refreshes are coalesced per refresh token fingerprint. Refresh tokens may be
+# rotated, so the outcome is also kept until the new access token nears expiry:
+# requests still carrying the old refresh token pick up the new tokens instead
+# of failing to refresh.
+_token_refreshes = SingleFlight()
+_refreshed_tokens = TTLCache(max_entries=AUTH_CACHE_MAX_ENTRIES, ttl_seconds=REFRESHED_TOKENS_KEEP_SECONDS)
+
 
 def _get_oauth_session() -> requests.Session:
     """Get or create shared OAuth session with connection pooling."""
     global _oauth_session
     if _oauth_session is None:
         _oauth_session = requests.Session()
+        # Retryable statuses are retried by the rate limiter, which honours Retry-After.
         retry_strategy = Retry(
             total=3,
             backoff_factor=0.3,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status=0,
+            respect_retry_after_header=False,
             allowed_methods=["POST", "GET"]
         )
         adapter = HTTPAdapter(
@@ -59,7 +85,7 @@ def exchange_code_for_tokens(code: str) -> dict:
     session = _get_oauth_session()
     response = None
     try:
-        response = session.post(
+        response = get_rate_limiter().send(OAUTH_RATE_LIMIT_KEY, lambda: session.post(
             JIRA_OAUTH_TOKEN_URL,
             json={
                 "grant_type": "authorization_code",
@@ -70,7 +96,7 @@ def exchange_code_for_tokens(code: str) -> dict:
             },
             headers={"Content-Type": "application/json"},
             timeout=30
-        )
+        ))
         response.raise_for_status()
         return response.json()
     except requests.exceptions.HTTPError as e:
@@ -96,10 +122,45 @@ def exchange_code_for_tokens(code: str) -> dict:
 
 
 def refresh_access_token(refresh_token: str) -> dict:
+    """Exchange ``refresh_token`` for new tokens.
+
+    Concurrent refreshes with the same refresh token share one request, and
+    its response is reused by later refreshes while the new access token
+    lasts. An ``expires_at`` Unix timestamp is added when the response has
+    ``expires_in``. The returned dict is shared and must not be mutated.
+    """
+    tokens = get_refreshed_tokens(refresh_token)
+    if tokens is not None:
+        return tokens
+    key = client_key(refresh_token)
+    return _token_refreshes.do(key, lambda: _refresh_once(refresh_token, key))
+
+
+def get_refreshed_tokens(refresh_token: str) -> Optional[dict]:
+    """Return tokens already obtained with ``refresh_token``, e.g. by a concurrent request."""
+    tokens = _refreshed_tokens.get(client_key(refresh_token))
+    if tokens is None or tokens.get("expires_at", float("inf")) - time.time() < REFRESHED_TOKENS_MIN_REMAINING_SECONDS:
+        return None
+    return tokens
+
+
+def _refresh_once(refresh_token: str, key: str) -> dict:
+    # A refresh that finished just before this one started has already rotated the token.
+    tokens = get_refreshed_tokens(refresh_token)
+    if tokens is not None:
+        return tokens
+    tokens = _request_token_refresh(refresh_token)
+    if tokens.get("expires_in"):
+        tokens["expires_at"] = time.time() + float(tokens["expires_in"])
+    _refreshed_tokens.set(key, tokens)
+    return tokens
+
+
+def _request_token_refresh(refresh_token: str) -> dict:
     session = _get_oauth_session()
     response = None
     try:
-        response = session.post(
+        response = get_rate_limiter().send(OAUTH_RATE_LIMIT_KEY, lambda: session.post(
             JIRA_OAUTH_TOKEN_URL,
             json={
                 "grant_type": "refresh_token",
@@ -109,7 +170,7 @@ def refresh_access_token(refresh_token: str) -> dict:
             },
             headers={"Content-Type": "application/json"},
             timeout=30
-        )
+        ))
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -129,11 +190,11 @@ def get_accessible_resources(access_token: str) -> list:
     
     response = None
     try:
-        response = session.get(
+        response = get_rate_limiter().send(client_key(access_token), lambda: session.get(
             f"{JIRA_API_BASE_URL}/oauth/token/accessible-resources",
             headers=headers,
             timeout=30
-        )
+        ))
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -147,19 +208,71 @@ def get_accessible_resources(access_token: str) -> list:
             response.close()
 
 
-def get_cloud_id(access_token: str) -> str:
+def get_cloud_id(access_token: str, account_id: Optional[str] = None) -> str:
+    """Return the Jira site the token works against.
+
+    The site is remembered per token and, once known, per account, so a
+    refreshed token for a known ``account_id`` skips accessible-resources.
+    """
+    cached = _token_site_cache.get(client_key(access_token))
+    if cached is not None:
+        return cached[0]
+    if account_id:
+        cloud_id = _account_site_cache.get(account_id)
+        if cloud_id is not None:
+            _token_site_cache.set(client_key(access_token), (cloud_id, account_id))
+            return cloud_id
+
     resources = get_accessible_resources(access_token)
     if not resources:
         raise AuthenticationError("No accessible Jira sites found for this account")
     
+    cloud_id = resources[0]["id"]
     for resource in resources:
         if JIRA_DOMAIN and JIRA_DOMAIN in resource.get("url", ""):
-            return resource["id"]
-    
-    return resources[0]["id"]
+            cloud_id = resource["id"]
+            break
+
+    _token_site_cache.set(client_key(access_token), (cloud_id, None))
+    return cloud_id
+
+
+def get_cached_account_id(access_token: str) -> Optional[str]:
+    """Return the account a token was last seen to belong to, if still cached."""
+    cached = _token_site_cache.get(client_key(access_token))
+    return cached[1] if cached is not None else None
+
+
+def forget_access_token(access_token: str) -> None:
+    """Drop what is cached for a token, e.g. once Jira has rejected it."""
+    fingerprint = client_key(access_token)
+    _profile_cache.invalidate(fingerprint)
+    _token_site_cache.invalidate(fingerprint)
 
 
-def get_user_info(access_token: str) -> dict:
+def get_auth_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Return counters of the profile, site and token refresh caches."""
+    return {
+        "profile": _profile_cache.stats(),
+        "tokenSite": _token_site_cache.stats(),
+        "accountSite": _account_site_cache.stats(),
+        "refreshedTokens": _refreshed_tokens.stats(),
+        "tokenRefreshes": _token_refreshes.stats()
+    }
+
+
+def get_user_info(access_token: str, account_id: Optional[str] = None) -> dict:
+    """Return the token holder's Jira profile, with the site's ``cloudId`` added.
+
+    Profiles are cached per token fingerprint. ``account_id`` is a hint for
+    tokens not seen before, e.g. right after a refresh, that lets a cached
+    site be reused instead of looking it up again.
+    """
+    fingerprint = client_key(access_token)
+    cached = _profile_cache.get(fingerprint)
+    if cached is not None:
+        return dict(cached)
+
     headers = {
         "Accept": "application/json",
         "Authorization": f"Bearer {access_token}"
@@ -167,19 +280,28 @@ def get_user_info(access_token: str) -> dict:
     
     response = None
     try:
-        cloud_id = get_cloud_id(access_token)
+        cloud_id = get_cloud_id(access_token, account_id)
         user_url = f"{JIRA_API_BASE_URL}/ex/jira/{cloud_id}/rest/api/3/myself"
         
         session = _get_oauth_session()
-        response = session.get(user_url, headers=headers, timeout=30)
+        response = get_rate_limiter().send(
+            fingerprint,
+            lambda: session.get(user_url, headers=headers, timeout=30)
+        )
         response.raise_for_status()
         
         user_data = response.json()
         user_data["cloudId"] = cloud_id
-        return user_data
+        _profile_cache.set(fingerprint, user_data)
+        if user_data.get("accountId"):
+            _token_site_cache.set(fingerprint, (cloud_id, user_data["accountId"]))
+            _account_site_cache.set(user_data["accountId"], cloud_id)
+        return dict(user_data)
     except (AuthenticationError, ExternalServiceError):
         raise
     except requests.exceptions.HTTPError as e:
+        if e.response.status_code in (401, 403):
+            forget_access_token(access_token)
         logger.error(
             "Failed to fetch user info",
             extra={"status_code": e.response.status_code},
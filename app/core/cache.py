@@ -0,0 +1,199 @@
+"""In-process caching utilities."""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after a fixed time-to-live.
+
+    When the cache is full, the least recently used entry is evicted. Counters
+    for hits, misses, evictions and expirations are kept for monitoring.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._max_entries = max(1, max_entries)
+        self._ttl = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if absent or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + self._ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove ``key`` from the cache if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the cache size and counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxEntries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations
+            }
+
+
+class StaleWhileRevalidateCache:
+    """Async cache that answers from stale entries while refreshing them in the background.
+
+    An entry is fresh for ``fresh_seconds`` after it was fetched and is served
+    as is. For ``stale_seconds`` after that it is still served immediately,
+    and the first such read starts a background refresh of the key; at most
+    one refresh per key runs at a time. ``get`` fetches missing or older
+    entries in the foreground; ``peek`` never waits and refreshes them in the
+    background instead. A failed background refresh is logged and the stale
+    entry kept. Values are shared between readers, who must not mutate them.
+
+    A fetched value that ``cacheable`` rejects is returned to the caller
+    waiting for it but not stored, leaving any older entry in place.
+    """
+
+    def __init__(self, max_entries: int, fresh_seconds: float, stale_seconds: float):
+        self._entries = TTLCache(max_entries=max_entries, ttl_seconds=fresh_seconds + stale_seconds)
+        self._fresh = fresh_seconds
+        self._refreshing: Dict[Hashable, "asyncio.Task[None]"] = {}
+        self._refreshes = 0
+        self._failed_refreshes = 0
+        self._uncacheable = 0
+
+    async def get(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[T]],
+        cacheable: Optional[Callable[[T], bool]] = None
+    ) -> T:
+        """Return the cached value for ``key``, fetching it with ``fetch`` if needed."""
+        entry = self._entries.get(key)
+        if entry is None:
+            value = await fetch()
+            self._store(key, value, cacheable)
+            return value
+
+        fetched_at, value = entry
+        if time.monotonic() - fetched_at >= self._fresh:
+            self._start_refresh(key, fetch, cacheable)
+        return value
+
+    def peek(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]] = None
+    ) -> Tuple[Optional[Any], bool]:
+        """Return the cached value for ``key`` and whether it is fresh, without waiting.
+
+        The value is None when nothing usable is cached. Unless the entry is
+        fresh, a background refresh with ``fetch`` is started. Must be called
+        from a running event loop.
+        """
+        entry = self._entries.get(key)
+        fresh = entry is not None and time.monotonic() - entry[0] < self._fresh
+        if not fresh:
+            self._start_refresh(key, fetch, cacheable)
+        return (entry[1] if entry is not None else None), fresh
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a freshly fetched ``value`` under ``key``."""
+        self._entries.set(key, (time.monotonic(), value))
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove ``key`` from the cache if present."""
+        self._entries.invalidate(key)
+
+    async def aclose(self) -> None:
+        """Cancel background refreshes still running; called on application shutdown."""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the cache size and counters."""
+        return {
+            **self._entries.stats(),
+            "refreshing": len(self._refreshing),
+            "backgroundRefreshes": self._refreshes,
+            "failedRefreshes": self._failed_refreshes,
+            "uncacheable": self._uncacheable
+        }
+
+    def _start_refresh(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]]
+    ) -> None:
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(key, fetch, cacheable))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+        self._refreshes += 1
+
+    async def _refresh(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]]
+    ) -> None:
+        try:
+            self._store(key, await fetch(), cacheable)
+        except Exception as e:
+            self._failed_refreshes += 1
+            logger.warning("Background cache refresh failed, keeping stale entry", exc_info=e)
+
+    def _store(self, key: Hashable, value: Any, cacheable: Optional[Callable[[Any], bool]]) -> None:
+        if cacheable is None or cacheable(value):
+            self.set(key, value)
+        else:
+            self._uncacheable += 1
@@ -1,4 +1,5 @@
 from dotenv import load_dotenv
+from pathlib import Path
 import os
 
 load_dotenv()
@@ -24,6 +25,46 @@ JIRA_API_BASE_URL = os.getenv(
 
 SECRET_KEY = os.getenv("SECRET_KEY", "change-this-secret-key-in-production")
 
+JIRA_WORKLOG_FETCH_CONCURRENCY = int(os.getenv("JIRA_WORKLOG_FETCH_CONCURRENCY", "8"))
+JIRA_HTTP_MAX_CONNECTIONS = int(os.getenv("JIRA_HTTP_MAX_CONNECTIONS", "20"))
+JIRA_HTTP_POOL_MAXSIZE = int(os.getenv("JIRA_HTTP_POOL_MAXSIZE", "20"))
+JIRA_HTTP_POOL_IDLE_SECONDS = int(os.getenv("JIRA_HTTP_POOL_IDLE_SECONDS", "300"))
+JIRA_BULK_FETCH_ENABLED = os.getenv("JIRA_BULK_FETCH_ENABLED", "false").lower() in ("1", "true", "yes")
+JIRA_BULK_FETCH_MIN_DAYS = int(os.getenv("JIRA_BULK_FETCH_MIN_DAYS", "90"))
+JIRA_BULK_FETCH_MIN_ISSUES = int(os.getenv("JIRA_BULK_FETCH_MIN_ISSUES", "200"))
+JIRA_RATE_LIMIT_PER_SECOND = float(os.getenv("JIRA_RATE_LIMIT_PER_SECOND", "50"))
+JIRA_RATE_LIMIT_BURST = int(os.getenv("JIRA_RATE_LIMIT_BURST", "100"))
+JIRA_RATE_LIMIT_MIN_PER_SECOND = float(os.getenv("JIRA_RATE_LIMIT_MIN_PER_SECOND", "2"))
+
+WORKLOG_CACHE_PATH = os.getenv("WORKLOG_CACHE_PATH", "")
+WORKLOG_CACHE_MAX_AGE_SECONDS = int(os.getenv("WORKLOG_CACHE_MAX_AGE_SECONDS", "300"))
+WORKLOG_SYNC_MAX_PAGES = int(os.getenv("WORKLOG_SYNC_MAX_PAGES", "10"))
+
+TEMPLATE_CACHE_PATH = os.getenv(
+    "TEMPLATE_CACHE_PATH",
+    str(Path(__file__).resolve().parents[2] / ".cache" / "templates")
+)
+TEMPLATE_AUTO_RELOAD = os.getenv("TEMPLATE_AUTO_RELOAD", "true").lower() in ("1", "true", "yes")
+
+JIRA_ISSUE_FETCH_TIMEOUT_SECONDS = float(os.getenv("JIRA_ISSUE_FETCH_TIMEOUT_SECONDS", "20"))
+WORKLOG_RETRY_ATTEMPTS = int(os.getenv("WORKLOG_RETRY_ATTEMPTS", "4"))
+WORKLOG_RETRY_JOB_TTL_SECONDS = int(os.getenv("WORKLOG_RETRY_JOB_TTL_SECONDS", "600"))
+
+ISSUE_CACHE_MAX_ENTRIES = int(os.getenv("ISSUE_CACHE_MAX_ENTRIES", "5000"))
+ISSUE_CACHE_TTL_SECONDS = int(os.getenv("ISSUE_CACHE_TTL_SECONDS", "600"))
+
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "100"))
+SUMMARY_CACHE_TTL_SECONDS = int(os.getenv("SUMMARY_CACHE_TTL_SECONDS", "60"))
+
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
+AUTH_PROFILE_CACHE_TTL_SECONDS = int(os.getenv("AUTH_PROFILE_CACHE_TTL_SECONDS", "300"))
+AUTH_SITE_CACHE_TTL_SECONDS = int(os.getenv("AUTH_SITE_CACHE_TTL_SECONDS", "3600"))
+TOKEN_REFRESH_LEEWAY_SECONDS = int(os.getenv("TOKEN_REFRESH_LEEWAY_SECONDS", "300"))
+
+UI_SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("UI_SUMMARY_CACHE_MAX_ENTRIES", "1000"))
+UI_SUMMARY_CACHE_FRESH_SECONDS = int(os.getenv("UI_SUMMARY_CACHE_FRESH_SECONDS", "30"))
+UI_SUMMARY_CACHE_STALE_SECONDS = int(os.getenv("UI_SUMMARY_CACHE_STALE_SECONDS", "600"))
+
 if not JIRA_DOMAIN:
     raise RuntimeError("Missing JIRA_DOMAIN in .env file")
 
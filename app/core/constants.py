@@ -5,7 +5,8 @@ API_V1_PREFIX = "/api/v1"
 API_TAGS = {
     "WORKLOGS": "Worklogs",
     "AUTH": "Auth",
-    "UI": "UI"
+    "UI": "UI",
+    "METRICS": "Metrics"
 }
 
 # Route Paths
@@ -18,7 +19,11 @@ ROUTES = {
     "AUTH_LOGOUT": "/auth/logout",
     "AUTH_ME": "/auth/me",
     "AUTH_DENIED": "/auth/denied",
-    "API_WORKLOGS_SUMMARY": f"{API_V1_PREFIX}/jira-worklogs/summary"
+    "API_WORKLOGS_SUMMARY": f"{API_V1_PREFIX}/jira-worklogs/summary",
+    "API_WORKLOGS_ROLLUP": f"{API_V1_PREFIX}/jira-worklogs/rollup",
+    "API_WORKLOGS_TEAM_SUMMARY": f"{API_V1_PREFIX}/jira-worklogs/team-summary",
+    "API_WORKLOGS_JOBS": f"{API_V1_PREFIX}/jira-worklogs/jobs",
+    "API_METRICS": f"{API_V1_PREFIX}/metrics"
 }
 
 # Session Keys
@@ -26,17 +31,57 @@ SESSION_KEYS = {
     "ACCESS_TOKEN": "access_token",
     "REFRESH_TOKEN": "refresh_token",
     "USER_INFO": "user_info",
+    "TOKEN_EXPIRES_AT": "token_expires_at",
     "OAUTH_STATE": "oauth_state"
 }
 
+# Media Types
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+
 # Date Formats
 DATE_FORMAT = "%Y-%m-%d"
 DATE_FORMAT_DISPLAY = "%d-%m-%Y"
+DATETIME_FORMAT_DISPLAY = "%d-%m-%Y %H:%M"
+TIME_FORMAT_DISPLAY = "%H:%M"
+TIMESTAMP_CACHE_SIZE = 65536
 
 # Time Constants
+SECONDS_PER_DAY = 86400
 SECONDS_PER_HOUR = 3600
 SECONDS_PER_MINUTE = 60
 
 # Jira API Constants
 JIRA_API_VERSION = "3"
 JIRA_MAX_RESULTS = 100
+JIRA_WORKLOG_LIST_BATCH_SIZE = 1000
+JIRA_WORKLOG_PAGE_SIZE = 1000
+JIRA_GROUP_MEMBER_PAGE_SIZE = 50
+JIRA_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+JIRA_MAX_RETRIES = 3
+JIRA_RETRY_BACKOFF_SECONDS = 0.3
+
+# Refreshed tokens this close to expiry are not handed out again; the request
+# refreshes with its own refresh token instead
+REFRESHED_TOKENS_MIN_REMAINING_SECONDS = 30
+# Upper bound on how long refreshed tokens are kept for requests still carrying
+# the refresh token they replaced; Jira access tokens last an hour
+REFRESHED_TOKENS_KEEP_SECONDS = 3600
+
+# Background retries of issues whose worklogs could not be fetched
+WORKLOG_RETRY_BACKOFF_SECONDS = 0.5
+SUMMARY_JOB_MAX_ENTRIES = 1000
+SUMMARY_JOB_MAX_WAIT_SECONDS = 60
+# Failed issue keys listed in a summary response header; the count is always given
+SUMMARY_FAILED_ISSUES_HEADER_LIMIT = 100
+
+# Summary exports: rows encoded per chunk (a Parquet row group), bytes per chunk
+# read back from a finished workbook, and rows per worksheet (the XLSX limit)
+EXPORT_ROWS_PER_CHUNK = 5000
+EXPORT_FILE_CHUNK_BYTES = 65536
+XLSX_MAX_ROWS = 1048576
+
+# Team summaries list accounts in the JQL, which bounds how many can be requested
+TEAM_SUMMARY_MAX_ACCOUNTS = 100
@@ -2,11 +2,69 @@
 
 from typing import Optional
 
-from app.domain.interfaces import IJiraClient, IWorklogRepository, IWorklogService
+import httpx
+
+from app.domain.interfaces import (
+    ICredentialProvider,
+    IJiraClient,
+    IWorklogRepository,
+    IWorklogService,
+    IWorklogStore,
+    IAsyncJiraClient,
+    IAsyncWorklogRepository,
+    IAsyncWorklogService
+)
 from app.infrastructure.jira_client import JiraClient
+from app.infrastructure.async_jira_client import AsyncJiraClient
+from app.infrastructure.http_pool import create_async_client
+from app.infrastructure.worklog_store import WorklogStore
 from app.domain.repositories.worklog_repository import WorklogRepository
+from app.domain.repositories.async_worklog_repository import AsyncWorklogRepository
 from app.domain.services.worklog_service import WorklogService
+from app.domain.services.async_worklog_service import AsyncWorklogService
 from app.core.dependencies import AuthenticatedUser
+from app.core.config import (
+    JIRA_WORKLOG_FETCH_CONCURRENCY,
+    JIRA_BULK_FETCH_ENABLED,
+    JIRA_BULK_FETCH_MIN_DAYS,
+    JIRA_BULK_FETCH_MIN_ISSUES,
+    WORKLOG_CACHE_PATH,
+    WORKLOG_CACHE_MAX_AGE_SECONDS,
+    WORKLOG_SYNC_MAX_PAGES,
+    WORKLOG_RETRY_JOB_TTL_SECONDS,
+    ISSUE_CACHE_MAX_ENTRIES,
+    ISSUE_CACHE_TTL_SECONDS,
+    SUMMARY_CACHE_MAX_ENTRIES,
+    SUMMARY_CACHE_TTL_SECONDS,
+    UI_SUMMARY_CACHE_MAX_ENTRIES,
+    UI_SUMMARY_CACHE_FRESH_SECONDS,
+    UI_SUMMARY_CACHE_STALE_SECONDS,
+    JIRA_HTTP_MAX_CONNECTIONS,
+    JIRA_HTTP_POOL_MAXSIZE,
+    JIRA_HTTP_POOL_IDLE_SECONDS
+)
+from app.core.cache import StaleWhileRevalidateCache, TTLCache
+from app.core.constants import SUMMARY_JOB_MAX_ENTRIES
+from app.core.jobs import JobRegistry
+from app.core.loop_thread import get_loop_thread
+from app.core.singleflight import AsyncSingleFlight
+from app.core.rate_limit import RateLimiter, get_rate_limiter
+
+_worklog_store = None
+_issue_cache = TTLCache(max_entries=ISSUE_CACHE_MAX_ENTRIES, ttl_seconds=ISSUE_CACHE_TTL_SECONDS)
+_summary_cache = TTLCache(max_entries=SUMMARY_CACHE_MAX_ENTRIES, ttl_seconds=SUMMARY_CACHE_TTL_SECONDS)
+_ui_summary_cache = StaleWhileRevalidateCache(
+    max_entries=UI_SUMMARY_CACHE_MAX_ENTRIES,
+    fresh_seconds=UI_SUMMARY_CACHE_FRESH_SECONDS,
+    stale_seconds=UI_SUMMARY_CACHE_STALE_SECONDS
+)
+_summary_jobs = JobRegistry(max_entries=SUMMARY_JOB_MAX_ENTRIES, ttl_seconds=WORKLOG_RETRY_JOB_TTL_SECONDS)
+_async_http_client = None
+_async_single_flight = AsyncSingleFlight()
+# The blocking stack runs on its own event loop thread, so it cannot share
+# the request loop's HTTP connections or single-flight group.
+_blocking_http_client = None
+_blocking_single_flight = AsyncSingleFlight()
 
 
 class Container:
@@ -15,37 +73,249 @@ class Container:
     @staticmethod
     def get_jira_client(
         access_token: Optional[str] = None,
-        cloud_id: Optional[str] = None
+        cloud_id: Optional[str] = None,
+        credentials: Optional[ICredentialProvider] = None
     ) -> IJiraClient:
-        """Create and return Jira client instance."""
-        return JiraClient(access_token=access_token, cloud_id=cloud_id)
+        """Create and return blocking Jira client instance over the blocking stack's HTTP client."""
+        global _blocking_http_client
+        if _blocking_http_client is None:
+            _blocking_http_client = Container._create_http_client()
+        async_client = AsyncJiraClient(
+            access_token=access_token,
+            cloud_id=cloud_id,
+            http_client=_blocking_http_client,
+            credentials=credentials
+        )
+        return JiraClient(async_client, get_loop_thread())
+
+    @staticmethod
+    def get_worklog_store() -> Optional[IWorklogStore]:
+        """Return the shared worklog store, or None when caching is disabled."""
+        global _worklog_store
+        if _worklog_store is None and WORKLOG_CACHE_PATH:
+            _worklog_store = WorklogStore(WORKLOG_CACHE_PATH)
+        return _worklog_store
+
+    @staticmethod
+    def get_issue_cache() -> TTLCache:
+        """Return the process-wide issue metadata cache."""
+        return _issue_cache
+
+    @staticmethod
+    def get_summary_cache() -> TTLCache:
+        """Return the process-wide short-lived cache of complete worklog summaries."""
+        return _summary_cache
+
+    @staticmethod
+    def get_summary_jobs() -> JobRegistry:
+        """Return the registry of background jobs completing partial summaries."""
+        return _summary_jobs
+
+    @staticmethod
+    def get_ui_summary_cache() -> StaleWhileRevalidateCache:
+        """Return the process-wide cache of the summaries shown on the UI landing page."""
+        return _ui_summary_cache
+
+    @staticmethod
+    def get_rate_limiter() -> RateLimiter:
+        """Return the process-wide rate limiter for Jira traffic."""
+        return get_rate_limiter()
+
+    @staticmethod
+    def get_async_single_flight() -> AsyncSingleFlight:
+        """Return the process-wide group coalescing identical concurrent async fetches."""
+        return _async_single_flight
+
+    @staticmethod
+    def get_async_http_client() -> httpx.AsyncClient:
+        """Return the shared async HTTP client, creating it on first use."""
+        global _async_http_client
+        if _async_http_client is None:
+            _async_http_client = Container._create_http_client()
+        return _async_http_client
+
+    @staticmethod
+    def _create_http_client() -> httpx.AsyncClient:
+        return create_async_client(
+            max_connections=JIRA_HTTP_MAX_CONNECTIONS,
+            pool_maxsize=JIRA_HTTP_POOL_MAXSIZE,
+            idle_timeout=JIRA_HTTP_POOL_IDLE_SECONDS
+        )
+
+    @staticmethod
+    async def close_async_http_client() -> None:
+        """Close the shared async HTTP client; called on application shutdown."""
+        global _async_http_client
+        if _async_http_client is not None:
+            client, _async_http_client = _async_http_client, None
+            await client.aclose()
+
+    @staticmethod
+    def get_async_jira_client(
+        access_token: Optional[str] = None,
+        cloud_id: Optional[str] = None,
+        credentials: Optional[ICredentialProvider] = None
+    ) -> IAsyncJiraClient:
+        """Create and return async Jira client instance over the shared HTTP client."""
+        return AsyncJiraClient(
+            access_token=access_token,
+            cloud_id=cloud_id,
+            http_client=Container.get_async_http_client(),
+            credentials=credentials
+        )
 
     @staticmethod
-    def get_worklog_repository(jira_client: IJiraClient) -> IWorklogRepository:
-        """Create and return worklog repository instance."""
-        return WorklogRepository(jira_client=jira_client)
+    def get_async_worklog_repository(
+        jira_client: IAsyncJiraClient,
+        cloud_id: Optional[str] = None,
+        owner_account_id: Optional[str] = None,
+        time_zone: Optional[str] = None
+    ) -> IAsyncWorklogRepository:
+        """Create and return async worklog repository instance."""
+        return Container._create_async_worklog_repository(
+            jira_client,
+            cloud_id,
+            owner_account_id,
+            time_zone,
+            single_flight=Container.get_async_single_flight(),
+            retry_jobs=Container.get_summary_jobs()
+        )
+
+    @staticmethod
+    def get_worklog_repository(
+        jira_client: JiraClient,
+        cloud_id: Optional[str] = None,
+        owner_account_id: Optional[str] = None,
+        time_zone: Optional[str] = None
+    ) -> IWorklogRepository:
+        """Create and return blocking worklog repository instance.
+
+        Background retries would outlive the blocking call, so failed issues
+        are listed in the summary but not refetched.
+        """
+        repository = Container._create_async_worklog_repository(
+            jira_client.async_client,
+            cloud_id,
+            owner_account_id,
+            time_zone,
+            single_flight=_blocking_single_flight,
+            retry_jobs=None
+        )
+        return WorklogRepository(repository, jira_client.loop_thread)
+
+    @staticmethod
+    def _create_async_worklog_repository(
+        jira_client: IAsyncJiraClient,
+        cloud_id: Optional[str],
+        owner_account_id: Optional[str],
+        time_zone: Optional[str],
+        single_flight: AsyncSingleFlight,
+        retry_jobs: Optional[JobRegistry]
+    ) -> AsyncWorklogRepository:
+        return AsyncWorklogRepository(
+            jira_client=jira_client,
+            max_workers=JIRA_WORKLOG_FETCH_CONCURRENCY,
+            bulk_fetch=JIRA_BULK_FETCH_ENABLED,
+            bulk_min_days=JIRA_BULK_FETCH_MIN_DAYS,
+            bulk_min_issues=JIRA_BULK_FETCH_MIN_ISSUES,
+            store=Container.get_worklog_store(),
+            cloud_id=cloud_id,
+            owner_account_id=owner_account_id,
+            cache_max_age=WORKLOG_CACHE_MAX_AGE_SECONDS,
+            sync_max_pages=WORKLOG_SYNC_MAX_PAGES,
+            issue_cache=Container.get_issue_cache(),
+            single_flight=single_flight,
+            time_zone=time_zone,
+            retry_jobs=retry_jobs
+        )
+
+    @staticmethod
+    def get_async_worklog_service(
+        worklog_repository: IAsyncWorklogRepository,
+        user_account_id: Optional[str] = None,
+        cloud_id: Optional[str] = None,
+        time_zone: Optional[str] = None
+    ) -> IAsyncWorklogService:
+        """Create and return async worklog service instance."""
+        return AsyncWorklogService(
+            worklog_repository=worklog_repository,
+            user_account_id=user_account_id,
+            cloud_id=cloud_id,
+            single_flight=Container.get_async_single_flight(),
+            time_zone=time_zone,
+            summary_cache=Container.get_summary_cache()
+        )
 
     @staticmethod
     def get_worklog_service(
-        worklog_repository: IWorklogRepository,
-        user_account_id: Optional[str] = None
+        worklog_repository: WorklogRepository,
+        user_account_id: Optional[str] = None,
+        cloud_id: Optional[str] = None,
+        time_zone: Optional[str] = None
     ) -> IWorklogService:
-        """Create and return worklog service instance."""
-        return WorklogService(
-            worklog_repository=worklog_repository,
-            user_account_id=user_account_id
+        """Create and return blocking worklog service instance."""
+        service = AsyncWorklogService(
+            worklog_repository=worklog_repository.async_repository,
+            user_account_id=user_account_id,
+            cloud_id=cloud_id,
+            single_flight=_blocking_single_flight,
+            time_zone=time_zone,
+            summary_cache=Container.get_summary_cache()
         )
+        return WorklogService(service, worklog_repository.loop_thread)
 
     @staticmethod
-    def get_worklog_service_for_user(user: AuthenticatedUser) -> IWorklogService:
-        """Get worklog service configured for authenticated user."""
+    def get_worklog_service_for_user(
+        user: AuthenticatedUser,
+        credentials: Optional[ICredentialProvider] = None
+    ) -> IWorklogService:
+        """Get blocking worklog service configured for authenticated user.
+
+        For scripts and other callers without an event loop; routes use
+        ``get_async_worklog_service_for_user``.
+        """
         jira_client = Container.get_jira_client(
             access_token=user.access_token,
-            cloud_id=user.cloud_id
+            cloud_id=user.cloud_id,
+            credentials=credentials
+        )
+        repository = Container.get_worklog_repository(
+            jira_client,
+            cloud_id=user.cloud_id,
+            owner_account_id=user.account_id,
+            time_zone=user.time_zone
+        )
+        return Container.get_worklog_service(
+            repository,
+            user_account_id=user.account_id,
+            cloud_id=user.cloud_id,
+            time_zone=user.time_zone
+        )
+
+    @staticmethod
+    def get_async_worklog_service_for_user(
+        user: AuthenticatedUser,
+        credentials: Optional[ICredentialProvider] = None
+    ) -> IAsyncWorklogService:
+        """Get async worklog service configured for authenticated user.
+
+        With ``credentials``, Jira calls rejected with 401 are retried with a
+        refreshed token instead of failing the whole request.
+        """
+        jira_client = Container.get_async_jira_client(
+            access_token=user.access_token,
+            cloud_id=user.cloud_id,
+            credentials=credentials
+        )
+        repository = Container.get_async_worklog_repository(
+            jira_client,
+            cloud_id=user.cloud_id,
+            owner_account_id=user.account_id,
+            time_zone=user.time_zone
         )
-        repository = Container.get_worklog_repository(jira_client)
-        service = Container.get_worklog_service(
+        return Container.get_async_worklog_service(
             repository,
-            user_account_id=user.account_id
+            user_account_id=user.account_id,
+            cloud_id=user.cloud_id,
+            time_zone=user.time_zone
         )
-        return service
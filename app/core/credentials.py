@@ -0,0 +1,65 @@
+"""Credential providers for Jira clients."""
+
+import threading
+from typing import Optional
+
+from fastapi import Request
+
+from app.domain.interfaces import ICredentialProvider
+from app.core.auth import refresh_access_token
+from app.core.exceptions import AuthenticationError
+from app.core.logging import get_logger
+from app.core.session import get_refresh_token, set_tokens
+
+logger = get_logger(__name__)
+
+
+class StaticCredentials(ICredentialProvider):
+    """A fixed access token that is never refreshed."""
+
+    def __init__(self, access_token: str):
+        self._access_token = access_token
+
+    def get_access_token(self) -> str:
+        return self._access_token
+
+    def refresh(self, rejected_token: str) -> Optional[str]:
+        return None
+
+
+class SessionCredentials(ICredentialProvider):
+    """The access token of a browser session, refreshed with the session's refresh token.
+
+    Clients sharing the provider refresh at most once per rejected token:
+    calls rejected with a token that has already been replaced are retried
+    with the replacement. New tokens are stored in the session cookies of
+    ``request``; if the response has already been sent, the next request
+    picks them up from the auth layer's refreshed-token cache instead.
+    """
+
+    def __init__(self, request: Request, access_token: str):
+        self._request = request
+        self._access_token = access_token
+        self._lock = threading.Lock()
+
+    def get_access_token(self) -> str:
+        return self._access_token
+
+    def refresh(self, rejected_token: str) -> Optional[str]:
+        with self._lock:
+            if self._access_token != rejected_token:
+                return self._access_token
+
+            refresh_token = get_refresh_token(self._request)
+            if not refresh_token:
+                return None
+            try:
+                tokens = refresh_access_token(refresh_token)
+            except AuthenticationError as e:
+                logger.warning("Token refresh after a rejected Jira call failed", exc_info=e)
+                return None
+
+            set_tokens(self._request, tokens)
+            self._access_token = tokens["access_token"]
+            logger.info("Access token refreshed after Jira rejected it")
+            return self._access_token
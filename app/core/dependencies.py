@@ -1,25 +1,45 @@
+import time
 from fastapi import Depends, Request
 from fastapi.responses import RedirectResponse
 from typing import Optional, Union
 
 from app.core.session import (
     get_access_token,
+    get_token_expires_at,
     get_user_info,
     get_refresh_token,
-    set_session_data
+    set_session_data,
+    set_tokens
 )
-from app.core.auth import refresh_access_token, get_user_info as fetch_user_info
+from app.core.auth import (
+    get_cached_account_id,
+    refresh_access_token,
+    get_user_info as fetch_user_info
+)
+from app.core.config import TOKEN_REFRESH_LEEWAY_SECONDS
 from app.core.exceptions import AuthenticationError
 from app.core.constants import ROUTES
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class AuthenticatedUser:
-    def __init__(self, account_id: str, display_name: str, email: str, access_token: str, cloud_id: str = None):
+    def __init__(
+        self,
+        account_id: str,
+        display_name: str,
+        email: str,
+        access_token: str,
+        cloud_id: str = None,
+        time_zone: Optional[str] = None
+    ):
         self.account_id = account_id
         self.display_name = display_name
         self.email = email
         self.access_token = access_token
         self.cloud_id = cloud_id
+        self.time_zone = time_zone
 
 
 def get_current_user(request: Request) -> Union[AuthenticatedUser, RedirectResponse]:
@@ -30,6 +50,7 @@ def get_current_user(request: Request) -> Union[AuthenticatedUser, RedirectRespo
             return RedirectResponse(url=ROUTES["AUTH_LOGIN"], status_code=302)
         raise AuthenticationError("Not authenticated")
     
+    access_token = _refresh_ahead_of_expiry(request, access_token)
     user_info = get_user_info(request)
     
     if not user_info:
@@ -40,10 +61,40 @@ def get_current_user(request: Request) -> Union[AuthenticatedUser, RedirectRespo
         display_name=user_info.get("displayName", ""),
         email=user_info.get("emailAddress", ""),
         access_token=access_token,
-        cloud_id=user_info.get("cloudId")
+        cloud_id=user_info.get("cloudId"),
+        time_zone=user_info.get("timeZone")
     )
 
 
+def _refresh_ahead_of_expiry(request: Request, access_token: str) -> str:
+    """Return the access token to use, swapping in a refreshed one near expiry.
+
+    Within ``TOKEN_REFRESH_LEEWAY_SECONDS`` of expiry the tokens are refreshed
+    before the request goes on, and the new ones stored in this request's
+    session cookies. Refresh tokens may be rotated, so the cookie must get
+    the new refresh token in the same response that used up the old one.
+    Concurrent requests with the same refresh token share one refresh.
+    """
+    expires_at = get_token_expires_at(request)
+    refresh_token = get_refresh_token(request)
+    if expires_at is None or not refresh_token:
+        return access_token
+
+    remaining = expires_at - time.time()
+    if remaining > TOKEN_REFRESH_LEEWAY_SECONDS:
+        return access_token
+
+    try:
+        tokens = refresh_access_token(refresh_token)
+    except AuthenticationError as e:
+        # Let the request try the current token; a 401 takes the usual refresh path.
+        logger.warning("Token refresh ahead of expiry failed", exc_info=e)
+        return access_token
+
+    set_tokens(request, tokens)
+    return tokens["access_token"]
+
+
 def _fetch_or_refresh_user_info(request: Request, access_token: str) -> dict:
     try:
         user_info = fetch_user_info(access_token)
@@ -56,10 +107,12 @@ def _fetch_or_refresh_user_info(request: Request, access_token: str) -> dict:
         
         try:
             new_tokens = refresh_access_token(refresh_token)
-            set_session_data(request, "access_token", new_tokens["access_token"])
-            if "refresh_token" in new_tokens:
-                set_session_data(request, "refresh_token", new_tokens["refresh_token"])
-            user_info = fetch_user_info(new_tokens["access_token"])
+            set_tokens(request, new_tokens)
+            # The refreshed token belongs to the same account, whose site may already be known.
+            user_info = fetch_user_info(
+                new_tokens["access_token"],
+                account_id=get_cached_account_id(access_token)
+            )
             set_session_data(request, "user_info", user_info)
             return user_info
         except Exception:
@@ -0,0 +1,119 @@
+"""Background jobs whose outcome clients poll for or wait on."""
+
+import asyncio
+import secrets
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from app.core.cache import TTLCache
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+JOB_RUNNING = "running"
+JOB_COMPLETE = "complete"
+JOB_FAILED = "failed"
+
+
+class Job:
+    """A background job.
+
+    ``progress`` is free-form, JSON-ready state the job updates as it runs;
+    ``result`` is set once it completes.
+    """
+    __slots__ = ("id", "owner", "status", "progress", "result", "error", "finished")
+
+    def __init__(self, id: str, owner: Hashable, progress: Optional[Dict[str, Any]] = None):
+        self.id = id
+        self.owner = owner
+        self.status = JOB_RUNNING
+        self.progress = progress if progress is not None else {}
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.finished = asyncio.Event()
+
+    @property
+    def done(self) -> bool:
+        return self.status != JOB_RUNNING
+
+
+class JobRegistry:
+    """Runs jobs as tasks on the event loop and keeps them for polling.
+
+    Jobs are found by their unguessable ID together with their owner, so one
+    user cannot read another's job. Finished and running jobs alike are
+    dropped ``ttl_seconds`` after they started, or earlier once more than
+    ``max_entries`` exist.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._jobs = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._tasks: Dict[str, "asyncio.Task[None]"] = {}
+        self._started = 0
+        self._completed = 0
+        self._failed = 0
+
+    def start(
+        self,
+        owner: Hashable,
+        run: Callable[[Job], Awaitable[Any]],
+        progress: Optional[Dict[str, Any]] = None
+    ) -> Job:
+        """Start ``run(job)`` in the background; must be called from a running event loop."""
+        job = Job(id=secrets.token_urlsafe(16), owner=owner, progress=progress or {})
+        self._jobs.set(job.id, job)
+        task = asyncio.create_task(self._run(job, run))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+        self._started += 1
+        return job
+
+    def get(self, job_id: str, owner: Hashable) -> Optional[Job]:
+        """Return the job with ``job_id`` if it exists and belongs to ``owner``."""
+        job = self._jobs.get(job_id)
+        if job is None or job.owner != owner:
+            return None
+        return job
+
+    async def wait(self, job: Job, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for ``job`` to finish; return whether it has."""
+        if not job.done and timeout > 0:
+            try:
+                await asyncio.wait_for(job.finished.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return job.done
+
+    async def aclose(self) -> None:
+        """Cancel jobs still running; called on application shutdown."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the job counters."""
+        return {
+            "running": len(self._tasks),
+            "started": self._started,
+            "completed": self._completed,
+            "failed": self._failed,
+            "retained": self._jobs.stats()["size"]
+        }
+
+    async def _run(self, job: Job, run: Callable[[Job], Awaitable[Any]]) -> None:
+        try:
+            job.result = await run(job)
+            job.status = JOB_COMPLETE
+            self._completed += 1
+        except asyncio.CancelledError:
+            job.status = JOB_FAILED
+            job.error = "Cancelled"
+            self._failed += 1
+            raise
+        except Exception as e:
+            job.status = JOB_FAILED
+            job.error = str(e)
+            self._failed += 1
+            logger.warning("Background job failed", extra={"job_id": job.id}, exc_info=e)
+        finally:
+            job.finished.set()
@@ -55,9 +55,14 @@ class StructuredLogger:
         """Log info message."""
         self._log(logging.INFO, message, extra)
     
-    def warning(self, message: str, extra: Optional[Dict[str, Any]] = None):
+    def warning(
+        self,
+        message: str,
+        extra: Optional[Dict[str, Any]] = None,
+        exc_info: Optional[Exception] = None
+    ):
         """Log warning message."""
-        self._log(logging.WARNING, message, extra)
+        self._log(logging.WARNING, message, extra, exc_info)
     
     def error(
         self,
@@ -0,0 +1,89 @@
+"""An event loop on a background thread, for calling async code from blocking code."""
+
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Awaitable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop_thread = None
+_loop_thread_lock = threading.Lock()
+
+
+def get_loop_thread() -> "LoopThread":
+    """Return the process-wide loop thread behind the blocking worklog stack."""
+    global _loop_thread
+    with _loop_thread_lock:
+        if _loop_thread is None:
+            _loop_thread = LoopThread()
+        return _loop_thread
+
+
+class LoopThread:
+    """Runs coroutines on an event loop of its own, on a daemon thread.
+
+    The loop starts on first use and runs until ``close``. State bound to an
+    event loop (an ``httpx.AsyncClient``'s connections, an
+    ``AsyncSingleFlight``) may be shared by blocking callers only if they all
+    go through the same ``LoopThread``.
+
+    ``run`` must not be called from the loop's own thread, which would wait
+    on itself; it raises ``RuntimeError`` instead.
+    """
+
+    def __init__(self, name: str = "blocking-worklogs"):
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def run(self, awaitable: Awaitable[T]) -> T:
+        """Run ``awaitable`` on the loop and block until it finishes."""
+        loop = self._get_loop()
+        if threading.current_thread() is self._thread:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise RuntimeError("LoopThread.run called from its own event loop")
+        return asyncio.run_coroutine_threadsafe(_await(awaitable), loop).result()
+
+    def iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        """Iterate ``iterator`` on the loop, one item per blocking step.
+
+        An async generator left unfinished is closed on the loop when the
+        returned iterator is closed or garbage collected.
+        """
+        try:
+            while True:
+                try:
+                    yield self.run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                self.run(aclose())
+
+    def close(self) -> None:
+        """Stop the loop and wait for its thread; a later ``run`` starts a new one."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name=self._name, daemon=True)
+                self._thread.start()
+            return self._loop
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    # run_coroutine_threadsafe only takes coroutines, not other awaitables
+    # such as the ones an async generator's __anext__ returns.
+    return await awaitable
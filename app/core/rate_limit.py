@@ -0,0 +1,329 @@
+"""Adaptive, fair rate limiting for outbound Jira traffic."""
+
+import asyncio
+import hashlib
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Mapping, Optional
+
+from app.core.config import (
+    JIRA_RATE_LIMIT_PER_SECOND,
+    JIRA_RATE_LIMIT_BURST,
+    JIRA_RATE_LIMIT_MIN_PER_SECOND
+)
+from app.core.constants import JIRA_MAX_RETRIES, JIRA_RETRY_BACKOFF_SECONDS, JIRA_RETRY_STATUSES
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+THROTTLE_PENALTY_SECONDS = 1.0
+THROTTLE_RATE_FACTOR = 0.5
+NEAR_LIMIT_RATE_FACTOR = 0.8
+NEAR_LIMIT_FRACTION = 0.1
+RECOVERY_STEP_FRACTION = 0.01
+
+_rate_limiter = None
+
+
+def get_rate_limiter() -> "RateLimiter":
+    """Return the process-wide limiter shared by all Jira traffic."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(
+            rate=JIRA_RATE_LIMIT_PER_SECOND,
+            burst=JIRA_RATE_LIMIT_BURST,
+            min_rate=JIRA_RATE_LIMIT_MIN_PER_SECOND
+        )
+    return _rate_limiter
+
+
+def client_key(access_token: Optional[str]) -> str:
+    """Return a stable, non-reversible queueing key for the holder of ``access_token``."""
+    return hashlib.sha256((access_token or "").encode()).hexdigest()[:16]
+
+
+def retry_backoff(attempt: int, base: float = JIRA_RETRY_BACKOFF_SECONDS) -> float:
+    """Return a full-jitter exponential delay, so concurrent retries spread out."""
+    return random.uniform(0, base * 2 ** attempt)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """Return seconds until an ISO 8601 ``X-RateLimit-Reset`` timestamp."""
+    if not value:
+        return None
+    try:
+        reset = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    if reset.tzinfo is None:
+        reset = reset.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset - datetime.now(timezone.utc)).total_seconds())
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class _Waiter:
+    __slots__ = ("key", "granted", "event", "loop", "future")
+
+    def __init__(self, key: Hashable, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.key = key
+        self.granted = False
+        self.loop = loop
+        self.event = None if loop else threading.Event()
+        self.future = loop.create_future() if loop else None
+
+    def notify(self) -> None:
+        if self.loop is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self) -> None:
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class RateLimiter:
+    """Token bucket shared by every Jira request made by this process.
+
+    Requests take one token each; tokens refill at the current rate up to
+    ``burst``. Callers that find the bucket empty queue per client key and
+    are served round-robin, so one user's large fetch cannot starve another's.
+
+    The rate adapts to Jira's responses: a 429 (or a 503 with ``Retry-After``)
+    pauses all traffic for the advertised time and halves the rate, and
+    ``X-RateLimit-*`` headers reporting a nearly exhausted budget slow it
+    further. Successful responses raise it again gradually, up to ``rate``.
+    Both threads and asyncio tasks may wait on the same limiter. A ``rate``
+    of 0 disables limiting.
+    """
+
+    def __init__(self, rate: float, burst: int, min_rate: float = 1.0):
+        self._max_rate = rate
+        self._min_rate = min(max(min_rate, 0.1), rate)
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._queues: "OrderedDict[Hashable, Deque[_Waiter]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._granted = 0
+        self._queued_total = 0
+        self._throttled = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_rate > 0
+
+    def acquire(self, key: Hashable) -> None:
+        """Block the calling thread until a request for ``key`` may be sent."""
+        if not self.enabled:
+            return
+        waiter = _Waiter(key)
+        with self._lock:
+            if self._take_or_enqueue(waiter, time.monotonic()):
+                return
+        try:
+            while True:
+                with self._lock:
+                    delay = self._dispatch(time.monotonic())
+                    if waiter.granted:
+                        return
+                waiter.event.wait(delay)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    async def acquire_async(self, key: Hashable) -> None:
+        """Wait, without blocking the event loop, until a request for ``key`` may be sent."""
+        if not self.enabled:
+            return
+        waiter = _Waiter(key, asyncio.get_running_loop())
+        with self._lock:
+            if self._take_or_enqueue(waiter, time.monotonic()):
+                return
+        try:
+            while True:
+                with self._lock:
+                    delay = self._dispatch(time.monotonic())
+                    if waiter.granted:
+                        return
+                await asyncio.wait({waiter.future}, timeout=delay)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adapt the rate to a Jira response's status and rate limit headers."""
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        with self._lock:
+            if status_code == 429 or (status_code == 503 and retry_after is not None):
+                self._throttled += 1
+                # Concurrent requests rejected in one burst slow the rate down once, not once each.
+                if now >= self._paused_until:
+                    self._set_rate(self._rate * THROTTLE_RATE_FACTOR)
+                self._pause(now + (retry_after if retry_after is not None else THROTTLE_PENALTY_SECONDS))
+                logger.warning(
+                    "Jira rate limit hit, pausing requests",
+                    extra={
+                        "status_code": status_code,
+                        "pause_seconds": round(self._paused_until - now, 3),
+                        "rate": round(self._rate, 2)
+                    }
+                )
+                return
+
+            remaining = _parse_int(headers.get("X-RateLimit-Remaining"))
+            limit = _parse_int(headers.get("X-RateLimit-Limit"))
+            if remaining == 0:
+                reset_in = _parse_reset(headers.get("X-RateLimit-Reset"))
+                if reset_in:
+                    self._pause(now + reset_in)
+
+            near_limit = (
+                headers.get("X-RateLimit-NearLimit", "").lower() == "true"
+                or (remaining is not None and limit and remaining <= limit * NEAR_LIMIT_FRACTION)
+            )
+            if near_limit:
+                self._set_rate(self._rate * NEAR_LIMIT_RATE_FACTOR)
+            elif 200 <= status_code < 300 and self._rate < self._max_rate:
+                self._set_rate(self._rate + self._max_rate * RECOVERY_STEP_FRACTION)
+
+    def send(self, key: Hashable, request: Callable[[], Any]) -> Any:
+        """Send ``request()`` through the limiter, retrying throttled and 5xx responses.
+
+        ``request`` must return a ``requests``-style response. Rate limited
+        responses are retried once the limiter's pause ends; other retryable
+        statuses after a jittered backoff. The last response is returned.
+        """
+        for attempt in range(JIRA_MAX_RETRIES + 1):
+            self.acquire(key)
+            response = request()
+            self.observe(response.status_code, response.headers)
+            if response.status_code not in JIRA_RETRY_STATUSES or attempt == JIRA_MAX_RETRIES:
+                return response
+            response.close()
+            if not self._is_throttle(response):
+                time.sleep(retry_backoff(attempt))
+
+    async def send_async(self, key: Hashable, request: Callable[[], Awaitable[Any]]) -> Any:
+        """Async counterpart of ``send`` for ``httpx`` responses."""
+        for attempt in range(JIRA_MAX_RETRIES + 1):
+            await self.acquire_async(key)
+            response = await request()
+            self.observe(response.status_code, response.headers)
+            if response.status_code not in JIRA_RETRY_STATUSES or attempt == JIRA_MAX_RETRIES:
+                return response
+            await response.aclose()
+            if not self._is_throttle(response):
+                await asyncio.sleep(retry_backoff(attempt))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the current budget and counters."""
+        now = time.monotonic()
+        with self._lock:
+            self._refill(now)
+            return {
+                "enabled": self.enabled,
+                "rate": round(self._rate, 3),
+                "maxRate": self._max_rate,
+                "burst": self._burst,
+                "tokens": round(self._tokens, 3),
+                "queued": sum(len(queue) for queue in self._queues.values()),
+                "queuedClients": len(self._queues),
+                "pausedForSeconds": round(max(0.0, self._paused_until - now), 3),
+                "granted": self._granted,
+                "queuedTotal": self._queued_total,
+                "throttled": self._throttled
+            }
+
+    @staticmethod
+    def _is_throttle(response: Any) -> bool:
+        return response.status_code == 429 or (
+            response.status_code == 503 and response.headers.get("Retry-After") is not None
+        )
+
+    def _take_or_enqueue(self, waiter: _Waiter, now: float) -> bool:
+        """Take a token immediately if nobody is queued, otherwise queue ``waiter``."""
+        self._refill(now)
+        if not self._queues and now >= self._paused_until and self._tokens >= 1:
+            self._tokens -= 1
+            self._granted += 1
+            return True
+        self._queues.setdefault(waiter.key, deque()).append(waiter)
+        self._queued_total += 1
+        return False
+
+    def _dispatch(self, now: float) -> float:
+        """Grant available tokens round-robin across keys; return seconds until the next grant."""
+        self._refill(now)
+        if now < self._paused_until:
+            return self._paused_until - now
+
+        while self._tokens >= 1 and self._queues:
+            key, queue = next(iter(self._queues.items()))
+            waiter = queue.popleft()
+            if queue:
+                self._queues.move_to_end(key)
+            else:
+                del self._queues[key]
+            waiter.granted = True
+            self._tokens -= 1
+            self._granted += 1
+            waiter.notify()
+        return max(0.001, (1 - self._tokens) / self._rate)
+
+    def _refill(self, now: float) -> None:
+        # No tokens accrue during a pause, so traffic resumes at the rate, not as a burst.
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(self._burst, self._tokens + (now - start) * self._rate)
+        self._updated = max(self._updated, now)
+
+    def _pause(self, until: float) -> None:
+        if until > self._paused_until:
+            self._paused_until = until
+            self._tokens = 0.0
+
+    def _set_rate(self, rate: float) -> None:
+        self._rate = min(self._max_rate, max(self._min_rate, rate))
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Withdraw an interrupted waiter, returning its token if it was already granted."""
+        with self._lock:
+            if waiter.granted:
+                self._tokens = min(self._burst, self._tokens + 1)
+                return
+            queue = self._queues.get(waiter.key)
+            if queue and waiter in queue:
+                queue.remove(waiter)
+                if not queue:
+                    del self._queues[waiter.key]
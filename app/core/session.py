@@ -2,11 +2,13 @@ from typing import Optional
 from fastapi import Request, Response
 import json
 import base64
+import time
 
 SESSION_ID_COOKIE = "session_id"
 ACCESS_TOKEN_COOKIE = "access_token"
 REFRESH_TOKEN_COOKIE = "refresh_token"
 USER_INFO_COOKIE = "user_info"
+TOKEN_EXPIRES_AT_COOKIE = "token_expires_at"
 SESSION_MAX_AGE = 86400 * 7
 
 
@@ -21,11 +23,17 @@ def _decode_cookie_value(value: str) -> str:
         return ""
 
 
+def _get_token_cookie(request: Request, name: str) -> Optional[str]:
+    # Tokens replaced earlier in this request win over the ones the browser sent.
+    pending = getattr(request.state, "session_cookies", None) or {}
+    return pending.get(name) or request.cookies.get(name)
+
+
 def get_session_data(request: Request, key: str = None):
     if key == "access_token":
-        return request.cookies.get(ACCESS_TOKEN_COOKIE)
+        return _get_token_cookie(request, ACCESS_TOKEN_COOKIE)
     elif key == "refresh_token":
-        return request.cookies.get(REFRESH_TOKEN_COOKIE)
+        return _get_token_cookie(request, REFRESH_TOKEN_COOKIE)
     elif key == "user_info":
         user_info_str = request.cookies.get(USER_INFO_COOKIE)
         if user_info_str:
@@ -35,13 +43,19 @@ def get_session_data(request: Request, key: str = None):
             except Exception:
                 return None
         return None
+    elif key == "token_expires_at":
+        try:
+            return float(request.cookies[TOKEN_EXPIRES_AT_COOKIE])
+        except (KeyError, ValueError):
+            return None
     elif key == "oauth_state":
         return request.cookies.get("oauth_state")
     elif key is None:
         return {
-            "access_token": request.cookies.get(ACCESS_TOKEN_COOKIE),
-            "refresh_token": request.cookies.get(REFRESH_TOKEN_COOKIE),
+            "access_token": _get_token_cookie(request, ACCESS_TOKEN_COOKIE),
+            "refresh_token": _get_token_cookie(request, REFRESH_TOKEN_COOKIE),
             "user_info": get_session_data(request, "user_info"),
+            "token_expires_at": get_session_data(request, "token_expires_at"),
             "oauth_state": request.cookies.get("oauth_state")
         }
     return None
@@ -59,6 +73,8 @@ def set_session_data(request: Request, key: str, value):
         user_info_json = json.dumps(value)
         encoded = _encode_cookie_value(user_info_json)
         request.state.session_cookies[USER_INFO_COOKIE] = encoded
+    elif key == "token_expires_at":
+        request.state.session_cookies[TOKEN_EXPIRES_AT_COOKIE] = None if value is None else str(int(value))
     elif key == "oauth_state":
         request.state.session_cookies["oauth_state"] = value
     else:
@@ -75,6 +91,7 @@ def clear_session(request: Request):
         ACCESS_TOKEN_COOKIE,
         REFRESH_TOKEN_COOKIE,
         USER_INFO_COOKIE,
+        TOKEN_EXPIRES_AT_COOKIE,
         "oauth_state"
     ])
 
@@ -95,6 +112,25 @@ def set_refresh_token(request: Request, token: str):
     set_session_data(request, "refresh_token", token)
 
 
+def get_token_expires_at(request: Request) -> Optional[float]:
+    """Return when the access token expires, as a Unix timestamp, if known."""
+    return get_session_data(request, "token_expires_at")
+
+
+def set_tokens(request: Request, tokens: dict):
+    """Store the tokens of an OAuth token response, and when the access token expires.
+
+    The expiry is taken from ``expires_at`` if set, else from ``expires_in``.
+    """
+    set_access_token(request, tokens["access_token"])
+    if tokens.get("refresh_token"):
+        set_refresh_token(request, tokens["refresh_token"])
+    expires_at = tokens.get("expires_at")
+    if expires_at is None and tokens.get("expires_in"):
+        expires_at = time.time() + float(tokens["expires_in"])
+    set_session_data(request, "token_expires_at", expires_at)
+
+
 def get_user_info(request: Request) -> Optional[dict]:
     return get_session_data(request, "user_info")
 
@@ -0,0 +1,104 @@
+"""Coalescing of identical concurrent calls ("single-flight")."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers share its outcome.
+
+    The first caller for a key runs the function in its own thread. Callers
+    arriving while it runs block until it finishes and receive the same
+    result object, or the same exception. Results are shared, not copied, so
+    callers must not mutate them.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._started = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Return ``func()``, or the outcome of the in-flight call for ``key``."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+                self._started += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            return call.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of in-flight calls and counters."""
+        with self._lock:
+            return {"inFlight": len(self._calls), "started": self._started, "coalesced": self._coalesced}
+
+
+class AsyncSingleFlight:
+    """Async counterpart of ``SingleFlight`` for coroutines on one event loop.
+
+    The shared call runs as its own task, so a caller being cancelled (for
+    example on client disconnect) does not fail the others; the task is only
+    cancelled once every caller waiting on it has gone.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "_AsyncCall"] = {}
+        self._started = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Return ``await func()``, or the outcome of the in-flight call for ``key``."""
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = _AsyncCall(asyncio.ensure_future(func()))
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            self._started += 1
+        else:
+            self._coalesced += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+                self._forget(key, call)
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of in-flight calls and counters."""
+        return {"inFlight": len(self._calls), "started": self._started, "coalesced": self._coalesced}
+
+    def _forget(self, key: Hashable, call: "_AsyncCall") -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+
+class _AsyncCall:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Any]"):
+        self.task = task
+        self.waiters = 0
@@ -0,0 +1,52 @@
+"""Shared Jinja2 template environment."""
+
+from pathlib import Path
+from typing import Optional
+
+import jinja2
+from fastapi.templating import Jinja2Templates
+
+from app.core.config import TEMPLATE_AUTO_RELOAD, TEMPLATE_CACHE_PATH
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[2] / "templates"
+
+
+def _create_bytecode_cache(path: Optional[str]) -> Optional[jinja2.BytecodeCache]:
+    """Return an on-disk bytecode cache at ``path``, or None when disabled or unusable."""
+    if not path:
+        return None
+    try:
+        Path(path).mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning("Template bytecode cache disabled", extra={"path": path}, exc_info=e)
+        return None
+    return jinja2.FileSystemBytecodeCache(path)
+
+
+_environment = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(str(TEMPLATES_DIR)),
+    autoescape=True,
+    auto_reload=TEMPLATE_AUTO_RELOAD,
+    bytecode_cache=_create_bytecode_cache(TEMPLATE_CACHE_PATH)
+)
+_templates = Jinja2Templates(env=_environment)
+
+
+def get_templates() -> Jinja2Templates:
+    """Return the process-wide templates, sharing one environment and its compiled templates."""
+    return _templates
+
+
+def warm_up_templates() -> int:
+    """Compile every template ahead of the first request; returns how many were loaded.
+
+    Templates whose bytecode is already in the on-disk cache are loaded from
+    it instead of being compiled again, so restarts stay cheap too.
+    """
+    names = _environment.list_templates(extensions=["html"])
+    for name in names:
+        _environment.get_template(name)
+    return len(names)
@@ -1,6 +1,6 @@
 """Validation utilities."""
 
-from typing import Any, Optional
+from typing import Any, List, Optional
 from datetime import datetime
 from app.core.exceptions import ValidationError
 
@@ -41,3 +41,21 @@ def validate_not_empty(value: Any, field_name: str) -> None:
             message=f"{field_name} cannot be empty",
             details={"field": field_name}
         )
+
+
+def validate_team_selection(
+    account_ids: Optional[List[str]],
+    group_name: Optional[str],
+    max_accounts: int
+) -> None:
+    """Validate that a team is given as either account IDs or a group, not both."""
+    if bool(account_ids) == bool(group_name and group_name.strip()):
+        raise ValidationError(
+            message="Provide either accountIds or group",
+            details={"accountIds": account_ids, "group": group_name}
+        )
+    if account_ids and len(set(account_ids)) > max_accounts:
+        raise ValidationError(
+            message=f"accountIds cannot list more than {max_accounts} accounts",
+            details={"account_count": len(set(account_ids))}
+        )
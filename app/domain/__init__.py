@@ -3,15 +3,25 @@
 from app.domain.interfaces import (
     IJiraClient,
     IWorklogRepository,
-    IWorklogService
+    IWorklogService,
+    IAsyncJiraClient,
+    IAsyncWorklogRepository,
+    IAsyncWorklogService
 )
 from app.domain.services.worklog_service import WorklogService
+from app.domain.services.async_worklog_service import AsyncWorklogService
 from app.domain.repositories.worklog_repository import WorklogRepository
+from app.domain.repositories.async_worklog_repository import AsyncWorklogRepository
 
 __all__ = [
     "IJiraClient",
     "IWorklogRepository",
     "IWorklogService",
+    "IAsyncJiraClient",
+    "IAsyncWorklogRepository",
+    "IAsyncWorklogService",
     "WorklogService",
+    "AsyncWorklogService",
     "WorklogRepository",
+    "AsyncWorklogRepository",
 ]
@@ -0,0 +1,181 @@
+"""Columnar group-by aggregation over worklog summaries."""
+
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, List, Sequence, Tuple
+
+from app.core.exceptions import ValidationError
+from app.models.summary import Author, IssueRecord, WorklogSummary
+from app.utils.helpers import format_seconds
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure Python path gives the same results.
+    np = None
+
+DIMENSIONS = ("day", "week", "month", "issue", "project", "author", "status")
+
+
+def validate_dimensions(dimensions: Sequence[str]) -> None:
+    """Validate that ``dimensions`` are distinct, known group-by dimensions."""
+    if any(dimension not in DIMENSIONS for dimension in dimensions) or len(set(dimensions)) != len(dimensions):
+        raise ValidationError(
+            message=f"groupBy must list distinct dimensions out of: {', '.join(DIMENSIONS)}",
+            details={"groupBy": list(dimensions)}
+        )
+
+
+class WorklogColumns:
+    """The worklogs of a summary as parallel columns, for group-by rollups.
+
+    Every worklog is one row holding the index of its day, issue and author
+    in the label tables and its time spent. Week and month are looked up per
+    day, project and status per issue, so grouping by any combination of
+    dimensions is a single pass over the rows. That pass is vectorized with
+    NumPy when it is installed and a dictionary fold otherwise.
+    """
+
+    def __init__(
+        self,
+        days: Sequence[date],
+        issues: Sequence[IssueRecord],
+        authors: Sequence[Author],
+        day_column: Sequence[int],
+        issue_column: Sequence[int],
+        author_column: Sequence[int],
+        seconds_column: Sequence[int]
+    ):
+        self._days = list(days)
+        self._issues = list(issues)
+        self._authors = list(authors)
+        self._day_column = _column(day_column)
+        self._issue_column = _column(issue_column)
+        self._author_column = _column(author_column)
+        self._seconds_column = _column(seconds_column)
+
+    @classmethod
+    def from_summary(cls, summary: WorklogSummary) -> "WorklogColumns":
+        """Load a summary's worklogs into columns; days stay in date order."""
+        days: List[date] = []
+        issue_index: Dict[str, int] = {}
+        issues: List[IssueRecord] = []
+        author_index: Dict[Author, int] = {}
+        authors: List[Author] = []
+        day_column, issue_column, author_column, seconds_column = [], [], [], []
+
+        for day in summary.days:
+            day_code = len(days)
+            days.append(date.fromisoformat(day.work_date))
+            for issue_day in day.issues.values():
+                issue_code = issue_index.get(issue_day.issue.key)
+                if issue_code is None:
+                    issue_code = issue_index[issue_day.issue.key] = len(issues)
+                    issues.append(issue_day.issue)
+                for worklog in issue_day.worklogs:
+                    author_code = author_index.get(worklog.author)
+                    if author_code is None:
+                        author_code = author_index[worklog.author] = len(authors)
+                        authors.append(worklog.author)
+                    day_column.append(day_code)
+                    issue_column.append(issue_code)
+                    author_column.append(author_code)
+                    seconds_column.append(worklog.seconds)
+
+        return cls(days, issues, authors, day_column, issue_column, author_column, seconds_column)
+
+    def __len__(self) -> int:
+        return len(self._seconds_column)
+
+    def group_by(self, *dimensions: str) -> List[Dict[str, Any]]:
+        """Sum time spent per distinct combination of ``dimensions``.
+
+        Rows are ordered by the dimensions in the given order: days, weeks
+        and months chronologically, everything else in first-seen order.
+        Without dimensions the result is a single grand total row.
+        """
+        validate_dimensions(dimensions)
+        if not len(self):
+            return []
+
+        codes, labels = zip(*(self._codes(dimension) for dimension in dimensions)) if dimensions else ((), ())
+        cardinalities = [len(dimension_labels) for dimension_labels in labels]
+        totals = _sum_numpy(codes, cardinalities, self._seconds_column) if np is not None \
+            else _sum_python(codes, self._seconds_column)
+
+        rows = []
+        for key, seconds, count in totals:
+            row = {dimension: labels[i][key[i]] for i, dimension in enumerate(dimensions)}
+            row["totalTimeSpentSeconds"] = seconds
+            row["totalTimeSpentFormatted"] = format_seconds(seconds)
+            row["worklogCount"] = count
+            rows.append(row)
+        return rows
+
+    def _codes(self, dimension: str) -> Tuple[Sequence[int], List[Any]]:
+        """Return the code column of ``dimension`` and the label of each code."""
+        if dimension == "day":
+            return self._day_column, [day.isoformat() for day in self._days]
+        if dimension == "week":
+            return self._lookup(self._day_column, self._days, _iso_week)
+        if dimension == "month":
+            return self._lookup(self._day_column, self._days, lambda day: f"{day.year:04d}-{day.month:02d}")
+        if dimension == "issue":
+            return self._issue_column, [issue.key for issue in self._issues]
+        if dimension == "project":
+            return self._lookup(self._issue_column, self._issues, lambda issue: issue.project)
+        if dimension == "status":
+            return self._lookup(self._issue_column, self._issues, lambda issue: issue.status)
+        return self._author_column, [author.to_dict() for author in self._authors]
+
+    @staticmethod
+    def _lookup(
+        column: Sequence[int],
+        entries: Sequence[Any],
+        label: Callable[[Any], Hashable]
+    ) -> Tuple[Sequence[int], List[Hashable]]:
+        """Re-code ``column`` from entry indexes to indexes of the entries' distinct labels."""
+        label_index: Dict[Hashable, int] = {}
+        table = [label_index.setdefault(label(entry), len(label_index)) for entry in entries]
+        if np is not None:
+            return np.asarray(table, dtype=np.int64)[column], list(label_index)
+        return [table[code] for code in column], list(label_index)
+
+
+def _column(values: Sequence[int]) -> Sequence[int]:
+    return np.asarray(values, dtype=np.int64) if np is not None else list(values)
+
+
+def _iso_week(day: date) -> str:
+    year, week, _ = day.isocalendar()
+    return f"{year:04d}-W{week:02d}"
+
+
+def _sum_numpy(codes, cardinalities, seconds):
+    # Fold the code columns into one mixed-radix key, so one unique/bincount
+    # pass groups by all dimensions and sorts the groups lexicographically.
+    keys = np.zeros(len(seconds), dtype=np.int64)
+    for column, cardinality in zip(codes, cardinalities):
+        keys = keys * cardinality + column
+    groups, inverse = np.unique(keys, return_inverse=True)
+    sums = np.bincount(inverse, weights=seconds).astype(np.int64)
+    counts = np.bincount(inverse)
+
+    totals = []
+    for group, total, count in zip(groups.tolist(), sums.tolist(), counts.tolist()):
+        key = []
+        for cardinality in reversed(cardinalities):
+            group, code = divmod(group, cardinality)
+            key.append(code)
+        totals.append((key[::-1], total, count))
+    return totals
+
+
+def _sum_python(codes, seconds):
+    totals: Dict[tuple, List[int]] = {}
+    for key, spent in zip(zip(*codes) if codes else ((),) * len(seconds), seconds):
+        total = totals.get(key)
+        if total is None:
+            totals[key] = [spent, 1]
+        else:
+            total[0] += spent
+            total[1] += 1
+    return [(key, total[0], total[1]) for key, total in sorted(totals.items())]
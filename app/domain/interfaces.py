@@ -1,20 +1,83 @@
 """Domain interfaces and abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Iterator, NamedTuple, Optional, Tuple
+
+from app.models.summary import TeamSummary, WorklogSummary
+
+
+class ICredentialProvider(ABC):
+    """Interface for the source of the access token Jira clients authenticate with."""
+
+    @abstractmethod
+    def get_access_token(self) -> str:
+        """Return the access token to send."""
+        pass
+
+    @abstractmethod
+    def refresh(self, rejected_token: str) -> Optional[str]:
+        """Return a token to retry with after Jira rejected ``rejected_token``, or None if there is none."""
+        pass
 
 
 class IJiraClient(ABC):
     """Interface for Jira API client."""
 
     @abstractmethod
-    def search_issues(self, jql: str, fields: List[str], start_at: int = 0, max_results: int = 100) -> Dict[str, Any]:
-        """Search Jira issues using JQL."""
+    def search_issues(
+        self,
+        jql: str,
+        fields: List[str],
+        next_page_token: Optional[str] = None,
+        max_results: int = 100
+    ) -> Dict[str, Any]:
+        """Search Jira issues using JQL, returning a single page."""
+        pass
+
+    @abstractmethod
+    def iter_issues(self, jql: str, fields: List[str], page_size: int = 100) -> Iterator[List[Dict[str, Any]]]:
+        """Search Jira issues using JQL, yielding every page of results."""
+        pass
+
+    @abstractmethod
+    def get_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get all worklogs for a specific issue, optionally bounded by start time."""
+        pass
+
+    @abstractmethod
+    def iter_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None,
+        page_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of worklogs for a specific issue, optionally bounded by start time."""
+        pass
+
+    @abstractmethod
+    def iter_updated_worklogs(self, since: int) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of IDs of worklogs updated since an epoch-millisecond timestamp."""
+        pass
+
+    @abstractmethod
+    def iter_deleted_worklogs(self, since: int) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of IDs of worklogs deleted since an epoch-millisecond timestamp."""
         pass
 
     @abstractmethod
-    def get_issue_worklogs(self, issue_key: str) -> List[Dict[str, Any]]:
-        """Get worklogs for a specific issue."""
+    def get_worklogs_by_ids(self, worklog_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get full worklog records for the given worklog IDs."""
+        pass
+
+    @abstractmethod
+    def iter_group_members(self, group_name: str) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of the members of a Jira group."""
         pass
 
     @abstractmethod
@@ -23,6 +86,126 @@ class IJiraClient(ABC):
         pass
 
 
+class IAsyncJiraClient(ABC):
+    """Interface for a non-blocking Jira API client; mirrors ``IJiraClient``."""
+
+    @abstractmethod
+    async def search_issues(
+        self,
+        jql: str,
+        fields: List[str],
+        next_page_token: Optional[str] = None,
+        max_results: int = 100
+    ) -> Dict[str, Any]:
+        """Search Jira issues using JQL, returning a single page."""
+        pass
+
+    @abstractmethod
+    def iter_issues(self, jql: str, fields: List[str], page_size: int = 100) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Search Jira issues using JQL, yielding every page of results."""
+        pass
+
+    @abstractmethod
+    async def get_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get all worklogs for a specific issue, optionally bounded by start time."""
+        pass
+
+    @abstractmethod
+    def iter_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None,
+        page_size: int = 1000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of worklogs for a specific issue, optionally bounded by start time."""
+        pass
+
+    @abstractmethod
+    def iter_updated_worklogs(self, since: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of IDs of worklogs updated since an epoch-millisecond timestamp."""
+        pass
+
+    @abstractmethod
+    def iter_deleted_worklogs(self, since: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of IDs of worklogs deleted since an epoch-millisecond timestamp."""
+        pass
+
+    @abstractmethod
+    async def get_worklogs_by_ids(self, worklog_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get full worklog records for the given worklog IDs."""
+        pass
+
+    @abstractmethod
+    def iter_group_members(self, group_name: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of the members of a Jira group."""
+        pass
+
+    @abstractmethod
+    async def get_user_info(self, access_token: str) -> Dict[str, Any]:
+        """Get current user information."""
+        pass
+
+
+class Coverage(NamedTuple):
+    """A date range whose worklogs are held in a worklog store, and when it was last synced."""
+    range_start: str
+    range_end: str
+    synced_at: int
+
+
+class IWorklogStore(ABC):
+    """Interface for a persistent local store of an account's issues and worklogs."""
+
+    @abstractmethod
+    def find_coverage(self, cloud_id: str, account_id: str, start_date: str, end_date: str) -> Optional[Coverage]:
+        """Get the stored range containing the date range, if any."""
+        pass
+
+    @abstractmethod
+    def load(
+        self,
+        cloud_id: str,
+        account_id: str,
+        start_date: str,
+        end_date: str
+    ) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Get stored issues paired with their worklogs within the date range."""
+        pass
+
+    @abstractmethod
+    def replace_range(
+        self,
+        cloud_id: str,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        issue_worklogs: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]],
+        synced_at: int
+    ) -> None:
+        """Store a complete fetch of the date range."""
+        pass
+
+    @abstractmethod
+    def apply_sync(
+        self,
+        cloud_id: str,
+        account_id: str,
+        coverage: Coverage,
+        issues: List[Dict[str, Any]],
+        updated_worklogs: List[Dict[str, Any]],
+        deleted_worklog_ids: List[int],
+        synced_at: int
+    ) -> None:
+        """Apply an incremental sync to a stored range."""
+        pass
+
+
 class IWorklogRepository(ABC):
     """Interface for worklog data access."""
 
@@ -31,9 +214,25 @@ class IWorklogRepository(ABC):
         self,
         account_id: str,
         start_date: str,
-        end_date: str
-    ) -> List[Dict[str, Any]]:
-        """Retrieve worklogs for a user within a date range."""
+        end_date: str,
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None,
+        force_refresh: bool = False
+    ) -> WorklogSummary:
+        """Retrieve worklogs for a user within a date range, grouped by day and issue."""
+        pass
+
+    @abstractmethod
+    def get_team_worklogs_by_date_range(
+        self,
+        start_date: str,
+        end_date: str,
+        account_ids: Optional[List[str]] = None,
+        group_name: Optional[str] = None,
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None
+    ) -> TeamSummary:
+        """Retrieve worklogs of several accounts, or of a group's members, per member."""
         pass
 
 
@@ -45,7 +244,111 @@ class IWorklogService(ABC):
         self,
         account_id: str,
         start_date: str,
-        end_date: str
+        end_date: str,
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None,
+        force_refresh: bool = False
+    ) -> WorklogSummary:
+        """Get worklog summary; call ``to_dicts`` on it for the formatted response."""
+        pass
+
+    @abstractmethod
+    def get_worklog_rollup(
+        self,
+        group_by: List[str],
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None,
+        force_refresh: bool = False
     ) -> List[Dict[str, Any]]:
-        """Get formatted worklog summary."""
+        """Get time spent summed per combination of the ``group_by`` dimensions."""
+        pass
+
+    @abstractmethod
+    def get_team_summary(
+        self,
+        start_date: str,
+        end_date: str,
+        account_ids: Optional[List[str]] = None,
+        group_name: Optional[str] = None,
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None
+    ) -> TeamSummary:
+        """Get per-member worklog summaries for several accounts or a Jira group."""
+        pass
+
+
+class IAsyncWorklogRepository(ABC):
+    """Interface for non-blocking worklog data access."""
+
+    @abstractmethod
+    async def get_worklogs_by_date_range(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None,
+        force_refresh: bool = False
+    ) -> WorklogSummary:
+        """Retrieve worklogs for a user within a date range, grouped by day and issue."""
+        pass
+
+    @abstractmethod
+    async def get_team_worklogs_by_date_range(
+        self,
+        start_date: str,
+        end_date: str,
+        account_ids: Optional[List[str]] = None,
+        group_name: Optional[str] = None,
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None
+    ) -> TeamSummary:
+        """Retrieve worklogs of several accounts, or of a group's members, per member."""
+        pass
+
+
+class IAsyncWorklogService(ABC):
+    """Interface for non-blocking worklog business logic."""
+
+    @abstractmethod
+    async def get_worklog_summary(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None,
+        force_refresh: bool = False
+    ) -> WorklogSummary:
+        """Get worklog summary; call ``to_dicts`` on it for the formatted response."""
+        pass
+
+    @abstractmethod
+    async def get_worklog_rollup(
+        self,
+        group_by: List[str],
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None,
+        force_refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get time spent summed per combination of the ``group_by`` dimensions."""
+        pass
+
+    @abstractmethod
+    async def get_team_summary(
+        self,
+        start_date: str,
+        end_date: str,
+        account_ids: Optional[List[str]] = None,
+        group_name: Optional[str] = None,
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None
+    ) -> TeamSummary:
+        """Get per-member worklog summaries for several accounts or a Jira group."""
         pass
@@ -1,5 +1,6 @@
 """Repository implementations."""
 
 from app.domain.repositories.worklog_repository import WorklogRepository
+from app.domain.repositories.async_worklog_repository import AsyncWorklogRepository
 
-__all__ = ["WorklogRepository"]
+__all__ = ["WorklogRepository", "AsyncWorklogRepository"]
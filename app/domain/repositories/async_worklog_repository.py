@@ -0,0 +1,544 @@
+"""Async worklog repository implementation."""
+
+import asyncio
+import time
+from collections import deque
+from typing import List, Dict, Any, Awaitable, Callable, Optional, Set, TypeVar, Union
+
+from app.domain.interfaces import Coverage, IAsyncJiraClient, IAsyncWorklogRepository
+from app.domain.repositories.worklog_repository_base import (
+    ISSUE_FIELDS,
+    ISSUE_LOOKUP_FIELDS,
+    SYNC_OVERLAP_MS,
+    IssueWorklogs,
+    WorklogRepositoryBase,
+    WorklogWindow
+)
+from app.core.constants import JIRA_MAX_RESULTS, TEAM_SUMMARY_MAX_ACCOUNTS, WORKLOG_RETRY_BACKOFF_SECONDS
+from app.core.exceptions import ExternalServiceError, ValidationError
+from app.core.jobs import Job
+from app.core.rate_limit import retry_backoff
+from app.models.summary import TeamSummary, WorklogSummary
+from app.utils.helpers import build_worklog_jql, to_thread
+
+T = TypeVar("T")
+
+
+class AsyncWorklogRepository(WorklogRepositoryBase, IAsyncWorklogRepository):
+    """Non-blocking repository for worklog data access.
+
+    Jira requests run as tasks on an ``IAsyncJiraClient``, at most
+    ``max_workers`` at a time per call, and the blocking worklog store is
+    used from a worker thread.
+
+    With a job registry, issues whose worklogs fail or take longer than the
+    issue fetch timeout do not hold up the summary. It is returned without
+    them, listing them as failed, while a background job refetches them with
+    jittered backoff and builds the complete summary.
+    """
+
+    _jira_client: IAsyncJiraClient
+
+    async def get_worklogs_by_date_range(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None,
+        force_refresh: bool = False
+    ) -> WorklogSummary:
+        try:
+            if self._uses_store(account_id):
+                issue_worklogs = await self._load_from_store(account_id, start_date, end_date, force_refresh)
+                issue_worklogs = self._filter_issues(issue_worklogs, project_keys, issue_types)
+            else:
+                jql = build_worklog_jql(
+                    account_id,
+                    start_date,
+                    end_date,
+                    project_keys=project_keys,
+                    issue_types=issue_types
+                )
+                window = WorklogWindow.for_date_range([account_id], start_date, end_date)
+                issue_worklogs = await self._collect_issue_worklogs(jql, window, start_date, end_date)
+        except ExternalServiceError:
+            raise
+        except Exception as e:
+            self._handle_error(
+                error=e,
+                operation="get_worklogs_by_date_range",
+                context={
+                    "account_id": account_id,
+                    "start_date": start_date,
+                    "end_date": end_date
+                }
+            )
+
+        summary = self._summarize(issue_worklogs, account_id, start_date, end_date)
+        summary.retry_job_id = self._start_retry(
+            issue_worklogs,
+            WorklogWindow.for_date_range([account_id], start_date, end_date),
+            lambda retried: self._summarize(retried, account_id, start_date, end_date)
+        )
+        return summary
+
+    async def get_team_worklogs_by_date_range(
+        self,
+        start_date: str,
+        end_date: str,
+        account_ids: Optional[List[str]] = None,
+        group_name: Optional[str] = None,
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None
+    ) -> TeamSummary:
+        display_names: Dict[str, str] = {}
+        issue_worklogs: IssueWorklogs = []
+        try:
+            if group_name is not None:
+                display_names = await self._group_members(group_name)
+                account_ids = list(display_names)
+            if account_ids:
+                jql = self._team_jql(account_ids, group_name, start_date, end_date, project_keys, issue_types)
+                window = WorklogWindow.for_date_range(account_ids, start_date, end_date)
+                issue_worklogs = await self._collect_issue_worklogs(jql, window, start_date, end_date)
+        except (ExternalServiceError, ValidationError):
+            raise
+        except Exception as e:
+            self._handle_error(
+                error=e,
+                operation="get_team_worklogs_by_date_range",
+                context={
+                    "account_count": len(account_ids or ()),
+                    "group_name": group_name,
+                    "start_date": start_date,
+                    "end_date": end_date
+                }
+            )
+
+        account_ids = account_ids or []
+        team = self._summarize_team(issue_worklogs, account_ids, display_names, start_date, end_date)
+        team.retry_job_id = self._start_retry(
+            issue_worklogs,
+            WorklogWindow.for_date_range(account_ids, start_date, end_date),
+            lambda retried: self._summarize_team(retried, account_ids, display_names, start_date, end_date)
+        )
+        return team
+
+    def _start_retry(
+        self,
+        issue_worklogs: IssueWorklogs,
+        window: WorklogWindow,
+        summarize: Callable[[IssueWorklogs], Union[WorklogSummary, TeamSummary]]
+    ) -> Optional[str]:
+        """Start refetching the issues without worklogs in the background; return the job ID."""
+        if self._retry_jobs is None or self._retry_attempts == 0:
+            return None
+        failed = [issue["key"] for issue, worklogs in issue_worklogs if worklogs is None]
+        if not failed:
+            return None
+        job = self._retry_jobs.start(
+            (self._cloud_id, self._owner_account_id),
+            lambda job: self._retry_failed_issues(job, issue_worklogs, window, summarize),
+            progress={"issues": {key: {"status": "retrying", "attempts": 1} for key in failed}}
+        )
+        return job.id
+
+    async def _retry_failed_issues(
+        self,
+        job: Job,
+        issue_worklogs: IssueWorklogs,
+        window: WorklogWindow,
+        summarize: Callable[[IssueWorklogs], Union[WorklogSummary, TeamSummary]]
+    ) -> Union[WorklogSummary, TeamSummary]:
+        """Refetch the issues without worklogs, then summarize again.
+
+        Each issue is retried up to ``retry_attempts`` times, each after a
+        full-jitter exponential delay and bounded by the issue fetch timeout.
+        ``job.progress["issues"]`` holds each issue's status (retrying, fetched
+        or failed) and attempts so far, the original fetch included. Issues
+        still failing stay listed as failed.
+        """
+        issue_worklogs = list(issue_worklogs)
+        statuses = job.progress["issues"]
+        limiter = asyncio.Semaphore(self._max_workers)
+
+        async def retry(index: int) -> None:
+            issue = issue_worklogs[index][0]
+            status = statuses[issue["key"]]
+            for attempt in range(1, self._retry_attempts + 1):
+                await asyncio.sleep(retry_backoff(attempt, WORKLOG_RETRY_BACKOFF_SECONDS))
+                async with limiter:
+                    worklogs = await self._within_issue_timeout(issue["key"], self._retry_issue(issue, window))
+                status["attempts"] += 1
+                if worklogs is not None:
+                    issue_worklogs[index] = (issue, worklogs)
+                    status["status"] = "fetched"
+                    return
+            status["status"] = "failed"
+
+        await asyncio.gather(*(
+            retry(index) for index, (_, worklogs) in enumerate(issue_worklogs) if worklogs is None
+        ))
+        return summarize(issue_worklogs)
+
+    async def _retry_issue(self, issue: Dict[str, Any], window: WorklogWindow) -> Optional[List[Dict[str, Any]]]:
+        """Fetch a failed issue's worklogs, and its fields if their lookup failed too."""
+        if self._needs_fields(issue):
+            try:
+                await self._hydrate_issues([issue])
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to look up fields of issue {issue['key']}",
+                    extra={"issue_key": issue["key"]},
+                    exc_info=e
+                )
+                return None
+        return await self._fetch_worklogs_for_issue(issue["key"], window)
+
+    async def _group_members(self, group_name: str) -> Dict[str, str]:
+        """Return the display name of every member of a Jira group, by account ID.
+
+        Groups are held to the same ``TEAM_SUMMARY_MAX_ACCOUNTS`` as account
+        lists; the member walk stops with a ``ValidationError`` once a group
+        turns out to be larger.
+        """
+        members = {}
+        async for page in self._jira_client.iter_group_members(group_name):
+            for member in page:
+                members[member["accountId"]] = member.get("displayName", "Unknown")
+            if len(members) > TEAM_SUMMARY_MAX_ACCOUNTS:
+                raise ValidationError(
+                    message=f"group cannot have more than {TEAM_SUMMARY_MAX_ACCOUNTS} members",
+                    details={"group": group_name}
+                )
+        return members
+
+    async def _load_from_store(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        force_refresh: bool
+    ) -> IssueWorklogs:
+        """Serve the date range from the store, syncing it from Jira when needed.
+
+        Ranges the store has never seen are fetched in full and stored. Stored
+        ranges older than the cache max age, or any range when ``force_refresh``
+        is set, are brought up to date incrementally before being read back.
+        """
+        synced_at = int(time.time() * 1000)
+        coverage = await to_thread(self._store.find_coverage, self._cloud_id, account_id, start_date, end_date)
+
+        if coverage is None:
+            return await self._fetch_into_store(account_id, start_date, end_date, synced_at)
+
+        if self._needs_sync(coverage, synced_at, force_refresh):
+            try:
+                await self._sync_store(account_id, coverage, synced_at)
+            except ExternalServiceError as e:
+                if force_refresh:
+                    raise
+                self.logger.warning(
+                    "Worklog cache sync failed, serving stored data",
+                    extra={"account_id": account_id, "synced_at": coverage.synced_at},
+                    exc_info=e
+                )
+
+        return await to_thread(
+            self._store.load, self._cloud_id, account_id, *self._store_date_range(start_date, end_date)
+        )
+
+    async def _fetch_into_store(self, account_id: str, start_date: str, end_date: str, synced_at: int) -> IssueWorklogs:
+        """Fetch the account's worklogs for a date range and, if all were fetched, store them."""
+        jql = build_worklog_jql(account_id, start_date, end_date)
+        window = WorklogWindow.for_date_range([account_id], start_date, end_date)
+        issue_worklogs = await self._collect_issue_worklogs(jql, window, start_date, end_date)
+        if all(worklogs is not None for _, worklogs in issue_worklogs):
+            await to_thread(
+                self._store.replace_range,
+                self._cloud_id,
+                account_id,
+                start_date,
+                end_date,
+                issue_worklogs,
+                synced_at
+            )
+        return issue_worklogs
+
+    async def _sync_store(self, account_id: str, coverage: Coverage, synced_at: int) -> None:
+        """Apply Jira changes made since ``coverage`` was last synced.
+
+        Worklog changes come from the site-wide updated/deleted feeds, so their
+        cost grows with activity on the whole site. When the updated feed runs
+        past ``sync_max_pages`` pages, the stored range is refetched with the
+        account's own search instead. Otherwise issue metadata for the range
+        is re-read with a single search.
+        """
+        since = coverage.synced_at - SYNC_OVERLAP_MS
+        updated_worklogs = await self._fetch_updated_worklogs(account_id, since)
+        if updated_worklogs is None:
+            self.logger.info(
+                "Worklog feed too long to sync, refetching the cached range",
+                extra={"account_id": account_id, "max_pages": self._sync_max_pages}
+            )
+            issue_worklogs = await self._fetch_into_store(account_id, coverage.range_start, coverage.range_end, synced_at)
+            if any(worklogs is None for _, worklogs in issue_worklogs):
+                raise ExternalServiceError(
+                    message="Failed to refetch worklogs for the cached range",
+                    service_name="Jira API"
+                )
+            return
+
+        jql = build_worklog_jql(account_id, coverage.range_start, coverage.range_end)
+        issues = []
+        async for page in self._jira_client.iter_issues(jql=jql, fields=ISSUE_LOOKUP_FIELDS, page_size=JIRA_MAX_RESULTS):
+            await self._hydrate_issues(page)
+            issues.extend(page)
+
+        deleted_worklog_ids = []
+        async for page in self._jira_client.iter_deleted_worklogs(since):
+            deleted_worklog_ids.extend(entry["worklogId"] for entry in page)
+
+        await to_thread(
+            self._store.apply_sync,
+            self._cloud_id,
+            account_id,
+            coverage,
+            issues,
+            updated_worklogs,
+            deleted_worklog_ids,
+            synced_at
+        )
+
+    async def _fetch_updated_worklogs(self, account_id: str, since: int) -> Optional[List[Dict[str, Any]]]:
+        """Return the account's worklogs updated since ``since`` (epoch milliseconds).
+
+        Each feed page's worklogs are requested as soon as the page arrives, at
+        most ``max_workers`` pages at a time. Returns None once the feed runs
+        past ``sync_max_pages`` pages.
+        """
+        limiter = asyncio.Semaphore(self._max_workers)
+        updated_worklogs = []
+        in_flight = deque()
+
+        def merge(worklogs: List[Dict[str, Any]]) -> None:
+            updated_worklogs.extend(wl for wl in worklogs if wl.get("author", {}).get("accountId") == account_id)
+
+        try:
+            pages = 0
+            async for page in self._jira_client.iter_updated_worklogs(since):
+                pages += 1
+                if self._sync_max_pages and pages > self._sync_max_pages:
+                    return None
+                in_flight.append(asyncio.create_task(self._limited(
+                    limiter, self._jira_client.get_worklogs_by_ids, [entry["worklogId"] for entry in page]
+                )))
+                if len(in_flight) >= self._max_workers:
+                    merge(await in_flight.popleft())
+            while in_flight:
+                merge(await in_flight.popleft())
+        finally:
+            await self._cancel(in_flight)
+        return updated_worklogs
+
+    async def _collect_issue_worklogs(
+        self,
+        jql: str,
+        window: WorklogWindow,
+        start_date: str,
+        end_date: str
+    ) -> IssueWorklogs:
+        """Pair every issue matching ``jql`` with its worklogs by the authors in ``window``.
+
+        The search only returns each issue's ``updated`` timestamp; full fields
+        come from the issue cache or a follow-up lookup. Worklog fetches and
+        field lookups for a page of search results start as tasks, bounded by
+        a semaphore, as soon as the page arrives, so they overlap with the
+        request for the next page. When bulk fetching is enabled, wide date
+        ranges and issues beyond the per-issue limit are served by the bulk
+        worklog endpoints instead.
+        Pairs come back in search order; an issue whose worklogs could not be
+        fetched, or whose fields could not be looked up, is paired with ``None``.
+        """
+        limiter = asyncio.Semaphore(self._max_workers)
+        per_issue_limit = self._per_issue_fetch_limit(start_date, end_date)
+        pending = []
+        deferred = []
+        hydrations = []
+        tasks = []
+        try:
+            async for page in self._jira_client.iter_issues(jql=jql, fields=ISSUE_LOOKUP_FIELDS, page_size=JIRA_MAX_RESULTS):
+                hydration = asyncio.create_task(self._limited(limiter, self._hydrate_issues, page))
+                tasks.append(hydration)
+                hydrations.append((page, hydration))
+                for issue in page:
+                    if per_issue_limit is None or len(pending) < per_issue_limit:
+                        task = asyncio.create_task(
+                            self._limited(limiter, self._fetch_worklogs_within_timeout, issue["key"], window)
+                        )
+                        tasks.append(task)
+                        pending.append((issue, task))
+                    else:
+                        deferred.append(issue)
+
+            await asyncio.gather(*(task for _, task in pending))
+            unhydrated = await self._finish_hydrations(hydrations, limiter)
+
+            issue_worklogs = [(issue, task.result()) for issue, task in pending]
+            if deferred:
+                issue_worklogs.extend(await self._collect_bulk_worklogs(deferred, window, limiter))
+            if unhydrated:
+                issue_worklogs = [
+                    (issue, None if issue["key"] in unhydrated else worklogs) for issue, worklogs in issue_worklogs
+                ]
+            return issue_worklogs
+        finally:
+            await self._cancel(tasks)
+
+    async def _finish_hydrations(self, hydrations, limiter: asyncio.Semaphore) -> Set[str]:
+        """Wait for the field lookups of each search page, retrying failed ones once.
+
+        A failed lookup only affects its own page. Returns the keys of the
+        issues whose fields still could not be looked up.
+        """
+        results = await asyncio.gather(*(task for _, task in hydrations), return_exceptions=True)
+        unhydrated = set()
+        for (page, _), result in zip(hydrations, results):
+            if not isinstance(result, Exception):
+                continue
+            try:
+                await self._limited(limiter, self._hydrate_issues, page)
+            except Exception as e:
+                self.logger.warning(
+                    "Failed to look up issue fields, listing the issues as failed",
+                    extra={"issue_count": len(page)},
+                    exc_info=e
+                )
+                unhydrated.update(issue["key"] for issue in page)
+        return unhydrated
+
+    async def _collect_bulk_worklogs(
+        self,
+        issues: List[Dict[str, Any]],
+        window: WorklogWindow,
+        limiter: asyncio.Semaphore
+    ) -> IssueWorklogs:
+        """Fetch worklogs for ``issues`` through the bulk worklog endpoints.
+
+        Walks every worklog updated since the start of the range (with a day of
+        slack for timezone offsets) and keeps those belonging to ``issues``.
+        Worklogs created before their own start date and not touched since are
+        not reported by Jira here. If the bulk endpoints fail, the issues are
+        fetched one by one instead.
+        """
+        worklogs_by_issue = {str(issue["id"]): [] for issue in issues}
+
+        in_flight = deque()
+        try:
+            async for page in self._jira_client.iter_updated_worklogs(window.started_after):
+                worklog_ids = [entry["worklogId"] for entry in page]
+                in_flight.append(asyncio.create_task(
+                    self._limited(limiter, self._jira_client.get_worklogs_by_ids, worklog_ids)
+                ))
+                if len(in_flight) >= self._max_workers:
+                    self._merge_bulk_worklogs(await in_flight.popleft(), worklogs_by_issue, window)
+            while in_flight:
+                self._merge_bulk_worklogs(await in_flight.popleft(), worklogs_by_issue, window)
+        except ExternalServiceError as e:
+            await self._cancel(in_flight)
+            in_flight.clear()
+            self.logger.warning(
+                "Bulk worklog fetch failed, falling back to per-issue requests",
+                extra={"issue_count": len(issues)},
+                exc_info=e
+            )
+            results = await asyncio.gather(*(
+                self._limited(limiter, self._fetch_worklogs_within_timeout, issue["key"], window)
+                for issue in issues
+            ))
+            return list(zip(issues, results))
+        finally:
+            await self._cancel(in_flight)
+
+        return [(issue, worklogs_by_issue[str(issue["id"])]) for issue in issues]
+
+    async def _fetch_worklogs_within_timeout(
+        self,
+        issue_key: str,
+        window: WorklogWindow
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Fetch an issue's worklogs, giving up after the issue fetch timeout, if any."""
+        return await self._within_issue_timeout(issue_key, self._fetch_worklogs_for_issue(issue_key, window))
+
+    async def _within_issue_timeout(
+        self,
+        issue_key: str,
+        fetch: Awaitable[Optional[List[Dict[str, Any]]]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Await ``fetch`` for an issue's worklogs, or return None after the issue fetch timeout, if any."""
+        if not self._issue_fetch_timeout:
+            return await fetch
+        try:
+            return await asyncio.wait_for(fetch, self._issue_fetch_timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                f"Timed out fetching worklogs for issue {issue_key}",
+                extra={"issue_key": issue_key, "timeout_seconds": self._issue_fetch_timeout}
+            )
+            return None
+
+    async def _fetch_worklogs_for_issue(self, issue_key: str, window: WorklogWindow) -> Optional[List[Dict[str, Any]]]:
+        """Fetch an issue's worklogs, joining an identical fetch already in flight."""
+        if self._single_flight is None:
+            return await self._request_worklogs_for_issue(issue_key, window)
+        return await self._single_flight.do(
+            self._issue_flight_key(issue_key, window),
+            lambda: self._request_worklogs_for_issue(issue_key, window)
+        )
+
+    async def _request_worklogs_for_issue(self, issue_key: str, window: WorklogWindow) -> Optional[List[Dict[str, Any]]]:
+        """Stream an issue's worklogs page by page, keeping only those by the window's authors."""
+        try:
+            worklogs = []
+            async for page in self._jira_client.iter_issue_worklogs(
+                issue_key,
+                started_after=window.started_after,
+                started_before=window.started_before
+            ):
+                worklogs.extend(wl for wl in page if window.includes(wl))
+            return worklogs
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to fetch worklogs for issue {issue_key}",
+                extra={"issue_key": issue_key},
+                exc_info=e
+            )
+            return None
+
+    async def _hydrate_issues(self, issues: List[Dict[str, Any]]) -> None:
+        """Fill in the fields of issues returned by a lightweight search, in place.
+
+        Issues whose cached copy is current take their fields from the issue
+        cache; the rest are fetched with a single search by key.
+        """
+        missing = self._apply_cached_fields(issues)
+        if not missing:
+            return
+
+        jql = self._issue_lookup_jql(list(missing))
+        async for page in self._jira_client.iter_issues(jql=jql, fields=ISSUE_FIELDS, page_size=JIRA_MAX_RESULTS):
+            self._apply_fetched_fields(missing, page)
+
+    @staticmethod
+    async def _limited(limiter: asyncio.Semaphore, func: Callable[..., Awaitable[T]], *args) -> T:
+        async with limiter:
+            return await func(*args)
+
+    @staticmethod
+    async def _cancel(tasks) -> None:
+        """Cancel unfinished tasks and wait for all of them to settle."""
+        tasks = list(tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
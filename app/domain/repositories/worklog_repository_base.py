@@ -0,0 +1,376 @@
+"""Worklog repository logic that does not touch Jira."""
+
+from typing import List, Dict, Any, Callable, FrozenSet, Hashable, Iterable, NamedTuple, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+
+from app.domain.interfaces import Coverage, IWorklogStore
+from app.core.base import BaseRepository
+from app.core.config import (
+    JIRA_WORKLOG_FETCH_CONCURRENCY,
+    JIRA_BULK_FETCH_ENABLED,
+    JIRA_BULK_FETCH_MIN_DAYS,
+    JIRA_BULK_FETCH_MIN_ISSUES,
+    JIRA_ISSUE_FETCH_TIMEOUT_SECONDS,
+    WORKLOG_CACHE_MAX_AGE_SECONDS,
+    WORKLOG_RETRY_ATTEMPTS,
+    WORKLOG_SYNC_MAX_PAGES
+)
+from app.core.constants import DATE_FORMAT
+from app.core.cache import TTLCache
+from app.core.jobs import JobRegistry
+from app.core.singleflight import AsyncSingleFlight
+from app.models.summary import (
+    Author,
+    DaySummary,
+    IssueRecord,
+    MemberSummary,
+    TeamSummary,
+    WorklogEntry,
+    WorklogSummary
+)
+from app.utils.helpers import (
+    build_team_worklog_jql,
+    get_offset_table,
+    get_time_zone,
+    quote_jql_value
+)
+
+ISSUE_FIELDS = [
+    "summary", "project", "reporter", "issuetype", "status", "priority", "assignee",
+    "timeoriginalestimate", "updated"
+]
+ISSUE_LOOKUP_FIELDS = ["updated"]
+WINDOW_SLACK = timedelta(days=1)
+SYNC_OVERLAP_MS = 60 * 1000
+
+# Issues paired with their worklogs; None marks an issue whose worklogs could not be fetched.
+IssueWorklogs = List[Tuple[Dict[str, Any], Optional[List[Dict[str, Any]]]]]
+
+
+class WorklogWindow(NamedTuple):
+    """Authors and start-time bounds (epoch milliseconds) used to fetch worklogs.
+
+    The bounds are widened by a day on each side so worklogs recorded with any
+    UTC offset are fetched; exact date filtering happens after the fetch.
+    """
+    account_ids: FrozenSet[str]
+    started_after: int
+    started_before: int
+
+    @classmethod
+    def for_date_range(cls, account_ids: Iterable[str], start_date: str, end_date: str) -> "WorklogWindow":
+        start = datetime.strptime(start_date, DATE_FORMAT).replace(tzinfo=timezone.utc) - WINDOW_SLACK
+        end = datetime.strptime(end_date, DATE_FORMAT).replace(tzinfo=timezone.utc) + timedelta(days=1) + WINDOW_SLACK
+        return cls(frozenset(account_ids), int(start.timestamp() * 1000), int(end.timestamp() * 1000))
+
+    def includes(self, worklog: Dict[str, Any]) -> bool:
+        return worklog.get("author", {}).get("accountId") in self.account_ids
+
+
+class WorklogRepositoryBase(BaseRepository):
+    """Configuration and I/O-free logic of the worklog repository.
+
+    Filtering, issue metadata bookkeeping and aggregation live here, apart
+    from the Jira and store access in ``AsyncWorklogRepository``.
+    """
+
+    def __init__(
+        self,
+        jira_client: Any,
+        max_workers: int = JIRA_WORKLOG_FETCH_CONCURRENCY,
+        bulk_fetch: bool = JIRA_BULK_FETCH_ENABLED,
+        bulk_min_days: int = JIRA_BULK_FETCH_MIN_DAYS,
+        bulk_min_issues: int = JIRA_BULK_FETCH_MIN_ISSUES,
+        store: Optional[IWorklogStore] = None,
+        cloud_id: Optional[str] = None,
+        owner_account_id: Optional[str] = None,
+        cache_max_age: int = WORKLOG_CACHE_MAX_AGE_SECONDS,
+        sync_max_pages: int = WORKLOG_SYNC_MAX_PAGES,
+        issue_cache: Optional[TTLCache] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        time_zone: Optional[str] = None,
+        retry_jobs: Optional[JobRegistry] = None,
+        retry_attempts: int = WORKLOG_RETRY_ATTEMPTS,
+        issue_fetch_timeout: float = JIRA_ISSUE_FETCH_TIMEOUT_SECONDS
+    ):
+        """Create the repository.
+
+        Args:
+            jira_client: Jira API client.
+            max_workers: Maximum number of concurrent Jira requests.
+            bulk_fetch: Allow the bulk worklog endpoints, which walk every
+                worklog on the site updated since the start of the range and
+                miss worklogs last updated before it. Off unless configured.
+            bulk_min_days: With ``bulk_fetch``, date ranges spanning at least this
+                many days use the bulk worklog endpoints for every issue. 0
+                disables this trigger.
+            bulk_min_issues: With ``bulk_fetch``, once this many issues have been
+                fetched one by one, the remaining issues use the bulk worklog
+                endpoints. 0 disables this trigger.
+            store: Optional persistent worklog store used as a local cache.
+            cloud_id: Jira cloud site the store entries are keyed by.
+            owner_account_id: Account of the authenticated user. Only their own
+                worklogs are served from the store, since another user's view
+                of Jira may differ by project permissions.
+            cache_max_age: Seconds after which stored data is resynced.
+            sync_max_pages: Pages of the site-wide updated-worklog feed a
+                resync reads before giving up on it and refetching the stored
+                range with the user's own search instead. 0 disables the cap.
+            issue_cache: Optional cache of issue fields and display metadata
+                keyed by ``(cloud_id, issue_key)``, shared across repositories.
+            single_flight: Optional group, shared across repositories, through
+                which concurrent fetches of the same issue's worklogs for the
+                same user and window share one request.
+            time_zone: IANA time zone of the user the summary is for. Worklogs
+                are bucketed into days in this zone; without one (or for an
+                unknown one) by the date they were recorded with.
+            retry_jobs: Optional registry in which the repository starts a
+                background job refetching the issues whose worklogs could not
+                be fetched. Summaries report those issues either way.
+            retry_attempts: How many times the background job retries each
+                issue. 0 disables retries.
+            issue_fetch_timeout: Seconds after which the repository stops
+                waiting for one issue's worklogs and leaves the issue to the
+                background job. 0 waits indefinitely; ignored without
+                ``retry_jobs``.
+        """
+        super().__init__()
+        self._jira_client = jira_client
+        self._max_workers = max(1, max_workers)
+        self._bulk_fetch = bulk_fetch
+        self._bulk_min_days = bulk_min_days
+        self._bulk_min_issues = bulk_min_issues
+        self._store = store
+        self._cloud_id = cloud_id
+        self._owner_account_id = owner_account_id
+        self._cache_max_age_ms = cache_max_age * 1000
+        self._sync_max_pages = max(0, sync_max_pages)
+        self._issue_cache = issue_cache
+        self._single_flight = single_flight
+        self._time_zone = time_zone if get_time_zone(time_zone) is not None else None
+        self._retry_jobs = retry_jobs
+        self._retry_attempts = max(0, retry_attempts)
+        self._issue_fetch_timeout = issue_fetch_timeout if retry_jobs is not None and retry_attempts > 0 else 0
+
+    def _uses_store(self, account_id: str) -> bool:
+        return self._store is not None and self._cloud_id is not None and account_id == self._owner_account_id
+
+    def _issue_flight_key(self, issue_key: str, window: WorklogWindow) -> Hashable:
+        return ("issue-worklogs", self._cloud_id, self._owner_account_id, issue_key, window)
+
+    def _store_date_range(self, start_date: str, end_date: str) -> Tuple[str, str]:
+        """Return the stored dates to read for a range.
+
+        The store indexes worklogs by their recorded date, which may be a day
+        off the user's local date, so zone-aware reads are widened by a day.
+        """
+        if self._time_zone is None:
+            return start_date, end_date
+        start = datetime.strptime(start_date, DATE_FORMAT) - timedelta(days=1)
+        end = datetime.strptime(end_date, DATE_FORMAT) + timedelta(days=1)
+        return start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT)
+
+    def _local_date(self, start_date: str, end_date: str) -> Callable[[str], str]:
+        """Return the function mapping a worklog's ``started`` timestamp to its summary day."""
+        if self._time_zone is None:
+            return lambda started: started[:10]
+        return get_offset_table(self._time_zone, start_date, end_date).local_date
+
+    def _needs_sync(self, coverage: Coverage, now: int, force_refresh: bool) -> bool:
+        return force_refresh or now - coverage.synced_at > self._cache_max_age_ms
+
+    def _per_issue_fetch_limit(self, start_date: str, end_date: str) -> Optional[int]:
+        """Return how many issues to fetch one by one, or None for no limit."""
+        if not self._bulk_fetch:
+            return None
+        if self._bulk_min_days > 0:
+            days = (datetime.strptime(end_date, DATE_FORMAT) - datetime.strptime(start_date, DATE_FORMAT)).days + 1
+            if days >= self._bulk_min_days:
+                return 0
+        return self._bulk_min_issues if self._bulk_min_issues > 0 else None
+
+    @staticmethod
+    def _filter_issues(
+        issue_worklogs: IssueWorklogs,
+        project_keys: Optional[List[str]],
+        issue_types: Optional[List[str]]
+    ) -> IssueWorklogs:
+        if not project_keys and not issue_types:
+            return issue_worklogs
+
+        def matches(issue: Dict[str, Any]) -> bool:
+            fields = issue["fields"]
+            if project_keys and (fields.get("project") or {}).get("key") not in project_keys:
+                return False
+            if issue_types and (fields.get("issuetype") or {}).get("name") not in issue_types:
+                return False
+            return True
+
+        return [(issue, worklogs) for issue, worklogs in issue_worklogs if matches(issue)]
+
+    @staticmethod
+    def _merge_bulk_worklogs(
+        worklogs: List[Dict[str, Any]],
+        worklogs_by_issue: Dict[str, List[Dict[str, Any]]],
+        window: WorklogWindow
+    ) -> None:
+        for wl in worklogs:
+            bucket = worklogs_by_issue.get(str(wl.get("issueId")))
+            if bucket is not None and window.includes(wl):
+                bucket.append(wl)
+
+    def _apply_cached_fields(self, issues: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Fill in fields of lightweight search results from the issue cache, in place.
+
+        An issue takes its cached fields when the cached copy is as recent as its
+        ``updated`` timestamp. Returns the issues still missing fields, by key.
+        """
+        missing = {}
+        for issue in issues:
+            cached = self._issue_cache.get((self._cloud_id, issue["key"])) if self._issue_cache else None
+            if cached and cached["updated"] == issue.get("fields", {}).get("updated"):
+                issue["fields"] = cached["fields"]
+            else:
+                missing[issue["key"]] = issue
+        return missing
+
+    @staticmethod
+    def _needs_fields(issue: Dict[str, Any]) -> bool:
+        """Return whether an issue still has only the fields of the lightweight search."""
+        return not (issue.get("fields", {}).keys() - set(ISSUE_LOOKUP_FIELDS))
+
+    def _apply_fetched_fields(self, missing: Dict[str, Dict[str, Any]], fetched_issues: List[Dict[str, Any]]) -> None:
+        for fetched in fetched_issues:
+            issue = missing.get(fetched["key"])
+            if issue is None:
+                continue
+            issue["fields"] = fetched["fields"]
+            if self._issue_cache:
+                self._issue_cache.set(
+                    (self._cloud_id, fetched["key"]),
+                    {"updated": fetched["fields"].get("updated"), "fields": fetched["fields"]}
+                )
+
+    @staticmethod
+    def _issue_lookup_jql(issue_keys: List[str]) -> str:
+        return f"key in ({', '.join(quote_jql_value(key) for key in issue_keys)})"
+
+    def _summarize(
+        self,
+        issue_worklogs: IssueWorklogs,
+        account_id: str,
+        start_date: str,
+        end_date: str
+    ) -> WorklogSummary:
+        summary = self._summarize_accounts(issue_worklogs, [account_id], start_date, end_date)[account_id]
+        summary.failed_issues = self._failed_issues(issue_worklogs)
+        return summary
+
+    def _summarize_accounts(
+        self,
+        issue_worklogs: IssueWorklogs,
+        account_ids: List[str],
+        start_date: str,
+        end_date: str,
+        authors: Optional[Dict[tuple, Author]] = None
+    ) -> Dict[str, WorklogSummary]:
+        """Split worklogs into one summary per author in a single pass.
+
+        Each issue's display record and each author are built once, however
+        many of the accounts logged time on the issue. Worklogs by other
+        authors are skipped. ``authors`` collects the authors seen. Issues
+        without worklogs are skipped too; their authors are unknown, so the
+        caller lists them once for all accounts.
+        """
+        days_by_account: Dict[str, Dict[str, DaySummary]] = {account_id: {} for account_id in account_ids}
+        authors = {} if authors is None else authors
+        local_date = self._local_date(start_date, end_date)
+
+        for issue, worklogs in issue_worklogs:
+            if worklogs is None:
+                continue
+
+            record = self._issue_record(issue)
+
+            for wl in worklogs:
+                days = days_by_account.get(wl["author"]["accountId"])
+                if days is None:
+                    continue
+
+                worklog_date = local_date(wl["started"])
+                if not (start_date <= worklog_date <= end_date):
+                    continue
+
+                day = days.get(worklog_date)
+                if day is None:
+                    day = days[worklog_date] = DaySummary(worklog_date)
+                day.add(record, WorklogEntry.from_jira(wl, authors))
+
+        return {
+            account_id: WorklogSummary([days[day] for day in sorted(days)])
+            for account_id, days in days_by_account.items()
+        }
+
+    def _summarize_team(
+        self,
+        issue_worklogs: IssueWorklogs,
+        account_ids: List[str],
+        display_names: Dict[str, str],
+        start_date: str,
+        end_date: str
+    ) -> TeamSummary:
+        """Build a team summary with one member per account, in ``account_ids`` order.
+
+        Members are named after ``display_names`` where known, otherwise after
+        their worklogs; accounts without worklogs in range get an empty summary.
+        """
+        authors: Dict[tuple, Author] = {}
+        summaries = self._summarize_accounts(issue_worklogs, account_ids, start_date, end_date, authors)
+        logged_names = {author.account_id: author.display_name for author in authors.values()}
+        return TeamSummary(
+            [
+                MemberSummary(
+                    Author(account_id, display_names.get(account_id) or logged_names.get(account_id, "Unknown")),
+                    summaries[account_id]
+                )
+                for account_id in account_ids
+            ],
+            self._failed_issues(issue_worklogs)
+        )
+
+    @staticmethod
+    def _failed_issues(issue_worklogs: IssueWorklogs) -> List[str]:
+        return [issue["key"] for issue, worklogs in issue_worklogs if worklogs is None]
+
+    @staticmethod
+    def _team_jql(
+        account_ids: List[str],
+        group_name: Optional[str],
+        start_date: str,
+        end_date: str,
+        project_keys: Optional[List[str]],
+        issue_types: Optional[List[str]]
+    ) -> str:
+        """Select a team's issues by group membership when there is a group, else by account."""
+        return build_team_worklog_jql(
+            start_date,
+            end_date,
+            account_ids=None if group_name is not None else account_ids,
+            group_name=group_name,
+            project_keys=project_keys,
+            issue_types=issue_types
+        )
+
+    def _issue_record(self, issue: Dict[str, Any]) -> IssueRecord:
+        """Return the display record for an issue, built once and shared via the issue cache."""
+        fields = issue["fields"]
+        cache_key = (self._cloud_id, issue["key"])
+        cached = self._issue_cache.get(cache_key) if self._issue_cache else None
+        if cached and cached["updated"] == fields.get("updated") and "record" in cached:
+            return cached["record"]
+
+        record = IssueRecord.from_jira(issue)
+        if self._issue_cache:
+            self._issue_cache.set(cache_key, {"updated": fields.get("updated"), "fields": fields, "record": record})
+        return record
+
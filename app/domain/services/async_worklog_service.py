@@ -0,0 +1,203 @@
+"""Async worklog business logic service."""
+
+from typing import List, Dict, Any, Optional
+
+from app.domain.interfaces import IAsyncWorklogService, IAsyncWorklogRepository
+from app.domain.aggregation import WorklogColumns, validate_dimensions
+from app.core.base import BaseService
+from app.core.cache import TTLCache
+from app.core.singleflight import AsyncSingleFlight
+from app.core.exceptions import ExternalServiceError, ValidationError
+from app.core.constants import TEAM_SUMMARY_MAX_ACCOUNTS
+from app.core.validators import validate_date_range, validate_required, validate_team_selection
+from app.models.summary import TeamSummary, WorklogSummary
+from app.utils.helpers import to_thread
+
+
+class AsyncWorklogService(BaseService, IAsyncWorklogService):
+    """Non-blocking service for worklog business logic."""
+
+    def __init__(
+        self,
+        worklog_repository: IAsyncWorklogRepository,
+        user_account_id: Optional[str] = None,
+        cloud_id: Optional[str] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        time_zone: Optional[str] = None,
+        summary_cache: Optional[TTLCache] = None
+    ):
+        """Create the service.
+
+        Args:
+            worklog_repository: Worklog data access.
+            user_account_id: Account of the authenticated user, used when no
+                account is requested explicitly.
+            cloud_id: Jira cloud site the user is working against.
+            single_flight: Optional group, shared across services, through
+                which identical concurrent summary requests by the same user
+                share one fetch.
+            time_zone: Time zone the repository buckets days in; summaries
+                for different zones are not shared.
+            summary_cache: Optional short-lived cache of complete summaries,
+                shared across services, so that rollups and exports of a
+                summary just fetched do not go back to Jira.
+        """
+        super().__init__()
+        self._repository = worklog_repository
+        self._user_account_id = user_account_id
+        self._cloud_id = cloud_id
+        self._single_flight = single_flight
+        self._time_zone = time_zone
+        self._summary_cache = summary_cache
+
+    async def get_worklog_summary(
+        self,
+        account_id: Optional[str] = None,
+        start_date: str = "",
+        end_date: str = "",
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None,
+        force_refresh: bool = False
+    ) -> WorklogSummary:
+        account_id = account_id or self._user_account_id
+        validate_required(account_id, "account_id")
+        validate_required(start_date, "start_date")
+        validate_required(end_date, "end_date")
+        validate_date_range(start_date, end_date)
+
+        # The caller is part of the key: Jira permissions decide what each user sees.
+        key = (
+            self._cloud_id,
+            self._user_account_id,
+            account_id,
+            start_date,
+            end_date,
+            tuple(project_keys or ()),
+            tuple(issue_types or ()),
+            self._time_zone
+        )
+        if self._summary_cache is not None and not force_refresh:
+            cached = self._summary_cache.get(key)
+            if cached is not None:
+                return cached
+
+        def fetch():
+            return self._repository.get_worklogs_by_date_range(
+                account_id=account_id,
+                start_date=start_date,
+                end_date=end_date,
+                project_keys=project_keys,
+                issue_types=issue_types,
+                force_refresh=force_refresh
+            )
+
+        try:
+            if self._single_flight is None:
+                summary = await fetch()
+            else:
+                summary = await self._single_flight.do(("summary", *key, force_refresh), fetch)
+            # Partial summaries are not cached, so the next request tries the failed issues again.
+            if self._summary_cache is not None and not summary.failed_issues:
+                self._summary_cache.set(key, summary)
+            return summary
+        except ExternalServiceError:
+            raise
+        except Exception as e:
+            self._handle_error(
+                error=e,
+                operation="get_worklog_summary",
+                context={
+                    "account_id": account_id,
+                    "start_date": start_date,
+                    "end_date": end_date
+                }
+            )
+
+    async def get_worklog_rollup(
+        self,
+        group_by: List[str],
+        account_id: Optional[str] = None,
+        start_date: str = "",
+        end_date: str = "",
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None,
+        force_refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Sum time spent per combination of ``group_by`` dimensions.
+
+        Rollups are computed from the summary of the same request, so they
+        reuse a complete summary fetched within ``SUMMARY_CACHE_TTL_SECONDS``,
+        or join a fetch still in flight, instead of going back to Jira.
+        """
+        validate_dimensions(group_by)
+        summary = await self.get_worklog_summary(
+            account_id=account_id,
+            start_date=start_date,
+            end_date=end_date,
+            project_keys=project_keys,
+            issue_types=issue_types,
+            force_refresh=force_refresh
+        )
+        # Large summaries take a while to fold; keep that off the event loop.
+        return await to_thread(WorklogColumns.from_summary(summary).group_by, *group_by)
+
+    async def get_team_summary(
+        self,
+        start_date: str,
+        end_date: str,
+        account_ids: Optional[List[str]] = None,
+        group_name: Optional[str] = None,
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None
+    ) -> TeamSummary:
+        """Summarize the worklogs of several accounts, or of a Jira group's members.
+
+        Issues shared by the team are searched for and fetched once for all
+        members. Duplicate account IDs are dropped, keeping request order.
+        """
+        validate_required(start_date, "start_date")
+        validate_required(end_date, "end_date")
+        validate_date_range(start_date, end_date)
+        validate_team_selection(account_ids, group_name, TEAM_SUMMARY_MAX_ACCOUNTS)
+        account_ids = list(dict.fromkeys(account_ids)) if account_ids else None
+        group_name = group_name.strip() if group_name else None
+
+        def fetch():
+            return self._repository.get_team_worklogs_by_date_range(
+                start_date=start_date,
+                end_date=end_date,
+                account_ids=account_ids,
+                group_name=group_name,
+                project_keys=project_keys,
+                issue_types=issue_types
+            )
+
+        try:
+            if self._single_flight is None:
+                return await fetch()
+            key = (
+                "team-summary",
+                self._cloud_id,
+                self._user_account_id,
+                tuple(account_ids or ()),
+                group_name,
+                start_date,
+                end_date,
+                tuple(project_keys or ()),
+                tuple(issue_types or ()),
+                self._time_zone
+            )
+            return await self._single_flight.do(key, fetch)
+        except (ExternalServiceError, ValidationError):
+            raise
+        except Exception as e:
+            self._handle_error(
+                error=e,
+                operation="get_team_summary",
+                context={
+                    "account_count": len(account_ids or ()),
+                    "group_name": group_name,
+                    "start_date": start_date,
+                    "end_date": end_date
+                }
+            )
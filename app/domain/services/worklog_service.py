@@ -1,48 +1,75 @@
-"""Worklog business logic service."""
+"""Blocking worklog service, a thin adapter over the async service."""
 
 from typing import List, Dict, Any, Optional
 
-from app.domain.interfaces import IWorklogService, IWorklogRepository
-from app.core.base import BaseService
-from app.core.exceptions import ExternalServiceError
-from app.core.validators import validate_date_range, validate_required
+from app.domain.interfaces import IAsyncWorklogService, IWorklogService
+from app.core.loop_thread import LoopThread, get_loop_thread
+from app.models.summary import TeamSummary, WorklogSummary
 
 
-class WorklogService(BaseService, IWorklogService):
-    """Service for worklog business logic."""
+class WorklogService(IWorklogService):
+    """Blocking worklog business logic over an ``IAsyncWorklogService``.
 
-    def __init__(self, worklog_repository: IWorklogRepository, user_account_id: Optional[str] = None):
-        super().__init__()
-        self._repository = worklog_repository
-        self._user_account_id = user_account_id
+    Validation, caching and error handling are the async service's; calls
+    run on a ``LoopThread`` and raise the same exceptions.
+    """
+
+    def __init__(self, async_service: IAsyncWorklogService, loop_thread: Optional[LoopThread] = None):
+        self.async_service = async_service
+        self.loop_thread = loop_thread or get_loop_thread()
 
     def get_worklog_summary(
         self,
         account_id: Optional[str] = None,
         start_date: str = "",
-        end_date: str = ""
+        end_date: str = "",
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None,
+        force_refresh: bool = False
+    ) -> WorklogSummary:
+        return self.loop_thread.run(self.async_service.get_worklog_summary(
+            account_id=account_id,
+            start_date=start_date,
+            end_date=end_date,
+            project_keys=project_keys,
+            issue_types=issue_types,
+            force_refresh=force_refresh
+        ))
+
+    def get_worklog_rollup(
+        self,
+        group_by: List[str],
+        account_id: Optional[str] = None,
+        start_date: str = "",
+        end_date: str = "",
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None,
+        force_refresh: bool = False
     ) -> List[Dict[str, Any]]:
-        account_id = account_id or self._user_account_id
-        validate_required(account_id, "account_id")
-        validate_required(start_date, "start_date")
-        validate_required(end_date, "end_date")
-        validate_date_range(start_date, end_date)
-        
-        try:
-            return self._repository.get_worklogs_by_date_range(
-                account_id=account_id,
-                start_date=start_date,
-                end_date=end_date
-            )
-        except ExternalServiceError:
-            raise
-        except Exception as e:
-            self._handle_error(
-                error=e,
-                operation="get_worklog_summary",
-                context={
-                    "account_id": account_id,
-                    "start_date": start_date,
-                    "end_date": end_date
-                }
-            )
+        return self.loop_thread.run(self.async_service.get_worklog_rollup(
+            group_by=group_by,
+            account_id=account_id,
+            start_date=start_date,
+            end_date=end_date,
+            project_keys=project_keys,
+            issue_types=issue_types,
+            force_refresh=force_refresh
+        ))
+
+    def get_team_summary(
+        self,
+        start_date: str,
+        end_date: str,
+        account_ids: Optional[List[str]] = None,
+        group_name: Optional[str] = None,
+        project_keys: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None
+    ) -> TeamSummary:
+        return self.loop_thread.run(self.async_service.get_team_summary(
+            start_date=start_date,
+            end_date=end_date,
+            account_ids=account_ids,
+            group_name=group_name,
+            project_keys=project_keys,
+            issue_types=issue_types
+        ))
@@ -1,5 +1,6 @@
 """Infrastructure layer: external integrations and implementations."""
 
 from app.infrastructure.jira_client import JiraClient
+from app.infrastructure.async_jira_client import AsyncJiraClient
 
-__all__ = ["JiraClient"]
+__all__ = ["JiraClient", "AsyncJiraClient"]
@@ -0,0 +1,303 @@
+"""Async Jira API client implementation."""
+
+from typing import List, Dict, Any, AsyncIterator, Optional
+
+import httpx
+
+from app.domain.interfaces import IAsyncJiraClient, ICredentialProvider
+from app.infrastructure.http_pool import create_async_client
+from app.core.rate_limit import RateLimiter, client_key, get_rate_limiter
+from app.core.logging import get_logger
+from app.utils.helpers import to_thread
+from app.core.exceptions import ExternalServiceError, AuthenticationError
+from app.core.constants import (
+    JIRA_GROUP_MEMBER_PAGE_SIZE,
+    JIRA_WORKLOG_LIST_BATCH_SIZE,
+    JIRA_WORKLOG_PAGE_SIZE
+)
+from app.core.config import (
+    JIRA_DOMAIN,
+    JIRA_API_BASE_URL
+)
+
+logger = get_logger(__name__)
+
+
+class AsyncJiraClient(IAsyncJiraClient):
+    """Non-blocking Jira API client on a shared ``httpx.AsyncClient``.
+
+    The keep-alive HTTP client is shared per process and this client only
+    contributes its own bearer token, sent with every request. Without a
+    shared HTTP client, the client keeps a private one that must be released
+    with ``aclose``. Every request is scheduled through the process-wide
+    ``RateLimiter`` unless another limiter is given.
+
+    With a credential provider, a request rejected with 401 is retried once
+    with the token the provider refreshes, so a token expiring mid-fetch
+    costs one extra request rather than the whole fetch.
+    """
+
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        cloud_id: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        credentials: Optional[ICredentialProvider] = None
+    ):
+        access_token = access_token or (credentials.get_access_token() if credentials else None)
+        if not access_token:
+            raise AuthenticationError("No authentication method available. Access token is required.")
+        self.access_token = access_token
+        self.cloud_id = cloud_id
+        self._credentials = credentials
+        self._base_url = self._get_base_url()
+        self._headers = {"Accept": "application/json", "Authorization": f"Bearer {access_token}"}
+        self._owns_client = http_client is None
+        self._http_client = http_client or create_async_client()
+        self._rate_limiter = rate_limiter or get_rate_limiter()
+        self._rate_limit_key = client_key(access_token)
+
+    def update_token(self, access_token: str):
+        """Update the access token and refresh headers."""
+        self.access_token = access_token
+        self._headers["Authorization"] = f"Bearer {access_token}"
+        self._rate_limit_key = client_key(access_token)
+
+    async def aclose(self) -> None:
+        """Close a private HTTP client; a shared one is left open."""
+        if self._owns_client:
+            await self._http_client.aclose()
+
+    def _get_base_url(self) -> str:
+        if self.access_token and self.cloud_id:
+            return f"{JIRA_API_BASE_URL}/ex/jira/{self.cloud_id}"
+        return f"https://{JIRA_DOMAIN}"
+
+    async def _request_json(
+        self,
+        method: str,
+        url: str,
+        error_message: str,
+        context: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> Any:
+        """Send a request to Jira and return the decoded JSON body.
+
+        Any failure is logged and re-raised as ExternalServiceError, carrying
+        Jira's status code when one was received.
+        """
+        context = context or {}
+        retried = False
+        while True:
+            token = self.access_token
+            try:
+                response = await self._rate_limiter.send_async(
+                    self._rate_limit_key,
+                    lambda: self._http_client.request(method, url, headers=self._headers, **kwargs)
+                )
+                response.raise_for_status()
+                return response.json()
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 401 and not retried and await self._refresh_credentials(token):
+                    retried = True
+                    continue
+                logger.error(
+                    error_message,
+                    extra={
+                        "status_code": e.response.status_code,
+                        "url": url,
+                        **context
+                    },
+                    exc_info=e
+                )
+                raise ExternalServiceError(
+                    message=f"{error_message}: {e.response.text}",
+                    service_name="Jira",
+                    status_code=e.response.status_code,
+                    details={"url": url, **context}
+                )
+            except Exception as e:
+                logger.error(
+                    f"Unexpected error: {error_message}",
+                    extra={"url": url, **context},
+                    exc_info=e
+                )
+                raise ExternalServiceError(
+                    message=f"{error_message}: {str(e)}",
+                    service_name="Jira",
+                    details={"url": url, **context}
+                )
+
+    async def _refresh_credentials(self, rejected_token: str) -> bool:
+        """Switch to a refreshed token after Jira rejected ``rejected_token``; True if there is one."""
+        if self._credentials is None:
+            return False
+        # Refreshing talks to the OAuth server with a blocking client.
+        token = await to_thread(self._credentials.refresh, rejected_token)
+        if not token or token == rejected_token:
+            return False
+        if token != self.access_token:
+            self.update_token(token)
+        return True
+
+    async def search_issues(
+        self,
+        jql: str,
+        fields: List[str],
+        next_page_token: Optional[str] = None,
+        max_results: int = 100
+    ) -> Dict[str, Any]:
+        url = f"{self._base_url}/rest/api/3/search/jql"
+        params = {
+            "jql": jql,
+            "fields": ",".join(fields),
+            "maxResults": max_results
+        }
+        if next_page_token:
+            params["nextPageToken"] = next_page_token
+        return await self._request_json(
+            "GET",
+            url,
+            "Failed to query Jira API",
+            context={"jql": jql},
+            params=params
+        )
+
+    async def iter_issues(self, jql: str, fields: List[str], page_size: int = 100) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of issues, following the search continuation token."""
+        next_page_token = None
+        while True:
+            data = await self.search_issues(
+                jql=jql,
+                fields=fields,
+                next_page_token=next_page_token,
+                max_results=page_size
+            )
+            issues = data.get("issues", [])
+            if issues:
+                yield issues
+
+            next_page_token = data.get("nextPageToken")
+            if data.get("isLast") or not next_page_token:
+                return
+
+    async def get_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        worklogs = []
+        async for page in self.iter_issue_worklogs(issue_key, started_after, started_before):
+            worklogs.extend(page)
+        return worklogs
+
+    async def iter_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None,
+        page_size: int = JIRA_WORKLOG_PAGE_SIZE
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of an issue's worklogs as they arrive.
+
+        ``started_after`` and ``started_before`` are epoch milliseconds and are
+        applied by Jira, so only worklogs in that window are transferred.
+        """
+        url = f"{self._base_url}/rest/api/3/issue/{issue_key}/worklog"
+        params = {"startAt": 0, "maxResults": page_size}
+        if started_after is not None:
+            params["startedAfter"] = started_after
+        if started_before is not None:
+            params["startedBefore"] = started_before
+
+        while True:
+            data = await self._request_json(
+                "GET",
+                url,
+                f"Failed to retrieve worklogs for issue {issue_key}",
+                context={"issue_key": issue_key, "start_at": params["startAt"]},
+                params=dict(params)
+            )
+            worklogs = data.get("worklogs", [])
+            if worklogs:
+                yield worklogs
+
+            params["startAt"] += len(worklogs)
+            if not worklogs or params["startAt"] >= data.get("total", 0):
+                return
+
+    def iter_updated_worklogs(self, since: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of worklog IDs updated since ``since`` (epoch milliseconds)."""
+        return self._iter_worklog_changes("updated", since)
+
+    def iter_deleted_worklogs(self, since: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of worklog IDs deleted since ``since`` (epoch milliseconds)."""
+        return self._iter_worklog_changes("deleted", since)
+
+    async def _iter_worklog_changes(self, change: str, since: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        url = f"{self._base_url}/rest/api/3/worklog/{change}"
+        while True:
+            data = await self._request_json(
+                "GET",
+                url,
+                f"Failed to retrieve {change} worklogs",
+                context={"since": since},
+                params={"since": since}
+            )
+            values = data.get("values", [])
+            if values:
+                yield values
+
+            until = data.get("until")
+            if data.get("lastPage", True) or until is None or until <= since:
+                return
+            since = until
+
+    async def get_worklogs_by_ids(self, worklog_ids: List[int]) -> List[Dict[str, Any]]:
+        """Fetch full worklog records by ID, batching 1000 IDs per request."""
+        url = f"{self._base_url}/rest/api/3/worklog/list"
+        worklogs = []
+        for offset in range(0, len(worklog_ids), JIRA_WORKLOG_LIST_BATCH_SIZE):
+            batch = worklog_ids[offset:offset + JIRA_WORKLOG_LIST_BATCH_SIZE]
+            worklogs.extend(await self._request_json(
+                "POST",
+                url,
+                "Failed to retrieve worklogs by ID",
+                context={"worklog_count": len(batch)},
+                json={"ids": batch}
+            ))
+        return worklogs
+
+    async def iter_group_members(self, group_name: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of a Jira group's members, inactive users included.
+
+        Each entry carries ``accountId`` and ``displayName``.
+        """
+        url = f"{self._base_url}/rest/api/3/group/member"
+        params = {
+            "groupname": group_name,
+            "includeInactiveUsers": "true",
+            "startAt": 0,
+            "maxResults": JIRA_GROUP_MEMBER_PAGE_SIZE
+        }
+        while True:
+            data = await self._request_json(
+                "GET",
+                url,
+                f"Failed to retrieve members of group {group_name}",
+                context={"group_name": group_name, "start_at": params["startAt"]},
+                params=params
+            )
+            members = data.get("values", [])
+            if members:
+                yield members
+
+            params["startAt"] += len(members)
+            if data.get("isLast", True) or not members:
+                return
+
+    async def get_user_info(self, access_token: str) -> Dict[str, Any]:
+        from app.core.auth import get_user_info as fetch_user_info
+        return await to_thread(fetch_user_info, access_token)
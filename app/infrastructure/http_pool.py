@@ -0,0 +1,38 @@
+"""Process-wide pool of keep-alive HTTP connections to Jira."""
+
+from http.cookiejar import DefaultCookiePolicy
+
+import httpx
+
+
+def create_async_client(
+    max_connections: int = 20,
+    pool_maxsize: int = 20,
+    idle_timeout: float = 300
+) -> httpx.AsyncClient:
+    """Create a keep-alive ``httpx.AsyncClient`` shared by every Jira client.
+
+    The client carries no credentials; callers send their own
+    ``Authorization`` header with each request, so its connections (and
+    their TLS sessions) serve every user. It refuses cookies for the same
+    reason. At most ``max_connections`` connections are open at once;
+    further requests wait for one to free up. Up to ``pool_maxsize`` of them
+    are kept alive between requests, each for at most ``idle_timeout``
+    seconds.
+    """
+    # httpx ignores the client's ``limits`` when a transport is given, so
+    # they are set on the transport.
+    client = httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0),
+        transport=httpx.AsyncHTTPTransport(
+            retries=3,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=min(pool_maxsize, max_connections),
+                keepalive_expiry=idle_timeout
+            )
+        )
+    )
+    # The client is shared between users, so never replay cookies set for one of them.
+    client.cookies.jar.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return client
@@ -0,0 +1,203 @@
+"""SQLite-backed persistent store for Jira issues and worklogs."""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from app.domain.interfaces import Coverage, IWorklogStore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    cloud_id TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    issue_id TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (cloud_id, account_id, issue_id)
+);
+CREATE TABLE IF NOT EXISTS worklogs (
+    cloud_id TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    worklog_id INTEGER NOT NULL,
+    issue_id TEXT NOT NULL,
+    started_date TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (cloud_id, worklog_id)
+);
+CREATE INDEX IF NOT EXISTS idx_worklogs_account_date
+    ON worklogs (cloud_id, account_id, started_date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    cloud_id TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    range_start TEXT NOT NULL,
+    range_end TEXT NOT NULL,
+    synced_at INTEGER NOT NULL,
+    PRIMARY KEY (cloud_id, account_id, range_start, range_end)
+);
+"""
+
+
+class WorklogStore(IWorklogStore):
+    """Persistent store of one account's issues and worklogs per Jira cloud site.
+
+    Each synced date range is recorded as a ``Coverage`` row. A range that
+    contains the requested dates can be served locally, and brought up to date
+    incrementally from the time of its last sync. All methods are thread-safe.
+    """
+
+    def __init__(self, path: str):
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def find_coverage(
+        self,
+        cloud_id: str,
+        account_id: str,
+        start_date: str,
+        end_date: str
+    ) -> Optional[Coverage]:
+        """Return the most recently synced range containing ``start_date``..``end_date``."""
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT range_start, range_end, synced_at FROM sync_state
+                WHERE cloud_id = ? AND account_id = ? AND range_start <= ? AND range_end >= ?
+                ORDER BY synced_at DESC LIMIT 1
+                """,
+                (cloud_id, account_id, start_date, end_date)
+            ).fetchone()
+        return Coverage(*row) if row else None
+
+    def load(
+        self,
+        cloud_id: str,
+        account_id: str,
+        start_date: str,
+        end_date: str
+    ) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Return stored issues paired with their worklogs started within the date range."""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT i.issue_id, i.data, w.data FROM worklogs w
+                JOIN issues i
+                  ON i.cloud_id = w.cloud_id AND i.account_id = w.account_id AND i.issue_id = w.issue_id
+                WHERE w.cloud_id = ? AND w.account_id = ? AND w.started_date BETWEEN ? AND ?
+                ORDER BY i.ordinal, w.worklog_id
+                """,
+                (cloud_id, account_id, start_date, end_date)
+            ).fetchall()
+
+        issue_worklogs = []
+        current_issue_id = None
+        for issue_id, issue_data, worklog_data in rows:
+            if issue_id != current_issue_id:
+                issue_worklogs.append((json.loads(issue_data), []))
+                current_issue_id = issue_id
+            issue_worklogs[-1][1].append(json.loads(worklog_data))
+        return issue_worklogs
+
+    def replace_range(
+        self,
+        cloud_id: str,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        issue_worklogs: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]],
+        synced_at: int
+    ) -> None:
+        """Store a complete fetch of the account's worklogs for a date range."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM worklogs WHERE cloud_id = ? AND account_id = ? AND started_date BETWEEN ? AND ?",
+                (cloud_id, account_id, start_date, end_date)
+            )
+            self._upsert_issues(cloud_id, account_id, [issue for issue, _ in issue_worklogs])
+            self._upsert_worklogs(
+                cloud_id,
+                account_id,
+                [(str(issue["id"]), wl) for issue, worklogs in issue_worklogs for wl in worklogs]
+            )
+            self._conn.execute(
+                """
+                DELETE FROM sync_state
+                WHERE cloud_id = ? AND account_id = ? AND range_start >= ? AND range_end <= ?
+                """,
+                (cloud_id, account_id, start_date, end_date)
+            )
+            self._conn.execute(
+                "INSERT INTO sync_state (cloud_id, account_id, range_start, range_end, synced_at) VALUES (?, ?, ?, ?, ?)",
+                (cloud_id, account_id, start_date, end_date, synced_at)
+            )
+
+    def apply_sync(
+        self,
+        cloud_id: str,
+        account_id: str,
+        coverage: Coverage,
+        issues: List[Dict[str, Any]],
+        updated_worklogs: List[Dict[str, Any]],
+        deleted_worklog_ids: List[int],
+        synced_at: int
+    ) -> None:
+        """Apply an incremental sync and mark ``coverage`` as synced at ``synced_at``."""
+        with self._lock, self._conn:
+            self._upsert_issues(cloud_id, account_id, issues)
+            self._upsert_worklogs(
+                cloud_id,
+                account_id,
+                [(str(wl["issueId"]), wl) for wl in updated_worklogs]
+            )
+            self._conn.executemany(
+                "DELETE FROM worklogs WHERE cloud_id = ? AND worklog_id = ?",
+                [(cloud_id, int(worklog_id)) for worklog_id in deleted_worklog_ids]
+            )
+            self._conn.execute(
+                """
+                UPDATE sync_state SET synced_at = ?
+                WHERE cloud_id = ? AND account_id = ? AND range_start = ? AND range_end = ?
+                """,
+                (synced_at, cloud_id, account_id, coverage.range_start, coverage.range_end)
+            )
+
+    def _upsert_issues(self, cloud_id: str, account_id: str, issues: List[Dict[str, Any]]) -> None:
+        """Insert or update issues; stored issues keep their place and new ones are numbered after them."""
+        next_ordinal = self._conn.execute(
+            "SELECT COALESCE(MAX(ordinal) + 1, 0) FROM issues WHERE cloud_id = ? AND account_id = ?",
+            (cloud_id, account_id)
+        ).fetchone()[0]
+        self._conn.executemany(
+            """
+            INSERT INTO issues (cloud_id, account_id, issue_id, ordinal, data) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (cloud_id, account_id, issue_id) DO UPDATE SET data = excluded.data
+            """,
+            [
+                (cloud_id, account_id, str(issue["id"]), next_ordinal + index, json.dumps(issue))
+                for index, issue in enumerate(issues)
+            ]
+        )
+
+    def _upsert_worklogs(
+        self,
+        cloud_id: str,
+        account_id: str,
+        worklogs: List[Tuple[str, Dict[str, Any]]]
+    ) -> None:
+        self._conn.executemany(
+            """
+            INSERT INTO worklogs (cloud_id, account_id, worklog_id, issue_id, started_date, data) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (cloud_id, worklog_id) DO UPDATE SET
+                issue_id = excluded.issue_id, started_date = excluded.started_date, data = excluded.data
+            """,
+            [
+                (cloud_id, account_id, int(wl["id"]), issue_id, wl["started"][:10], json.dumps(wl))
+                for issue_id, wl in worklogs
+            ]
+        )
@@ -1,5 +1,27 @@
 """Data models and schemas."""
 
-from app.models.worklog import WorklogRequest
+from app.models.worklog import TeamWorklogRequest, WorklogRequest, WorklogRollupRequest
+from app.models.summary import (
+    Author,
+    DaySummary,
+    IssueDay,
+    IssueRecord,
+    MemberSummary,
+    TeamSummary,
+    WorklogEntry,
+    WorklogSummary
+)
 
-__all__ = ["WorklogRequest"]
+__all__ = [
+    "WorklogRequest",
+    "WorklogRollupRequest",
+    "TeamWorklogRequest",
+    "Author",
+    "DaySummary",
+    "IssueDay",
+    "IssueRecord",
+    "MemberSummary",
+    "TeamSummary",
+    "WorklogEntry",
+    "WorklogSummary"
+]
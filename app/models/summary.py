@@ -0,0 +1,341 @@
+"""Compact in-memory records for worklog summaries.
+
+Summaries are built from these slotted records and only turned into the
+JSON-ready dict shape, with display strings, by ``to_dict`` / ``to_dicts`` at
+the serialization boundary. Issue and author records are shared by every
+worklog that refers to them instead of being copied per worklog or day.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.core.constants import DATE_FORMAT, DATETIME_FORMAT_DISPLAY, SECONDS_PER_HOUR, TIME_FORMAT_DISPLAY
+from app.utils.helpers import extract_comment, format_date, format_jira_timestamp, format_seconds
+
+# Name and type of each column of the flat rows ``iter_rows`` yields: one row
+# per worklog. The worklog author identifies the member in team exports.
+EXPORT_COLUMNS: Tuple[Tuple[str, type], ...] = (
+    ("workDate", str),
+    ("issueKey", str),
+    ("issueSummary", str),
+    ("project", str),
+    ("issueType", str),
+    ("status", str),
+    ("worklogId", str),
+    ("authorAccountId", str),
+    ("authorDisplayName", str),
+    ("started", str),
+    ("startedTime", str),
+    ("timeSpentSeconds", int),
+    ("timeSpentHours", float),
+    ("comment", str)
+)
+
+
+@dataclass(frozen=True)
+class Author:
+    """A worklog author."""
+    __slots__ = ("account_id", "display_name")
+
+    account_id: Optional[str]
+    display_name: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"accountId": self.account_id, "displayName": self.display_name}
+
+
+@dataclass(frozen=True)
+class IssueRecord:
+    """Display metadata of an issue, shaped once per issue version."""
+    __slots__ = (
+        "key", "summary", "project", "reporter_id", "reporter_name", "assignee_id", "assignee_name",
+        "issue_type", "issue_type_icon", "status", "status_category", "priority", "priority_icon",
+        "original_estimate"
+    )
+
+    key: str
+    summary: str
+    project: str
+    reporter_id: Optional[str]
+    reporter_name: Optional[str]
+    assignee_id: Optional[str]
+    assignee_name: Optional[str]
+    issue_type: Optional[str]
+    issue_type_icon: Optional[str]
+    status: Optional[str]
+    status_category: Optional[str]
+    priority: Optional[str]
+    priority_icon: Optional[str]
+    original_estimate: Optional[int]
+
+    @classmethod
+    def from_jira(cls, issue: Dict[str, Any]) -> "IssueRecord":
+        fields = issue["fields"]
+        reporter = fields.get("reporter", {})
+        assignee = fields.get("assignee", {})
+        issue_type = fields.get("issuetype", {})
+        status = fields.get("status", {})
+        priority = fields.get("priority", {})
+        project = fields.get("project") or {}
+        return cls(
+            key=issue["key"],
+            summary=fields.get("summary", ""),
+            project=project.get("key") or issue["key"].rsplit("-", 1)[0],
+            reporter_id=reporter.get("accountId") if reporter else None,
+            reporter_name=reporter.get("displayName") if reporter else "Unknown",
+            assignee_id=assignee.get("accountId") if assignee else None,
+            assignee_name=assignee.get("displayName") if assignee else "Unassigned",
+            issue_type=issue_type.get("name") if issue_type else "Unknown",
+            issue_type_icon=issue_type.get("iconUrl") if issue_type else None,
+            status=status.get("name") if status else "Unknown",
+            status_category=status.get("statusCategory", {}).get("name") if status else None,
+            priority=priority.get("name") if priority else "Unknown",
+            priority_icon=priority.get("iconUrl") if priority else None,
+            original_estimate=fields.get("timeoriginalestimate")
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "issueKey": self.key,
+            "issueSummary": self.summary,
+            "reportedBy": {"accountId": self.reporter_id, "displayName": self.reporter_name},
+            "assignee": {"accountId": self.assignee_id, "displayName": self.assignee_name},
+            "issueType": {"name": self.issue_type, "iconUrl": self.issue_type_icon},
+            "status": {"name": self.status, "statusCategory": self.status_category},
+            "priority": {"name": self.priority, "iconUrl": self.priority_icon},
+            "originalEstimate": self.original_estimate,
+            "originalEstimateFormatted": format_seconds(self.original_estimate) if self.original_estimate else None
+        }
+
+
+@dataclass(frozen=True)
+class WorklogEntry:
+    """A single worklog, holding raw Jira values only."""
+    __slots__ = ("worklog_id", "author", "started", "updated", "seconds", "comment")
+
+    worklog_id: str
+    author: Author
+    started: str
+    updated: str
+    seconds: int
+    comment: str
+
+    @classmethod
+    def from_jira(cls, worklog: Dict[str, Any], authors: Dict[tuple, Author]) -> "WorklogEntry":
+        """Build an entry, reusing ``authors`` so each author is stored once per summary."""
+        author = worklog.get("author", {})
+        author_key = (author.get("accountId"), author.get("displayName", "Unknown"))
+        shared_author = authors.get(author_key)
+        if shared_author is None:
+            shared_author = authors[author_key] = Author(*author_key)
+        return cls(
+            worklog_id=worklog["id"],
+            author=shared_author,
+            started=worklog.get("started", ""),
+            updated=worklog.get("updated", ""),
+            seconds=worklog["timeSpentSeconds"],
+            comment=extract_comment(worklog.get("comment"))
+        )
+
+    def to_dict(self, time_zone: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "worklogId": self.worklog_id,
+            "comment": self.comment,
+            "timeSpentSeconds": self.seconds,
+            "timeSpentFormatted": format_seconds(self.seconds),
+            "started": self.started,
+            "startedDate": _format_started_date(self.started, time_zone),
+            "startedTime": _format_started_time(self.started, time_zone),
+            "updated": self.updated,
+            "updatedFormatted": _format_updated(self.updated, time_zone),
+            "author": self.author.to_dict()
+        }
+
+
+class IssueDay:
+    """An issue's worklogs on one day."""
+    __slots__ = ("issue", "worklogs", "seconds")
+
+    def __init__(self, issue: IssueRecord, worklogs: Optional[List[WorklogEntry]] = None, seconds: int = 0):
+        self.issue = issue
+        self.worklogs = worklogs if worklogs is not None else []
+        self.seconds = seconds
+
+    def to_dict(self, time_zone: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            **self.issue.to_dict(),
+            "worklogSummary": {
+                "totalTimeSpentSeconds": self.seconds,
+                "totalTimeSpentFormatted": format_seconds(self.seconds)
+            },
+            "worklogs": [worklog.to_dict(time_zone) for worklog in self.worklogs]
+        }
+
+
+class DaySummary:
+    """All worklogs on one day, grouped by issue in first-seen order."""
+    __slots__ = ("work_date", "issues", "seconds")
+
+    def __init__(self, work_date: str, issues: Optional[Dict[str, IssueDay]] = None, seconds: int = 0):
+        self.work_date = work_date
+        self.issues = issues if issues is not None else {}
+        self.seconds = seconds
+
+    def add(self, issue: IssueRecord, worklog: WorklogEntry) -> None:
+        issue_day = self.issues.get(issue.key)
+        if issue_day is None:
+            issue_day = self.issues[issue.key] = IssueDay(issue)
+        issue_day.worklogs.append(worklog)
+        issue_day.seconds += worklog.seconds
+        self.seconds += worklog.seconds
+
+    def to_dict(self, time_zone: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "workDate": self.work_date,
+            "workDateFormatted": format_date(self.work_date),
+            "daySummary": {
+                "totalTimeSpentSeconds": self.seconds,
+                "totalTimeSpentFormatted": format_seconds(self.seconds)
+            },
+            "issues": [issue_day.to_dict(time_zone) for issue_day in self.issues.values()]
+        }
+
+
+class WorklogSummary:
+    """A worklog summary: days in date order.
+
+    ``failed_issues`` lists the keys of issues whose worklogs could not be
+    fetched, so the totals leave them out; ``retry_job_id`` names the
+    background job refetching them, if one was started.
+    """
+    __slots__ = ("days", "failed_issues", "retry_job_id")
+
+    def __init__(
+        self,
+        days: Optional[List[DaySummary]] = None,
+        failed_issues: Optional[List[str]] = None,
+        retry_job_id: Optional[str] = None
+    ):
+        self.days = days if days is not None else []
+        self.failed_issues = failed_issues if failed_issues is not None else []
+        self.retry_job_id = retry_job_id
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def to_dicts(self, time_zone: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the JSON-ready summary; a fresh structure on every call.
+
+        Worklog times are shown in ``time_zone`` (an IANA name) when given,
+        otherwise in the offset they were recorded with.
+        """
+        return list(self.iter_dicts(time_zone))
+
+    def iter_dicts(self, time_zone: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield the JSON-ready day objects one at a time, for streaming."""
+        for day in self.days:
+            yield day.to_dict(time_zone)
+
+    def iter_rows(self, time_zone: Optional[str] = None) -> Iterator[Tuple[Any, ...]]:
+        """Yield one flat row per worklog, in ``EXPORT_COLUMNS`` order.
+
+        Rows are built straight from the records, without the nested dicts.
+        """
+        for day in self.days:
+            for issue_day in day.issues.values():
+                issue = issue_day.issue
+                for worklog in issue_day.worklogs:
+                    yield (
+                        day.work_date,
+                        issue.key,
+                        issue.summary,
+                        issue.project,
+                        issue.issue_type,
+                        issue.status,
+                        worklog.worklog_id,
+                        worklog.author.account_id,
+                        worklog.author.display_name,
+                        worklog.started,
+                        _format_started_time(worklog.started, time_zone),
+                        worklog.seconds,
+                        round(worklog.seconds / SECONDS_PER_HOUR, 2),
+                        worklog.comment
+                    )
+
+
+@dataclass
+class MemberSummary:
+    """One team member's worklog summary."""
+    __slots__ = ("author", "summary")
+
+    author: Author
+    summary: WorklogSummary
+
+    @property
+    def seconds(self) -> int:
+        return sum(day.seconds for day in self.summary.days)
+
+    def to_dict(self, time_zone: Optional[str] = None) -> Dict[str, Any]:
+        seconds = self.seconds
+        return {
+            **self.author.to_dict(),
+            "totalTimeSpentSeconds": seconds,
+            "totalTimeSpentFormatted": format_seconds(seconds),
+            "days": self.summary.to_dicts(time_zone)
+        }
+
+
+class TeamSummary:
+    """Worklog summaries of several accounts, one per member in request order.
+
+    ``failed_issues`` and ``retry_job_id`` are as for ``WorklogSummary``.
+    """
+    __slots__ = ("members", "failed_issues", "retry_job_id")
+
+    def __init__(
+        self,
+        members: Optional[List[MemberSummary]] = None,
+        failed_issues: Optional[List[str]] = None,
+        retry_job_id: Optional[str] = None
+    ):
+        self.members = members if members is not None else []
+        self.failed_issues = failed_issues if failed_issues is not None else []
+        self.retry_job_id = retry_job_id
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def to_dicts(self, time_zone: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the JSON-ready team summary; see ``WorklogSummary.to_dicts``."""
+        return list(self.iter_dicts(time_zone))
+
+    def iter_dicts(self, time_zone: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield the JSON-ready member objects one at a time, for streaming."""
+        for member in self.members:
+            yield member.to_dict(time_zone)
+
+    def iter_rows(self, time_zone: Optional[str] = None) -> Iterator[Tuple[Any, ...]]:
+        """Yield every member's rows in turn; see ``WorklogSummary.iter_rows``."""
+        for member in self.members:
+            yield from member.summary.iter_rows(time_zone)
+
+
+def _format_started_date(started: str, time_zone: Optional[str]) -> str:
+    if time_zone and len(started) >= 19:
+        return format_jira_timestamp(started, DATE_FORMAT, time_zone) or started[:10]
+    return started[:10]
+
+
+def _format_started_time(started: str, time_zone: Optional[str]) -> str:
+    if len(started) < 19:
+        return ""
+    return format_jira_timestamp(started, TIME_FORMAT_DISPLAY, time_zone) or started[11:16]
+
+
+def _format_updated(updated: str, time_zone: Optional[str]) -> str:
+    if not updated:
+        return ""
+    formatted = format_jira_timestamp(updated, DATETIME_FORMAT_DISPLAY, time_zone)
+    if formatted is None:
+        return updated[:16] if len(updated) > 16 else updated
+    return formatted
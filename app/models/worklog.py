@@ -2,7 +2,7 @@
 
 from pydantic import BaseModel, Field, field_validator
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
 from app.core.validators import validate_date_range
 
@@ -14,6 +14,9 @@ class WorklogRequest(BaseModel):
         accountId: Optional Jira account ID. If not provided, uses authenticated user's ID.
         startDate: Start date for worklog query (inclusive).
         endDate: End date for worklog query (inclusive).
+        projectKeys: Optional project keys to restrict the summary to.
+        issueTypes: Optional issue type names to restrict the summary to.
+        forceRefresh: Bypass the local worklog cache and resync from Jira.
     """
     
     accountId: Optional[str] = Field(
@@ -26,6 +29,18 @@ class WorklogRequest(BaseModel):
     endDate: date = Field(
         description="End date for worklog query (inclusive)"
     )
+    projectKeys: Optional[List[str]] = Field(
+        default=None,
+        description="Only include issues from these project keys."
+    )
+    issueTypes: Optional[List[str]] = Field(
+        default=None,
+        description="Only include issues of these issue types."
+    )
+    forceRefresh: bool = Field(
+        default=False,
+        description="Resync cached worklogs from Jira before building the summary."
+    )
     
     @field_validator("endDate")
     @classmethod
@@ -43,3 +58,80 @@ class WorklogRequest(BaseModel):
                 "endDate": "2026-01-31"
             }
         }
+
+
+class WorklogRollupRequest(WorklogRequest):
+    """Request model for worklog rollups.
+
+    Attributes:
+        groupBy: Dimensions to sum time spent by, in output order. Any of
+            day, week, month, issue, project, author and status.
+    """
+
+    groupBy: List[str] = Field(
+        default_factory=lambda: ["day"],
+        description="Dimensions to group by: day, week, month, issue, project, author, status."
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "startDate": "2026-01-01",
+                "endDate": "2026-01-31",
+                "groupBy": ["week", "project"]
+            }
+        }
+
+
+class TeamWorklogRequest(BaseModel):
+    """Request model for team worklog summaries.
+
+    Attributes:
+        accountIds: Jira account IDs of the team members.
+        group: Name of a Jira group whose members form the team; use either
+            this or ``accountIds``.
+        startDate: Start date for worklog query (inclusive).
+        endDate: End date for worklog query (inclusive).
+        projectKeys: Optional project keys to restrict the summary to.
+        issueTypes: Optional issue type names to restrict the summary to.
+    """
+
+    accountIds: Optional[List[str]] = Field(
+        default=None,
+        description="Jira account IDs of the team members."
+    )
+    group: Optional[str] = Field(
+        default=None,
+        description="Jira group whose members form the team, instead of accountIds."
+    )
+    startDate: date = Field(
+        description="Start date for worklog query (inclusive)"
+    )
+    endDate: date = Field(
+        description="End date for worklog query (inclusive)"
+    )
+    projectKeys: Optional[List[str]] = Field(
+        default=None,
+        description="Only include issues from these project keys."
+    )
+    issueTypes: Optional[List[str]] = Field(
+        default=None,
+        description="Only include issues of these issue types."
+    )
+
+    @field_validator("endDate")
+    @classmethod
+    def validate_date_range(cls, v, info):
+        """Validate that endDate is after or equal to startDate."""
+        if "startDate" in info.data:
+            validate_date_range(str(info.data["startDate"]), str(v))
+        return v
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "accountIds": ["557058:abc123", "557058:def456"],
+                "startDate": "2026-01-01",
+                "endDate": "2026-01-31"
+            }
+        }
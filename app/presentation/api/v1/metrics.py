@@ -0,0 +1,28 @@
+"""Runtime metrics endpoint."""
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import RedirectResponse
+
+from app.core.auth import get_auth_cache_stats
+from app.core.container import Container
+from app.core.constants import API_TAGS, ROUTES
+from app.core.dependencies import get_current_user, AuthenticatedUser
+from app.core.exceptions import AuthenticationError
+
+router = APIRouter(tags=[API_TAGS["METRICS"]])
+
+
+@router.get(ROUTES["API_METRICS"], description="Jira rate limit budget, cache and request coalescing counters")
+def get_metrics(user: AuthenticatedUser = Depends(get_current_user)):
+    """Return process-wide counters to a signed-in user; no user data is included."""
+    if isinstance(user, RedirectResponse):
+        raise AuthenticationError("Not authenticated")
+    return {
+        "jiraRateLimit": Container.get_rate_limiter().stats(),
+        "issueCache": Container.get_issue_cache().stats(),
+        "summaryCache": Container.get_summary_cache().stats(),
+        "uiSummaryCache": Container.get_ui_summary_cache().stats(),
+        "authCache": get_auth_cache_stats(),
+        "summaryJobs": Container.get_summary_jobs().stats(),
+        "singleFlight": Container.get_async_single_flight().stats()
+    }
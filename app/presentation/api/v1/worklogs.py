@@ -1,82 +1,272 @@
 """Worklog API endpoints."""
 
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import RedirectResponse
+from typing import Awaitable, Dict, Literal, Optional, TypeVar, Union
 
-from app.models.worklog import WorklogRequest
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import JSONResponse, RedirectResponse, Response, StreamingResponse
+
+from app.models.worklog import TeamWorklogRequest, WorklogRequest, WorklogRollupRequest
 from app.core.dependencies import get_current_user, AuthenticatedUser
 from app.core.container import Container
 from app.core.error_handler import handle_exceptions
-from app.core.exceptions import AuthenticationError, ExternalServiceError, ServiceError
-from app.core.session import get_refresh_token, set_access_token, set_refresh_token
-from app.core.auth import refresh_access_token
+from app.core.exceptions import AuthenticationError, ExternalServiceError, NotFoundError, ServiceError
+from app.core.credentials import SessionCredentials
+from app.core.jobs import JOB_COMPLETE
 from app.core.logging import get_logger
-from app.core.constants import API_TAGS
-from app.domain.interfaces import IWorklogService
+from app.core.constants import (
+    API_TAGS,
+    NDJSON_MEDIA_TYPE,
+    ROUTES,
+    SUMMARY_FAILED_ISSUES_HEADER_LIMIT,
+    SUMMARY_JOB_MAX_WAIT_SECONDS
+)
+from app.domain.interfaces import IAsyncWorklogService
+from app.models.summary import EXPORT_COLUMNS, TeamSummary, WorklogSummary
+from app.utils.export import EXPORT_FORMATS, iter_export, validate_export_format
+from app.utils.helpers import iter_json_array, iter_ndjson
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 router = APIRouter(prefix="/api/v1/jira-worklogs", tags=[API_TAGS["WORKLOGS"]])
 
 
 def get_worklog_service(
+    http_request: Request,
     user: AuthenticatedUser = Depends(get_current_user)
-) -> IWorklogService:
-    """Dependency to get worklog service for authenticated user."""
+) -> IAsyncWorklogService:
+    """Dependency to get worklog service for authenticated user.
+
+    Jira calls rejected with 401 are retried with a token refreshed through
+    the session, so a token expiring mid-fetch keeps the work already done.
+    """
     if isinstance(user, RedirectResponse):
         raise AuthenticationError("Not authenticated")
-    return Container.get_worklog_service_for_user(user)
+    return Container.get_async_worklog_service_for_user(
+        user,
+        credentials=SessionCredentials(http_request, user.access_token)
+    )
+
+
+async def _unless_unauthorized(call: Awaitable[T]) -> T:
+    """Await a service call, reporting a token Jira still rejects as an expired session."""
+    try:
+        return await call
+    except (ExternalServiceError, ServiceError) as e:
+        if getattr(e, 'status_code', None) != 401:
+            raise
+        logger.warning("Jira rejected the session token", exc_info=e)
+        raise AuthenticationError("Session expired. Please login again.")
+
+
+def _status_headers(summary: Union[WorklogSummary, TeamSummary]) -> Dict[str, str]:
+    """Report the issues left out of a summary, and the job completing it, as headers."""
+    headers = {"X-Worklog-Status": "partial" if summary.failed_issues else "complete"}
+    if summary.failed_issues:
+        headers["X-Worklog-Failed-Issue-Count"] = str(len(summary.failed_issues))
+        headers["X-Worklog-Failed-Issues"] = ",".join(summary.failed_issues[:SUMMARY_FAILED_ISSUES_HEADER_LIMIT])
+    if summary.retry_job_id:
+        headers["X-Worklog-Retry-Job"] = f"{ROUTES['API_WORKLOGS_JOBS']}/{summary.retry_job_id}"
+    return headers
+
+
+def _summary_response(
+    summary: Union[WorklogSummary, TeamSummary],
+    stream: Optional[str],
+    time_zone: Optional[str]
+) -> Response:
+    """Encode a summary as requested, with its fetch status in the headers."""
+    headers = _status_headers(summary)
+    if stream == "ndjson":
+        return StreamingResponse(iter_ndjson(summary.iter_dicts(time_zone)), media_type=NDJSON_MEDIA_TYPE, headers=headers)
+    if stream == "json":
+        return StreamingResponse(iter_json_array(summary.iter_dicts(time_zone)), media_type="application/json", headers=headers)
+    return JSONResponse(summary.to_dicts(time_zone), headers=headers)
+
+
+def _export_response(
+    summary: Union[WorklogSummary, TeamSummary],
+    export_format: str,
+    time_zone: Optional[str],
+    filename: str
+) -> StreamingResponse:
+    """Stream a summary as a file of flat worklog rows, with its fetch status in the headers."""
+    media_type, extension = EXPORT_FORMATS[export_format]
+    body = iter_export(summary.iter_rows(time_zone), EXPORT_COLUMNS, export_format)
+    headers = _status_headers(summary)
+    headers["Content-Disposition"] = f'attachment; filename="{filename}.{extension}"'
+    return StreamingResponse(body, media_type=media_type, headers=headers)
 
 
 @router.post("/summary", description="Fetch worklog summary for authenticated user")
 @handle_exceptions
-def get_summary(
-    http_request: Request,
+async def get_summary(
     request: WorklogRequest,
-    service: IWorklogService = Depends(get_worklog_service),
+    stream: Optional[Literal["json", "ndjson"]] = Query(
+        default=None,
+        description="Stream the days as they are encoded: as one JSON array, or as one NDJSON line per day."
+    ),
+    service: IAsyncWorklogService = Depends(get_worklog_service),
     user: AuthenticatedUser = Depends(get_current_user)
 ):
     """Fetch and summarize Jira work logs for a user within a date range."""
     if isinstance(user, RedirectResponse):
         raise AuthenticationError("Not authenticated")
 
-    account_id = request.accountId or user.account_id
-    
-    try:
-        return service.get_worklog_summary(
-            account_id=account_id,
-            start_date=str(request.startDate),
-            end_date=str(request.endDate)
-        )
-    except (ExternalServiceError, ServiceError) as e:
-        if getattr(e, 'status_code', None) == 401:
-            refresh_token = get_refresh_token(http_request)
-            if not refresh_token:
-                raise AuthenticationError("Session expired. Please login again.")
-            
-            try:
-                new_tokens = refresh_access_token(refresh_token)
-                set_access_token(http_request, new_tokens["access_token"])
-                if "refresh_token" in new_tokens:
-                    set_refresh_token(http_request, new_tokens["refresh_token"])
-                
-                updated_user = AuthenticatedUser(
-                    account_id=user.account_id,
-                    display_name=user.display_name,
-                    email=user.email,
-                    access_token=new_tokens["access_token"],
-                    cloud_id=user.cloud_id
-                )
-                
-                service = Container.get_worklog_service_for_user(updated_user)
-                logger.info("Token refreshed and request retried successfully")
-                return service.get_worklog_summary(
-                    account_id=account_id,
-                    start_date=str(request.startDate),
-                    end_date=str(request.endDate)
-                )
-            except Exception as refresh_error:
-                logger.error("Token refresh failed", exc_info=refresh_error)
-                raise AuthenticationError("Session expired. Please login again.")
-        else:
-            raise
+    summary = await _unless_unauthorized(service.get_worklog_summary(
+        account_id=request.accountId or user.account_id,
+        start_date=str(request.startDate),
+        end_date=str(request.endDate),
+        project_keys=request.projectKeys,
+        issue_types=request.issueTypes,
+        force_refresh=request.forceRefresh
+    ))
+    return _summary_response(summary, stream, user.time_zone)
+
+
+@router.post("/summary/export", description="Export the worklog summary as CSV, XLSX or Parquet rows")
+@handle_exceptions
+async def export_summary(
+    request: WorklogRequest,
+    export_format: Literal["csv", "xlsx", "parquet"] = Query(
+        default="csv",
+        alias="format",
+        description="File format; XLSX needs the xlsxwriter package and Parquet the pyarrow package."
+    ),
+    service: IAsyncWorklogService = Depends(get_worklog_service),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """Export a user's Jira work logs within a date range, one row per worklog."""
+    if isinstance(user, RedirectResponse):
+        raise AuthenticationError("Not authenticated")
+    # Checked before fetching, so an export that cannot be written costs no Jira calls.
+    validate_export_format(export_format)
+
+    summary = await _unless_unauthorized(service.get_worklog_summary(
+        account_id=request.accountId or user.account_id,
+        start_date=str(request.startDate),
+        end_date=str(request.endDate),
+        project_keys=request.projectKeys,
+        issue_types=request.issueTypes,
+        force_refresh=request.forceRefresh
+    ))
+    return _export_response(summary, export_format, user.time_zone, f"worklogs-{request.startDate}-{request.endDate}")
+
+
+@router.post("/rollup", description="Sum worklog time by day, week, month, issue, project, author or status")
+@handle_exceptions
+async def get_rollup(
+    request: WorklogRollupRequest,
+    service: IAsyncWorklogService = Depends(get_worklog_service),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """Sum a user's Jira work logs within a date range by the requested dimensions."""
+    if isinstance(user, RedirectResponse):
+        raise AuthenticationError("Not authenticated")
+
+    return await _unless_unauthorized(service.get_worklog_rollup(
+        group_by=request.groupBy,
+        account_id=request.accountId or user.account_id,
+        start_date=str(request.startDate),
+        end_date=str(request.endDate),
+        project_keys=request.projectKeys,
+        issue_types=request.issueTypes,
+        force_refresh=request.forceRefresh
+    ))
+
+
+@router.post("/team-summary", description="Fetch worklog summaries for several accounts or a Jira group")
+@handle_exceptions
+async def get_team_summary(
+    request: TeamWorklogRequest,
+    stream: Optional[Literal["json", "ndjson"]] = Query(
+        default=None,
+        description="Stream the members as they are encoded: as one JSON array, or as one NDJSON line per member."
+    ),
+    service: IAsyncWorklogService = Depends(get_worklog_service),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """Summarize the Jira work logs of a team within a date range, per member."""
+    if isinstance(user, RedirectResponse):
+        raise AuthenticationError("Not authenticated")
+
+    team = await _unless_unauthorized(service.get_team_summary(
+        start_date=str(request.startDate),
+        end_date=str(request.endDate),
+        account_ids=request.accountIds,
+        group_name=request.group,
+        project_keys=request.projectKeys,
+        issue_types=request.issueTypes
+    ))
+    return _summary_response(team, stream, user.time_zone)
+
+
+@router.post("/team-summary/export", description="Export team worklog summaries as CSV, XLSX or Parquet rows")
+@handle_exceptions
+async def export_team_summary(
+    request: TeamWorklogRequest,
+    export_format: Literal["csv", "xlsx", "parquet"] = Query(
+        default="csv",
+        alias="format",
+        description="File format; XLSX needs the xlsxwriter package and Parquet the pyarrow package."
+    ),
+    service: IAsyncWorklogService = Depends(get_worklog_service),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """Export the Jira work logs of a team within a date range, one row per worklog, member by member."""
+    if isinstance(user, RedirectResponse):
+        raise AuthenticationError("Not authenticated")
+    # Checked before fetching, so an export that cannot be written costs no Jira calls.
+    validate_export_format(export_format)
+
+    team = await _unless_unauthorized(service.get_team_summary(
+        start_date=str(request.startDate),
+        end_date=str(request.endDate),
+        account_ids=request.accountIds,
+        group_name=request.group,
+        project_keys=request.projectKeys,
+        issue_types=request.issueTypes
+    ))
+    return _export_response(team, export_format, user.time_zone, f"team-worklogs-{request.startDate}-{request.endDate}")
+
+
+@router.get("/jobs/{job_id}", description="Poll or stream the summary completed by a background retry")
+@handle_exceptions
+async def get_summary_job(
+    job_id: str,
+    wait: float = Query(
+        default=0,
+        ge=0,
+        le=SUMMARY_JOB_MAX_WAIT_SECONDS,
+        description="Seconds to wait for the job to finish before answering."
+    ),
+    stream: Optional[Literal["json", "ndjson"]] = Query(
+        default=None,
+        description="Once the job has completed, return its summary encoded like the summary endpoints do."
+    ),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """Report a retry job's progress per issue, and its summary once complete.
+
+    Answers 202 while the job is running and 200 once it has finished.
+    """
+    if isinstance(user, RedirectResponse):
+        raise AuthenticationError("Not authenticated")
+
+    jobs = Container.get_summary_jobs()
+    job = jobs.get(job_id, owner=(user.cloud_id, user.account_id))
+    if job is None:
+        raise NotFoundError("Summary job not found or expired", details={"jobId": job_id})
+
+    await jobs.wait(job, wait)
+    if stream and job.status == JOB_COMPLETE:
+        return _summary_response(job.result, stream, user.time_zone)
+
+    body = {"jobId": job.id, "status": job.status, "issues": job.progress.get("issues", {})}
+    if job.status == JOB_COMPLETE:
+        body["failedIssues"] = job.result.failed_issues
+        body["result"] = job.result.to_dicts(user.time_zone)
+    if job.error:
+        body["error"] = job.error
+    return JSONResponse(body, status_code=200 if job.done else 202)
@@ -3,15 +3,12 @@
 import secrets
 from fastapi import APIRouter, Request, Depends
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
 
 from app.core.auth import get_authorization_url, exchange_code_for_tokens, get_user_info
 from app.core.exceptions import ValidationError, AuthenticationError, ExternalServiceError
 from app.core.logging import get_logger
 from app.core.session import (
-    set_access_token,
-    set_refresh_token,
+    set_tokens,
     set_user_info,
     clear_session,
     get_session_data,
@@ -19,12 +16,12 @@ from app.core.session import (
 )
 from app.core.dependencies import get_current_user, AuthenticatedUser
 from app.core.constants import API_TAGS, ROUTES
+from app.core.templates import get_templates
 
 router = APIRouter()
-BASE_DIR = Path(__file__).resolve().parents[3]
 logger = get_logger(__name__)
 
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+templates = get_templates()
 
 
 @router.get(ROUTES["AUTH_LOGIN"], tags=[API_TAGS["AUTH"]])
@@ -60,14 +57,11 @@ def callback(request: Request, code: str = None, state: str = None, error: str =
     try:
         tokens = exchange_code_for_tokens(code)
         access_token = tokens.get("access_token")
-        refresh_token = tokens.get("refresh_token")
         
         if not access_token:
             raise ValidationError("No access token received")
         
-        set_access_token(request, access_token)
-        if refresh_token:
-            set_refresh_token(request, refresh_token)
+        set_tokens(request, tokens)
         
         try:
             user_info = get_user_info(access_token)
@@ -1,33 +1,25 @@
 """Worklog UI routes."""
 
-from pathlib import Path
 from datetime import date, timedelta
 from fastapi import APIRouter, Request, Form, Depends
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
-from typing import Union, Optional
+from typing import Any, Awaitable, Dict, List, Tuple, Union, Optional
 
 from app.core.dependencies import get_current_user, AuthenticatedUser
-from app.core.session import (
-    get_user_info,
-    get_refresh_token,
-    set_access_token,
-    set_refresh_token
-)
-from app.core.auth import refresh_access_token
+from app.core.session import get_user_info
 from app.core.container import Container
-from app.core.exceptions import AuthenticationError, ExternalServiceError, ServiceError
+from app.core.credentials import SessionCredentials
 from app.core.validators import validate_date_range
 from app.core.constants import API_TAGS, ROUTES
 from app.core.logging import get_logger
-from app.domain.interfaces import IWorklogService
+from app.core.templates import get_templates
+from app.domain.interfaces import IAsyncWorklogService
+from app.models.summary import WorklogSummary
 
 logger = get_logger(__name__)
 
 router = APIRouter()
-BASE_DIR = Path(__file__).resolve().parents[3]
-directory = BASE_DIR / "templates"
-templates = Jinja2Templates(directory=str(directory))
+templates = get_templates()
 
 
 def _build_user_context(user: AuthenticatedUser, request: Request) -> dict:
@@ -43,15 +35,6 @@ def _build_user_context(user: AuthenticatedUser, request: Request) -> dict:
     }
 
 
-def get_worklog_service(
-    user: AuthenticatedUser = Depends(get_current_user)
-) -> IWorklogService:
-    """Dependency to get worklog service for authenticated user."""
-    if isinstance(user, RedirectResponse):
-        raise AuthenticationError("Not authenticated")
-    return Container.get_worklog_service_for_user(user)
-
-
 def _get_current_week_dates():
     """Calculate current week start (Monday) and end (Sunday) dates."""
     today = date.today()
@@ -61,60 +44,63 @@ def _get_current_week_dates():
     return start_of_week.isoformat(), end_of_week.isoformat()
 
 
+def _peek_week_summary(
+    service: IAsyncWorklogService,
+    user: AuthenticatedUser,
+    start_date: str,
+    end_date: str
+) -> Tuple[Optional[List[Dict[str, Any]]], bool]:
+    """Return the user's cached summary for the week, if any, and whether it is fresh.
+
+    Never waits for Jira: a missing or stale summary is refreshed in the
+    background, sharing its fetch with the page's own request for the data.
+    Partial summaries are not cached, so the page never shows a week with
+    issues missing as if it were complete.
+    """
+    def fetch() -> Awaitable[WorklogSummary]:
+        return service.get_worklog_summary(
+            account_id=user.account_id,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+    key = (user.cloud_id, user.account_id, start_date, end_date, user.time_zone)
+    summary, fresh = Container.get_ui_summary_cache().peek(
+        key,
+        fetch,
+        cacheable=lambda summary: not summary.failed_issues
+    )
+    return (summary.to_dicts(user.time_zone) if summary is not None else None), fresh
+
+
 @router.get(ROUTES["UI_WORKLOGS"], tags=[API_TAGS["UI"]])
-def worklog_form(
+async def worklog_form(
     request: Request,
     user: Union[AuthenticatedUser, RedirectResponse] = Depends(get_current_user)
 ):
+    """Render the page shell for the current week.
+
+    The summary is loaded by the page from the JSON API; a cached copy of the
+    week is embedded so it can be shown before that request completes.
+    """
     if isinstance(user, RedirectResponse):
         return user
-    
+
     start_date, end_date = _get_current_week_dates()
-    data = None
-    
-    service = Container.get_worklog_service_for_user(user)
-    
-    try:
-        data = service.get_worklog_summary(
-            account_id=user.account_id,
-            start_date=start_date,
-            end_date=end_date
-        )
-    except (ExternalServiceError, ServiceError) as e:
-        if getattr(e, 'status_code', None) == 401:
-            refresh_token = get_refresh_token(request)
-            if refresh_token:
-                try:
-                    new_tokens = refresh_access_token(refresh_token)
-                    set_access_token(request, new_tokens["access_token"])
-                    if "refresh_token" in new_tokens:
-                        set_refresh_token(request, new_tokens["refresh_token"])
-                    
-                    updated_user = AuthenticatedUser(
-                        account_id=user.account_id,
-                        display_name=user.display_name,
-                        email=user.email,
-                        access_token=new_tokens["access_token"],
-                        cloud_id=user.cloud_id
-                    )
-                    
-                    service = Container.get_worklog_service_for_user(updated_user)
-                    data = service.get_worklog_summary(
-                        account_id=user.account_id,
-                        start_date=start_date,
-                        end_date=end_date
-                    )
-                    logger.info("Token refreshed and current week data loaded")
-                except Exception as refresh_error:
-                    logger.error("Token refresh failed on page load", exc_info=refresh_error)
-        else:
-            logger.warning("Failed to load current week worklogs on page load", exc_info=e)
-    
+    # The summary may be refreshed after this response is sent; a token refreshed
+    # then reaches the browser with its next request, through the auth layer.
+    service = Container.get_async_worklog_service_for_user(
+        user,
+        credentials=SessionCredentials(request, user.access_token)
+    )
+    data, fresh = _peek_week_summary(service, user, start_date, end_date)
+
     return templates.TemplateResponse(
         "worklog_summary.html",
         {
             "request": request,
             "data": data,
+            "dataFresh": fresh,
             "startDate": start_date,
             "endDate": end_date,
             "user": _build_user_context(user, request)
@@ -123,64 +109,23 @@ def worklog_form(
 
 
 @router.post(ROUTES["UI_WORKLOGS"], tags=[API_TAGS["UI"]])
-def render_worklog_summary(
+async def render_worklog_summary(
     request: Request,
     startDate: str = Form(...),
     endDate: str = Form(...),
     user: Union[AuthenticatedUser, RedirectResponse] = Depends(get_current_user)
 ):
+    """Render the page shell for a submitted date range; the page loads the summary."""
     if isinstance(user, RedirectResponse):
         return user
-    
+
     validate_date_range(startDate, endDate)
 
-    service = Container.get_worklog_service_for_user(user)
-    
-    try:
-        data = service.get_worklog_summary(
-            account_id=user.account_id,
-            start_date=startDate,
-            end_date=endDate
-        )
-    except (ExternalServiceError, ServiceError) as e:
-        if getattr(e, 'status_code', None) == 401:
-            refresh_token = get_refresh_token(request)
-            if not refresh_token:
-                raise AuthenticationError("Session expired. Please login again.")
-            
-            try:
-                new_tokens = refresh_access_token(refresh_token)
-                set_access_token(request, new_tokens["access_token"])
-                if "refresh_token" in new_tokens:
-                    set_refresh_token(request, new_tokens["refresh_token"])
-                
-                updated_user = AuthenticatedUser(
-                    account_id=user.account_id,
-                    display_name=user.display_name,
-                    email=user.email,
-                    access_token=new_tokens["access_token"],
-                    cloud_id=user.cloud_id
-                )
-                
-                service = Container.get_worklog_service_for_user(updated_user)
-                data = service.get_worklog_summary(
-                    account_id=user.account_id,
-                    start_date=startDate,
-                    end_date=endDate
-                )
-                logger.info("Token refreshed and request retried successfully")
-            except Exception as refresh_error:
-                logger.error("Token refresh failed", exc_info=refresh_error)
-                raise AuthenticationError("Session expired. Please login again.")
-        else:
-            raise
-    
     return templates.TemplateResponse(
         "worklog_summary.html",
         {
             "request": request,
-            "data": data,
-            "accountId": user.account_id,
+            "data": None,
             "startDate": startDate,
             "endDate": endDate,
             "user": _build_user_context(user, request)
@@ -1,5 +1,25 @@
 """Utility functions and helpers."""
 
-from app.utils.helpers import extract_comment, format_seconds
+from app.utils.export import EXPORT_FORMATS, iter_export, validate_export_format
+from app.utils.helpers import (
+    build_team_worklog_jql,
+    build_worklog_jql,
+    extract_comment,
+    format_seconds,
+    iter_json_array,
+    iter_ndjson,
+    quote_jql_value
+)
 
-__all__ = ["extract_comment", "format_seconds"]
+__all__ = [
+    "EXPORT_FORMATS",
+    "build_team_worklog_jql",
+    "build_worklog_jql",
+    "extract_comment",
+    "format_seconds",
+    "iter_export",
+    "iter_json_array",
+    "iter_ndjson",
+    "quote_jql_value",
+    "validate_export_format"
+]
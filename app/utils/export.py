@@ -0,0 +1,190 @@
+"""Streaming writers for tabular exports: CSV, XLSX and Parquet.
+
+Each writer turns an iterator of flat rows into an iterator of byte chunks,
+holding at most one chunk of rows in memory. XLSX and Parquet need
+optional packages (``xlsxwriter``, ``pyarrow``), imported only when that
+format is requested.
+"""
+
+import csv
+import importlib
+import io
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, Sequence, Tuple
+
+from app.core.constants import (
+    CSV_MEDIA_TYPE,
+    EXPORT_FILE_CHUNK_BYTES,
+    EXPORT_ROWS_PER_CHUNK,
+    PARQUET_MEDIA_TYPE,
+    XLSX_MAX_ROWS,
+    XLSX_MEDIA_TYPE
+)
+from app.core.exceptions import ValidationError
+
+Columns = Sequence[Tuple[str, type]]
+Row = Sequence[Any]
+
+# Format name: (media type, file extension)
+EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "csv": (CSV_MEDIA_TYPE, "csv"),
+    "xlsx": (XLSX_MEDIA_TYPE, "xlsx"),
+    "parquet": (PARQUET_MEDIA_TYPE, "parquet")
+}
+
+# Package each format other than CSV needs
+_PACKAGES = {"xlsx": "xlsxwriter", "parquet": "pyarrow"}
+
+# Spreadsheets run cells starting with these as formulas
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def validate_export_format(export_format: str) -> None:
+    """Check that ``export_format`` is known and its package can be imported.
+
+    Raises ``ValidationError`` otherwise, so callers can reject an export
+    before doing the work of building its rows.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValidationError(
+            message=f"format must be one of: {', '.join(EXPORT_FORMATS)}",
+            details={"format": export_format}
+        )
+    package = _PACKAGES.get(export_format)
+    if package is None:
+        return
+    try:
+        importlib.import_module(package)
+    except ImportError:
+        raise ValidationError(
+            message=f"{export_format.upper()} export requires the '{package}' package",
+            details={"format": export_format}
+        )
+
+
+def iter_export(rows: Iterable[Row], columns: Columns, export_format: str) -> Iterator[bytes]:
+    """Encode ``rows`` in ``export_format``, a chunk at a time.
+
+    The format is validated before the first chunk is produced, so a missing
+    package is reported as a ``ValidationError`` rather than ending a
+    response that has already started.
+
+    Example:
+        >>> b"".join(iter_export([("a", 1)], [("name", str), ("count", int)], "csv"))
+        b'name,count\\r\\na,1\\r\\n'
+    """
+    validate_export_format(export_format)
+    if export_format == "csv":
+        return _iter_csv(rows, columns)
+    if export_format == "xlsx":
+        return _iter_xlsx(rows, columns)
+    return _iter_parquet(rows, columns)
+
+
+def _iter_csv(rows: Iterable[Row], columns: Columns) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([name for name, _ in columns])
+    for count, row in enumerate(rows, 1):
+        writer.writerow([_neutralize_formula(value) for value in row])
+        if count % EXPORT_ROWS_PER_CHUNK == 0:
+            yield _drain_text(buffer)
+    yield _drain_text(buffer)
+
+
+def _iter_xlsx(rows: Iterable[Row], columns: Columns) -> Iterator[bytes]:
+    import xlsxwriter
+
+    # An XLSX file is a zip archive whose directory is written last, so the
+    # workbook is written to a temporary file in constant-memory mode (rows
+    # are flushed to disk as they are written) and then streamed from it.
+    with tempfile.TemporaryFile(suffix=".xlsx") as file:
+        workbook = xlsxwriter.Workbook(file, {
+            "constant_memory": True,
+            "strings_to_formulas": False,
+            "strings_to_numbers": False,
+            "strings_to_urls": False
+        })
+        header = [name for name, _ in columns]
+        worksheet, row_number = None, XLSX_MAX_ROWS
+        for row in rows:
+            if row_number == XLSX_MAX_ROWS:
+                worksheet, row_number = workbook.add_worksheet(), 1
+                worksheet.write_row(0, 0, header)
+            worksheet.write_row(row_number, 0, row)
+            row_number += 1
+        if worksheet is None:
+            workbook.add_worksheet().write_row(0, 0, header)
+        workbook.close()
+
+        file.seek(0)
+        while chunk := file.read(EXPORT_FILE_CHUNK_BYTES):
+            yield chunk
+
+
+def _iter_parquet(rows: Iterable[Row], columns: Columns) -> Iterator[bytes]:
+    import pyarrow
+    import pyarrow.parquet as parquet
+
+    types = {str: pyarrow.string(), int: pyarrow.int64(), float: pyarrow.float64()}
+    schema = pyarrow.schema([(name, types[column_type]) for name, column_type in columns])
+    sink = _ChunkSink()
+
+    def row_group(chunk):
+        return pyarrow.Table.from_arrays(
+            [pyarrow.array(values, type=field.type) for values, field in zip(zip(*chunk), schema)],
+            schema=schema
+        )
+
+    with parquet.ParquetWriter(sink, schema) as writer:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == EXPORT_ROWS_PER_CHUNK:
+                writer.write_table(row_group(chunk))
+                chunk.clear()
+                yield sink.drain()
+        if chunk:
+            writer.write_table(row_group(chunk))
+    yield sink.drain()
+
+
+class _ChunkSink(io.RawIOBase):
+    """A write-only file handing out what was written since the last drain.
+
+    The position keeps counting across drains; Parquet records offsets.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        chunk = b"".join(self._chunks)
+        self._chunks.clear()
+        return chunk
+
+
+def _drain_text(buffer: io.StringIO) -> bytes:
+    chunk = buffer.getvalue().encode("utf-8")
+    buffer.seek(0)
+    buffer.truncate()
+    return chunk
+
+
+def _neutralize_formula(value: Any) -> Any:
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
@@ -1,6 +1,29 @@
 """Utility functions for formatting and data extraction."""
 
-from app.core.constants import SECONDS_PER_HOUR, SECONDS_PER_MINUTE
+import asyncio
+import contextvars
+import functools
+import json
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # Python 3.8
+    from backports.zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.core.constants import (
+    DATE_FORMAT,
+    DATE_FORMAT_DISPLAY,
+    SECONDS_PER_DAY,
+    SECONDS_PER_HOUR,
+    SECONDS_PER_MINUTE,
+    TIMESTAMP_CACHE_SIZE
+)
+
+T = TypeVar("T")
 
 
 def format_seconds(seconds: int) -> str:
@@ -66,3 +89,371 @@ def extract_comment(comment_obj: dict) -> str:
             if item.get("type") == "text":
                 texts.append(item.get("text", ""))
     return " ".join(texts)
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_jira_timestamp(value: str) -> Optional[datetime]:
+    """Parse a Jira timestamp, memoized per distinct value.
+    
+    Jira sends ISO 8601 timestamps with a ``+0000`` style offset, e.g.
+    ``2026-01-05T10:30:00.000+0530``. ``Z`` and ``+05:30`` style offsets are
+    accepted as well, and the offset is kept on the result.
+    
+    Args:
+        value: Timestamp string from a Jira response.
+        
+    Returns:
+        The parsed datetime, or None if the value is empty or malformed.
+        
+    Example:
+        >>> parse_jira_timestamp("2026-01-05T10:30:00.000+0000").isoformat()
+        '2026-01-05T10:30:00+00:00'
+    """
+    if not value:
+        return None
+    # ``datetime.fromisoformat`` only reads ``+0000`` and ``Z`` from Python
+    # 3.11 on, so the offset is split off and parsed here.
+    local, offset = value, None
+    sign = max(value.rfind("+"), value.rfind("-", 11))
+    if value.endswith("Z"):
+        local, offset = value[:-1], 0
+    elif sign > 10:
+        local, offset = value[:sign], _offset_seconds(value[sign:])
+        if offset is None:
+            return None
+    try:
+        parsed = datetime.fromisoformat(local)
+    except ValueError:
+        return None
+    if offset is None:
+        return parsed
+    return parsed.replace(tzinfo=timezone(timedelta(seconds=offset)))
+
+
+@lru_cache(maxsize=None)
+def get_time_zone(name: Optional[str]) -> Optional[tzinfo]:
+    """Return the IANA time zone called ``name``, or None if it is unset or unknown."""
+    if not name:
+        return None
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def format_jira_timestamp(value: str, fmt: str, time_zone: Optional[str] = None) -> Optional[str]:
+    """Format a Jira timestamp, memoized per value, format and time zone.
+    
+    Args:
+        value: Timestamp string from a Jira response.
+        fmt: ``strftime`` format to render.
+        time_zone: IANA time zone name (e.g. a user's Jira ``timeZone``) to
+            convert to. Without one, or if it is unknown, the time is rendered
+            in the offset it was recorded with.
+        
+    Returns:
+        The formatted timestamp, or None if the value cannot be parsed.
+        
+    Example:
+        >>> format_jira_timestamp("2026-01-05T23:30:00.000+0000", "%d-%m-%Y %H:%M", "Asia/Kolkata")
+        '06-01-2026 05:00'
+    """
+    parsed = parse_jira_timestamp(value)
+    if parsed is None:
+        return None
+    zone = get_time_zone(time_zone)
+    if zone is not None and parsed.tzinfo is not None:
+        parsed = parsed.astimezone(zone)
+    return parsed.strftime(fmt)
+
+
+class UtcOffsetTable:
+    """UTC offsets of a time zone around a date range, for bucketing timestamps by local day.
+    
+    The zone's offset transitions (e.g. daylight saving changes) within the
+    range, padded by a day on each side, are found once when the table is
+    built. Bucketing a timestamp is then a bisect over those few transitions
+    instead of a zoneinfo conversion per timestamp.
+    """
+    
+    def __init__(self, time_zone: tzinfo, start_date: str, end_date: str):
+        start = datetime.strptime(start_date, DATE_FORMAT).replace(tzinfo=timezone.utc) - timedelta(days=1)
+        end = datetime.strptime(end_date, DATE_FORMAT).replace(tzinfo=timezone.utc) + timedelta(days=2)
+        start_ts, end_ts = int(start.timestamp()), int(end.timestamp())
+        
+        self._transitions = [start_ts]
+        self._offsets = [_utc_offset(time_zone, start_ts)]
+        # Zones change offset at most once within an hour, and always on a whole minute.
+        for ts in range(start_ts + SECONDS_PER_HOUR, end_ts + SECONDS_PER_HOUR, SECONDS_PER_HOUR):
+            offset = _utc_offset(time_zone, ts)
+            if offset == self._offsets[-1]:
+                continue
+            before, after = ts - SECONDS_PER_HOUR, ts
+            while after - before > SECONDS_PER_MINUTE:
+                middle = (before + after) // 2 // SECONDS_PER_MINUTE * SECONDS_PER_MINUTE
+                if middle <= before:
+                    middle = before + SECONDS_PER_MINUTE
+                if _utc_offset(time_zone, middle) == self._offsets[-1]:
+                    before = middle
+                else:
+                    after = middle
+            self._transitions.append(after)
+            self._offsets.append(offset)
+        self._dates: Dict[int, str] = {}
+        self._rules: Dict[str, Any] = {}
+    
+    def local_date(self, timestamp: str) -> str:
+        """Return the local ``YYYY-MM-DD`` date of a Jira timestamp.
+        
+        Timestamps without an offset are taken to be local already, and
+        malformed ones fall back to their date prefix.
+        """
+        # Jira's own format, e.g. 2026-01-05T10:30:00.000+0530, goes through a
+        # rule per recorded date and offset: the local date only depends on
+        # whether the clock time is before the point where it crosses midnight.
+        if len(timestamp) == 28 and timestamp[19] == ".":
+            key = timestamp[:10] + timestamp[23:]
+            rule = self._rules.get(key)
+            if rule is None:
+                rule = self._rules[key] = self._day_rule(timestamp[:10], timestamp[23:])
+            if rule:
+                threshold, before, after = rule
+                return before if threshold is None or timestamp[11:19] < threshold else after
+
+        utc_seconds = _utc_seconds(timestamp)
+        if utc_seconds is None:
+            return timestamp[:10]
+        return self._date_label((utc_seconds + self._offset_at(utc_seconds)) // SECONDS_PER_DAY)
+    
+    def _day_rule(self, recorded_date: str, suffix: str):
+        """Return ``(threshold, before, after)`` for a recorded date and offset, or False if there is none.
+        
+        Clock times below ``threshold`` (``HH:MM:SS``) fall on local date
+        ``before``, the rest on ``after``; no threshold means all on ``before``.
+        There is no rule when the zone changes offset during that day.
+        """
+        days, offset = _epoch_days(recorded_date), _offset_seconds(suffix)
+        if days is None or offset is None:
+            return False
+        first = days * SECONDS_PER_DAY - offset
+        local_offset = self._offset_at(first)
+        if self._offset_at(first + SECONDS_PER_DAY - 1) != local_offset:
+            return False
+        shift = local_offset - offset
+        if shift == 0:
+            return None, self._date_label(days), None
+        if shift < 0 and -shift < SECONDS_PER_DAY:
+            return _clock(-shift), self._date_label(days - 1), self._date_label(days)
+        if 0 < shift < SECONDS_PER_DAY:
+            return _clock(SECONDS_PER_DAY - shift), self._date_label(days), self._date_label(days + 1)
+        return False
+    
+    def _offset_at(self, utc_seconds: int) -> int:
+        return self._offsets[max(0, bisect_right(self._transitions, utc_seconds) - 1)]
+    
+    def _date_label(self, day: int) -> str:
+        label = self._dates.get(day)
+        if label is None:
+            label = self._dates[day] = date.fromordinal(_EPOCH_ORDINAL + day).isoformat()
+        return label
+
+
+def _clock(seconds: int) -> str:
+    return f"{seconds // SECONDS_PER_HOUR:02d}:{seconds % SECONDS_PER_HOUR // SECONDS_PER_MINUTE:02d}:{seconds % SECONDS_PER_MINUTE:02d}"
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _utc_offset(time_zone: tzinfo, ts: int) -> int:
+    return int(datetime.fromtimestamp(ts, time_zone).utcoffset().total_seconds())
+
+
+def _utc_seconds(timestamp: str) -> Optional[int]:
+    """Return epoch seconds of an offset-qualified ``YYYY-MM-DDTHH:MM:SS[.fff]±HHMM`` timestamp.
+    
+    Reads the fields straight from the string; this runs once per worklog,
+    where building a datetime would dominate the cost of bucketing.
+    """
+    if len(timestamp) < 20 or timestamp[10] != "T":
+        return None
+    days = _epoch_days(timestamp[:10])
+    offset = _offset_seconds(timestamp[19:].lstrip(".0123456789") if timestamp[19] == "." else timestamp[19:])
+    if days is None or offset is None:
+        return None
+    try:
+        clock = int(timestamp[11:13]) * SECONDS_PER_HOUR + int(timestamp[14:16]) * SECONDS_PER_MINUTE + int(timestamp[17:19])
+    except ValueError:
+        return None
+    return days * SECONDS_PER_DAY + clock - offset
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _epoch_days(value: str) -> Optional[int]:
+    try:
+        return date.fromisoformat(value).toordinal() - _EPOCH_ORDINAL
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _offset_seconds(suffix: str) -> Optional[int]:
+    """Return the offset of a ``Z``, ``±HHMM`` or ``±HH:MM`` suffix, or None if it is not one."""
+    if suffix == "Z":
+        return 0
+    if len(suffix) not in (5, 6) or suffix[0] not in "+-":
+        return None
+    digits = suffix[1:].replace(":", "")
+    if len(digits) != 4 or not digits.isdigit():
+        return None
+    offset = int(digits[:2]) * SECONDS_PER_HOUR + int(digits[2:]) * SECONDS_PER_MINUTE
+    return -offset if suffix[0] == "-" else offset
+
+
+@lru_cache(maxsize=256)
+def get_offset_table(time_zone: str, start_date: str, end_date: str) -> Optional[UtcOffsetTable]:
+    """Return the shared offset table of a named time zone for a date range, or None if the zone is unknown."""
+    zone = get_time_zone(time_zone)
+    return UtcOffsetTable(zone, start_date, end_date) if zone is not None else None
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def format_date(value: str, fmt: str = DATE_FORMAT_DISPLAY) -> str:
+    """Reformat a ``YYYY-MM-DD`` date, memoized per value and format.
+    
+    Example:
+        >>> format_date("2026-01-05")
+        '05-01-2026'
+    """
+    return datetime.strptime(value, DATE_FORMAT).strftime(fmt)
+
+
+def quote_jql_value(value: str) -> str:
+    """Quote a value for safe use as a JQL string literal.
+    
+    Backslashes and double quotes are escaped so user-supplied values cannot
+    terminate the literal and inject additional JQL clauses.
+    
+    Args:
+        value: Raw value to quote.
+        
+    Returns:
+        Double-quoted JQL string literal.
+        
+    Example:
+        >>> quote_jql_value('Team "A"')
+        '"Team \\\\"A\\\\""'
+    """
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def build_worklog_jql(
+    account_id: str,
+    start_date: str,
+    end_date: str,
+    project_keys: Optional[List[str]] = None,
+    issue_types: Optional[List[str]] = None
+) -> str:
+    """Build the JQL selecting issues a user logged time on within a date range.
+    
+    Args:
+        account_id: Jira account ID of the worklog author.
+        start_date: Start date (YYYY-MM-DD), inclusive.
+        end_date: End date (YYYY-MM-DD), inclusive.
+        project_keys: Optional project keys to restrict the search to.
+        issue_types: Optional issue type names to restrict the search to.
+        
+    Returns:
+        JQL query string.
+        
+    Example:
+        >>> build_worklog_jql("557058:abc", "2026-01-01", "2026-01-31", project_keys=["PROJ"])
+        'worklogAuthor = "557058:abc" AND worklogDate >= "2026-01-01" AND worklogDate <= "2026-01-31" AND project in ("PROJ")'
+    """
+    return _worklog_jql(f"worklogAuthor = {quote_jql_value(account_id)}", start_date, end_date, project_keys, issue_types)
+
+
+def build_team_worklog_jql(
+    start_date: str,
+    end_date: str,
+    account_ids: Optional[List[str]] = None,
+    group_name: Optional[str] = None,
+    project_keys: Optional[List[str]] = None,
+    issue_types: Optional[List[str]] = None
+) -> str:
+    """Build the JQL selecting issues any of several users logged time on within a date range.
+
+    The authors are either ``account_ids`` or the members of ``group_name``.
+
+    Example:
+        >>> build_team_worklog_jql("2026-01-01", "2026-01-31", group_name="team-a")
+        'worklogAuthor in membersOf("team-a") AND worklogDate >= "2026-01-01" AND worklogDate <= "2026-01-31"'
+    """
+    if group_name is not None:
+        authors = f"worklogAuthor in membersOf({quote_jql_value(group_name)})"
+    else:
+        authors = f"worklogAuthor in ({', '.join(quote_jql_value(account_id) for account_id in account_ids)})"
+    return _worklog_jql(authors, start_date, end_date, project_keys, issue_types)
+
+
+def _worklog_jql(
+    authors: str,
+    start_date: str,
+    end_date: str,
+    project_keys: Optional[List[str]],
+    issue_types: Optional[List[str]]
+) -> str:
+    clauses = [
+        authors,
+        f"worklogDate >= {quote_jql_value(start_date)}",
+        f"worklogDate <= {quote_jql_value(end_date)}"
+    ]
+    if project_keys:
+        clauses.append(f"project in ({', '.join(quote_jql_value(key) for key in project_keys)})")
+    if issue_types:
+        clauses.append(f"issuetype in ({', '.join(quote_jql_value(name) for name in issue_types)})")
+    return " AND ".join(clauses)
+
+
+def _encode_json(value: Any) -> bytes:
+    # Same encoding as FastAPI's JSONResponse, so streamed and buffered bodies match.
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def iter_json_array(items: Iterable[Any]) -> Iterator[bytes]:
+    """Encode items as one JSON array, yielding a chunk per item.
+    
+    Only one item is encoded at a time, so the body never has to be held in
+    memory as a whole.
+    
+    Example:
+        >>> b"".join(iter_json_array([{"a": 1}, {"b": 2}]))
+        b'[{"a":1},{"b":2}]'
+    """
+    separator = b"["
+    for item in items:
+        yield separator + _encode_json(item)
+        separator = b","
+    yield b"]" if separator == b"," else b"[]"
+
+
+def iter_ndjson(items: Iterable[Any]) -> Iterator[bytes]:
+    """Encode items as newline-delimited JSON, one line per item.
+    
+    Example:
+        >>> b"".join(iter_ndjson([{"a": 1}, {"b": 2}]))
+        b'{"a":1}\\n{"b":2}\\n'
+    """
+    for item in items:
+        yield _encode_json(item) + b"\n"
+
+
+async def to_thread(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking call in the default executor, as ``asyncio.to_thread``
+    does on Python 3.9+, carrying over the caller's context variables.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args)
+    return await loop.run_in_executor(None, call)
@@ -0,0 +1,24 @@
+"""Reproducible benchmarks for the performance work in this repository.
+
+Run each one from the repository root, e.g.::
+
+    python -m benchmarks.bench_http_keepalive
+
+They need no Jira site or credentials; placeholder settings are used when
+none are configured.
+"""
+
+import os
+
+for _name, _value in (
+    ("JIRA_DOMAIN", "benchmark.atlassian.net"),
+    ("JIRA_OAUTH_CLIENT_ID", "benchmark"),
+    ("JIRA_OAUTH_CLIENT_SECRET", "benchmark"),
+    ("WORKLOG_CACHE_PATH", ""),
+    ("TEMPLATE_CACHE_PATH", "")
+):
+    os.environ.setdefault(_name, _value)
+
+# ``app.core`` wires the layers together; importing it first lets a benchmark
+# import any single module without tripping over the package import order.
+import app.core  # noqa: E402,F401
@@ -0,0 +1,157 @@
+"""Request latency with and without the shared keep-alive Jira HTTP client.
+
+Serves a small JSON response over HTTPS on loopback, with a throwaway
+self-signed certificate, and times sequential GET requests three ways:
+
+- ``client per request``: a new ``httpx.AsyncClient`` for every request,
+  as the code did before connections were pooled;
+- ``shared, no keep-alive``: one client whose connections are not reused,
+  so each request pays for TCP and TLS setup but not for client setup;
+- ``shared pool``: the client every Jira client uses, from
+  ``Container.get_async_http_client`` with the ``JIRA_HTTP_*`` pool
+  settings of the environment.
+
+Loopback has next to no round-trip time, so these numbers show the CPU
+cost of connection setup only. Against Jira Cloud each new connection
+also costs the TCP and TLS round trips, which makes the gap larger.
+
+    python -m benchmarks.bench_http_keepalive [--requests 300]
+"""
+
+import argparse
+import asyncio
+import datetime
+import ipaddress
+import os
+import socket
+import statistics
+import tempfile
+import threading
+import time
+
+import benchmarks  # noqa: F401  (placeholder settings)
+
+import httpx
+import uvicorn
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from app.core.container import Container
+
+BODY = b'{"values":[],"isLast":true}'
+
+
+async def app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(BODY)).encode())]
+    })
+    await send({"type": "http.response.body", "body": BODY})
+
+
+def write_certificate(directory: str):
+    """Write a self-signed certificate for 127.0.0.1; return (cert path, key path)."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=1))
+        .not_valid_after(now + datetime.timedelta(hours=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as file:
+        file.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as file:
+        file.write(key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        ))
+    return cert_path, key_path
+
+
+def start_server(cert_path: str, key_path: str) -> str:
+    """Start the HTTPS server in a daemon thread; return its base URL."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    config = uvicorn.Config(
+        app,
+        host="127.0.0.1",
+        port=port,
+        log_level="error",
+        ssl_certfile=cert_path,
+        ssl_keyfile=key_path
+    )
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"https://127.0.0.1:{port}"
+
+
+async def time_requests(url: str, count: int, request) -> list:
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        response = await request(url)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def run(url: str, count: int) -> None:
+    async def client_per_request(target):
+        async with httpx.AsyncClient() as client:
+            return await client.get(target)
+
+    unpooled = httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=0))
+    pooled = Container.get_async_http_client()
+    modes = [
+        ("client per request", client_per_request),
+        ("shared, no keep-alive", unpooled.get),
+        ("shared pool", pooled.get)
+    ]
+    try:
+        for _, request in modes:
+            await time_requests(url, 20, request)
+        print(f"{count} sequential GET requests over TLS on loopback")
+        print(f"{'mode':<24}{'p50 ms':>10}{'p95 ms':>10}")
+        for label, request in modes:
+            latencies = sorted(await time_requests(url, count, request))
+            p95 = latencies[int(len(latencies) * 0.95) - 1]
+            print(f"{label:<24}{statistics.median(latencies):>10.2f}{p95:>10.2f}")
+    finally:
+        await unpooled.aclose()
+        await Container.close_async_http_client()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300, help="requests timed per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path, key_path = write_certificate(directory)
+        # httpx trusts SSL_CERT_FILE, so every client below verifies the throwaway certificate.
+        os.environ["SSL_CERT_FILE"] = cert_path
+        url = start_server(cert_path, key_path)
+        asyncio.run(run(url, args.requests))
+
+
+if __name__ == "__main__":
+    main()
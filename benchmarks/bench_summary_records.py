@@ -0,0 +1,192 @@
+"""Memory and build time of a worklog summary: nested dicts versus records.
+
+Builds one user's summary from synthetic Jira issues and worklogs in two
+ways:
+
+- ``nested dicts``: the code used before ``app.models.summary``, where
+  every worklog carried its own author dict and formatted strings and
+  every issue-day a copy of the issue metadata;
+- ``records``: ``WorklogRepositoryBase._summarize``, which builds the
+  slotted records, then ``WorklogSummary.to_dicts`` as the API does when
+  it serializes them.
+
+Memory is what ``tracemalloc`` counts as still allocated while the
+summary is alive, so it excludes the Jira data the summary was built from.
+
+    python -m benchmarks.bench_summary_records [--issues 2000] [--worklogs 50]
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import benchmarks  # noqa: F401  (placeholder settings)
+
+from app.domain.repositories.worklog_repository_base import WorklogRepositoryBase
+from app.utils.helpers import extract_comment, format_seconds
+
+ACCOUNT_ID = "account-0"
+START_DATE, END_DATE = "2026-01-01", "2026-12-31"
+
+
+def make_issues(issue_count: int, worklogs_per_issue: int, seed: int = 7) -> list:
+    """Return ``(issue, worklogs)`` pairs; three in four worklogs are by ``ACCOUNT_ID``."""
+    rng = random.Random(seed)
+    people = [{"accountId": f"account-{n}", "displayName": f"Person {n}"} for n in range(4)]
+    base = datetime(2026, 1, 1)
+    issue_worklogs = []
+    for number in range(issue_count):
+        issue = {
+            "key": f"PROJ-{number}",
+            "fields": {
+                "summary": f"Issue number {number}",
+                "updated": "2026-01-01T00:00:00.000+0000",
+                "reporter": rng.choice(people),
+                "assignee": rng.choice(people),
+                "issuetype": {"name": "Task", "iconUrl": "https://example.invalid/task.png"},
+                "status": {"name": "In Progress", "statusCategory": {"name": "In Progress"}},
+                "priority": {"name": "Medium", "iconUrl": "https://example.invalid/medium.png"},
+                "timeoriginalestimate": 3600 * rng.randrange(1, 40)
+            }
+        }
+        worklogs = []
+        for index in range(worklogs_per_issue):
+            started = base + timedelta(days=rng.randrange(365), minutes=15 * rng.randrange(96))
+            worklogs.append({
+                "id": f"{number}-{index}",
+                "author": people[0] if rng.random() < 0.75 else rng.choice(people[1:]),
+                "started": started.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+                "updated": (started + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+                "timeSpentSeconds": 900 * rng.randrange(1, 16),
+                "comment": {"content": [{"content": [{"type": "text", "text": f"Worked on issue {number}"}]}]}
+            })
+        issue_worklogs.append((issue, worklogs))
+    return issue_worklogs
+
+
+def nested_dicts(issue_worklogs: list) -> list:
+    """The summary as the repository built it before the slotted records."""
+    daily_data = {}
+    for issue, worklogs in issue_worklogs:
+        issue_key = issue["key"]
+        metadata = _issue_metadata(issue)
+        for wl in worklogs:
+            if wl["author"]["accountId"] != ACCOUNT_ID:
+                continue
+            worklog_date = wl["started"][:10]
+            if not (START_DATE <= worklog_date <= END_DATE):
+                continue
+            day_entry = daily_data.setdefault(worklog_date, {
+                "workDate": worklog_date,
+                "workDateFormatted": datetime.strptime(worklog_date, "%Y-%m-%d").strftime("%d-%m-%Y"),
+                "daySummary": {"totalTimeSpentSeconds": 0},
+                "issues": {}
+            })
+            if issue_key not in day_entry["issues"]:
+                day_entry["issues"][issue_key] = {
+                    **metadata,
+                    "worklogSummary": {"totalTimeSpentSeconds": 0},
+                    "worklogs": []
+                }
+            issue_entry = day_entry["issues"][issue_key]
+            time_seconds = wl["timeSpentSeconds"]
+            author = wl.get("author", {})
+            started_raw = wl.get("started", "")
+            updated_raw = wl.get("updated", "")
+            issue_entry["worklogs"].append({
+                "worklogId": wl["id"],
+                "comment": extract_comment(wl.get("comment")),
+                "timeSpentSeconds": time_seconds,
+                "timeSpentFormatted": format_seconds(time_seconds),
+                "started": started_raw,
+                "startedDate": started_raw[:10],
+                "startedTime": datetime.fromisoformat(started_raw.split("+")[0]).strftime("%H:%M"),
+                "updated": updated_raw,
+                "updatedFormatted": datetime.fromisoformat(updated_raw.split("+")[0]).strftime("%d-%m-%Y %H:%M"),
+                "author": {"accountId": author.get("accountId"), "displayName": author.get("displayName", "Unknown")}
+            })
+            issue_entry["worklogSummary"]["totalTimeSpentSeconds"] += time_seconds
+            day_entry["daySummary"]["totalTimeSpentSeconds"] += time_seconds
+
+    result = []
+    for day in sorted(daily_data):
+        day_entry = daily_data[day]
+        for issue in day_entry["issues"].values():
+            summary = issue["worklogSummary"]
+            summary["totalTimeSpentFormatted"] = format_seconds(summary["totalTimeSpentSeconds"])
+        day_summary = day_entry["daySummary"]
+        day_summary["totalTimeSpentFormatted"] = format_seconds(day_summary["totalTimeSpentSeconds"])
+        day_entry["issues"] = list(day_entry["issues"].values())
+        result.append(day_entry)
+    return result
+
+
+def _issue_metadata(issue: dict) -> dict:
+    fields = issue["fields"]
+    reporter, assignee = fields.get("reporter", {}), fields.get("assignee", {})
+    issue_type, status, priority = fields.get("issuetype", {}), fields.get("status", {}), fields.get("priority", {})
+    original_estimate = fields.get("timeoriginalestimate")
+    return {
+        "issueKey": issue["key"],
+        "issueSummary": fields.get("summary", ""),
+        "reportedBy": {"accountId": reporter.get("accountId"), "displayName": reporter.get("displayName")},
+        "assignee": {"accountId": assignee.get("accountId"), "displayName": assignee.get("displayName")},
+        "issueType": {"name": issue_type.get("name"), "iconUrl": issue_type.get("iconUrl")},
+        "status": {"name": status.get("name"), "statusCategory": status.get("statusCategory", {}).get("name")},
+        "priority": {"name": priority.get("name"), "iconUrl": priority.get("iconUrl")},
+        "originalEstimate": original_estimate,
+        "originalEstimateFormatted": format_seconds(original_estimate) if original_estimate else None
+    }
+
+
+def measure(build):
+    """Return (result, seconds to build, bytes retained by the result)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=2000, help="synthetic issues")
+    parser.add_argument("--worklogs", type=int, default=50, help="worklogs per issue")
+    args = parser.parse_args()
+
+    issue_worklogs = make_issues(args.issues, args.worklogs)
+    repository = WorklogRepositoryBase(jira_client=None)
+
+    # Timed without tracemalloc, which slows allocation-heavy code unevenly.
+    start = time.perf_counter()
+    nested_dicts(issue_worklogs)
+    dicts_time = time.perf_counter() - start
+    start = time.perf_counter()
+    summary = repository._summarize(issue_worklogs, ACCOUNT_ID, START_DATE, END_DATE)
+    records_time = time.perf_counter() - start
+    start = time.perf_counter()
+    summary.to_dicts()
+    to_dicts_time = time.perf_counter() - start
+    del summary
+
+    dicts, _, dicts_memory = measure(lambda: nested_dicts(issue_worklogs))
+    del dicts
+    summary, _, records_memory = measure(
+        lambda: repository._summarize(issue_worklogs, ACCOUNT_ID, START_DATE, END_DATE)
+    )
+    worklog_count = sum(len(issue.worklogs) for day in summary.days for issue in day.issues.values())
+
+    print(f"{args.issues} issues x {args.worklogs} worklogs, {worklog_count} in the summary")
+    print(f"{'':<16}{'retained MB':>12}{'build s':>10}")
+    print(f"{'nested dicts':<16}{dicts_memory / 2**20:>12.1f}{dicts_time:>10.2f}")
+    print(f"{'records':<16}{records_memory / 2**20:>12.1f}{records_time:>10.2f}  (+{to_dicts_time:.2f} s to_dicts)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Time spent formatting worklog display timestamps.
+
+Formats the day, start time and last update of synthetic worklogs the
+way the summary records do, and compares it with the code used before
+the timestamp helpers were memoized: two ``fromisoformat`` calls on
+strings with their offset cut off, plus a ``strptime``/``strftime`` pair
+for the day.
+
+Start times fall on a quarter hour and update times on any second, so
+nearly every update time is distinct. The first pass over the data
+("cold") misses on those; later passes ("warm"), such as re-rendering or
+exporting the same summary, hit the cache as long as the distinct values
+fit in ``TIMESTAMP_CACHE_SIZE``. Past that, warm runs are no faster than
+cold ones.
+
+    python -m benchmarks.bench_timestamps [--worklogs 20000]
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+import benchmarks  # noqa: F401  (placeholder settings)
+
+from app.core.constants import DATETIME_FORMAT_DISPLAY, TIME_FORMAT_DISPLAY
+from app.utils.helpers import format_date, format_jira_timestamp, parse_jira_timestamp
+
+OFFSETS = ("+0000", "+0530", "-0800", "+0100")
+
+
+def make_worklogs(count: int, seed: int = 7) -> list:
+    """Return ``(work date, started, updated)`` triples spread over a year."""
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 1)
+    worklogs = []
+    for _ in range(count):
+        started = base + timedelta(days=rng.randrange(365), minutes=15 * rng.randrange(96))
+        updated = started + timedelta(seconds=rng.randrange(3 * 86400))
+        offset = rng.choice(OFFSETS)
+        worklogs.append((
+            started.strftime("%Y-%m-%d"),
+            started.strftime("%Y-%m-%dT%H:%M:%S.000") + offset,
+            updated.strftime("%Y-%m-%dT%H:%M:%S.000") + offset
+        ))
+    return worklogs
+
+
+def previous(worklogs: list) -> None:
+    for work_date, started, updated in worklogs:
+        datetime.strptime(work_date, "%Y-%m-%d").strftime("%d-%m-%Y")
+        try:
+            datetime.fromisoformat(started.replace("Z", "+00:00").split("+")[0]).strftime("%H:%M")
+        except ValueError:
+            started[11:16]
+        try:
+            datetime.fromisoformat(updated.replace("Z", "+00:00").split("+")[0]).strftime("%d-%m-%Y %H:%M")
+        except ValueError:
+            updated[:16]
+
+
+def memoized(worklogs: list, time_zone=None) -> None:
+    for work_date, started, updated in worklogs:
+        format_date(work_date)
+        format_jira_timestamp(started, TIME_FORMAT_DISPLAY, time_zone)
+        format_jira_timestamp(updated, DATETIME_FORMAT_DISPLAY, time_zone)
+
+
+def clear_caches() -> None:
+    for helper in (format_date, format_jira_timestamp, parse_jira_timestamp):
+        helper.cache_clear()
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--worklogs", type=int, default=20_000, help="synthetic worklogs to format")
+    args = parser.parse_args()
+
+    worklogs = make_worklogs(args.worklogs)
+    clear_caches()
+    cold = timed(memoized, worklogs)
+    warm = timed(memoized, worklogs)
+    clear_caches()
+    zoned = timed(memoized, worklogs, "Asia/Kolkata")
+    clear_caches()
+    old = timed(previous, worklogs)
+
+    print(f"{len(worklogs)} worklogs, {len({worklog[2] for worklog in worklogs})} distinct update times")
+    print(f"{'previous code':<28}{old:>8.2f} s")
+    print(f"{'memoized, cold':<28}{cold:>8.2f} s")
+    print(f"{'memoized, warm':<28}{warm:>8.2f} s")
+    print(f"{'memoized, zone conversion':<28}{zoned:>8.2f} s  (cold)")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ class WorklogForm {
         this.flatpickr = null;
         this.currentView = this.getStoredView() || 'card';
         this.currentData = null;
+        this.abortController = null;
         this.init();
     }
     
@@ -74,31 +75,24 @@ class WorklogForm {
     
     loadInitialData() {
         const serverDataScript = document.getElementById('serverData');
-        const resultsContainer = document.getElementById('resultsContainer');
         
         if (serverDataScript) {
             try {
-                const data = JSON.parse(serverDataScript.textContent);
-                this.currentData = data;
-                
-                if (this.currentView === 'table') {
-                    resultsContainer.innerHTML = '';
-                    this.renderResults(data);
+                const { days, fresh } = JSON.parse(serverDataScript.textContent);
+                this.currentData = days;
+                this.renderResults(days);
+                if (!fresh) {
+                    // Show the cached week right away, then swap in current data.
+                    this.submitFormAsync({ background: true });
                 }
+                return;
             } catch (e) {
                 console.warn('Failed to parse server data', e);
             }
-        } else {
-            const hasExistingData = resultsContainer && resultsContainer.querySelector('[data-day-card]');
-            
-            if (!hasExistingData) {
-                const startDate = this.startDateInput.value;
-                const endDate = this.endDateInput.value;
-                
-                if (startDate && endDate) {
-                    this.submitFormAsync();
-                }
-            }
+        }
+        
+        if (this.startDateInput.value && this.endDateInput.value) {
+            this.submitFormAsync();
         }
     }
     
@@ -179,6 +173,7 @@ class WorklogForm {
     attachEventListeners() {
         this.form.addEventListener('submit', (event) => this.handleFormSubmit(event));
         this.attachQuickRangeButtons();
+        this.attachDetailsToggleListener();
     }
     
     attachQuickRangeButtons() {
@@ -277,12 +272,13 @@ class WorklogForm {
             return;
         }
         
-        this.submitFormAsync();
+        // An explicit Generate reads through the caches, so time just
+        // logged in Jira shows up.
+        this.submitFormAsync({ forceRefresh: true });
     }
     
-    async submitFormAsync() {
+    async submitFormAsync({ background = false, forceRefresh = false } = {}) {
         const submitButton = this.form.querySelector('button[type="submit"]');
-        const loadingIndicator = document.getElementById('loadingIndicator');
         const resultsContainer = document.getElementById('resultsContainer');
         const errorContainer = document.getElementById('errorContainer');
         const generateText = submitButton.querySelector('.generate-text');
@@ -296,24 +292,30 @@ class WorklogForm {
             return;
         }
         
+        if (this.abortController) {
+            this.abortController.abort();
+        }
+        const abortController = new AbortController();
+        this.abortController = abortController;
+        
         submitButton.disabled = true;
         if (generateText) generateText.textContent = 'Generating...';
         if (spinner) spinner.classList.remove('hidden');
-        if (loadingIndicator) loadingIndicator.classList.remove('hidden');
-        if (loadingIndicator) loadingIndicator.classList.add('flex');
         if (errorContainer) errorContainer.style.display = 'none';
-        if (resultsContainer) resultsContainer.innerHTML = '';
+        if (!background) this.renderSkeleton(resultsContainer);
         
         try {
-            const response = await fetch('/api/v1/jira-worklogs/summary', {
+            const response = await fetch('/api/v1/jira-worklogs/summary?stream=ndjson', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
                 },
                 body: JSON.stringify({
                     startDate: startDate,
-                    endDate: endDate
-                })
+                    endDate: endDate,
+                    forceRefresh: forceRefresh
+                }),
+                signal: abortController.signal
             });
             
             if (!response.ok) {
@@ -321,25 +323,88 @@ class WorklogForm {
                 throw new Error(errorData.message || `HTTP error! status: ${response.status}`);
             }
             
-            const data = await response.json();
-            this.currentData = data;
-            this.renderResults(data);
+            // Cards are appended as days arrive; the table and background
+            // refreshes are rendered once the whole summary is in.
+            const incremental = !background && this.currentView === 'card';
+            let list = null;
+            const days = await this.readNdjson(response, (day, dayIndex) => {
+                if (!incremental) return;
+                if (!list) {
+                    resultsContainer.innerHTML = '<div class="space-y-4"></div>';
+                    list = resultsContainer.firstElementChild;
+                }
+                list.insertAdjacentHTML('beforeend', this.renderDayCard(day, dayIndex));
+            });
+            
+            this.currentData = days;
+            if (!incremental || days.length === 0) {
+                this.renderResults(days);
+            }
         } catch (error) {
+            if (error.name === 'AbortError') return;
             console.error('Error fetching worklogs:', error);
+            if (!background) resultsContainer.innerHTML = '';
             this.showError(error.message || 'Failed to fetch worklogs. Please try again.');
         } finally {
-            submitButton.disabled = false;
-            const generateText = submitButton.querySelector('.generate-text');
-            const spinner = submitButton.querySelector('svg');
-            if (generateText) generateText.textContent = 'Generate';
-            if (spinner) spinner.classList.add('hidden');
-            if (loadingIndicator) {
-                loadingIndicator.classList.add('hidden');
-                loadingIndicator.classList.remove('flex');
+            if (this.abortController === abortController) {
+                this.abortController = null;
+                submitButton.disabled = false;
+                if (generateText) generateText.textContent = 'Generate';
+                if (spinner) spinner.classList.add('hidden');
             }
         }
     }
     
+    async readNdjson(response, onItem) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        const items = [];
+        let buffer = '';
+        
+        const take = (line) => {
+            if (!line.trim()) return;
+            const item = JSON.parse(line);
+            items.push(item);
+            onItem(item, items.length - 1);
+        };
+        
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+            lines.forEach(take);
+        }
+        take(buffer + decoder.decode());
+        return items;
+    }
+    
+    renderSkeleton(resultsContainer) {
+        if (!resultsContainer) return;
+        const card = `
+            <div class="rounded-xl border bg-card shadow-sm">
+                <div class="p-5">
+                    <div class="flex items-center justify-between mb-4">
+                        <div class="flex items-center gap-3">
+                            <div class="flex-shrink-0 w-1 h-12 rounded-full bg-muted"></div>
+                            <div class="space-y-2">
+                                <div class="h-5 w-40 rounded bg-muted"></div>
+                                <div class="h-3 w-16 rounded bg-muted"></div>
+                            </div>
+                        </div>
+                        <div class="h-8 w-20 rounded-lg bg-muted"></div>
+                    </div>
+                    <div class="space-y-3">
+                        <div class="h-14 rounded-lg bg-muted/50"></div>
+                        <div class="h-14 rounded-lg bg-muted/50"></div>
+                    </div>
+                </div>
+            </div>
+        `;
+        resultsContainer.innerHTML = `<div class="space-y-4 animate-pulse" data-skeleton>${card.repeat(3)}</div>`;
+    }
+    
     renderResults(data) {
         const resultsContainer = document.getElementById('resultsContainer');
         if (!resultsContainer) return;
@@ -362,164 +427,165 @@ class WorklogForm {
             return;
         }
         
-        const html = data.map((day, dayIndex) => {
-            const totalHours = day.daySummary.totalTimeSpentSeconds / 3600;
-            const isCritical = totalHours < 4;
-            const isWarning = totalHours < 8 && totalHours >= 4;
-            
-            const criticalClass = isCritical ? 'worklog-day-critical' : '';
-            const warningClass = isWarning ? 'worklog-day-warning' : '';
-            const badgeClass = isCritical ? 'worklog-badge-critical' : 
-                              isWarning ? 'worklog-badge-warning' : 
-                              'bg-primary/10 text-primary';
-            const indicatorColor = isCritical ? 'bg-red-500' : isWarning ? 'bg-yellow-500' : 'bg-primary';
-            
-            const summaryIssues = day.issues.slice(0, 3);
-            const summaryHtml = summaryIssues.map(issue => `
-                <div class="flex items-start gap-3 p-3 rounded-lg bg-muted/50 hover:bg-muted/70 transition-colors">
-                    <div class="flex-shrink-0 mt-0.5">
-                        ${issue.issueType?.iconUrl
-                            ? `<img src="${issue.issueType.iconUrl}" alt="${this.escapeHtml(issue.issueType.name || '')}" class="w-4 h-4" title="${this.escapeHtml(issue.issueType.name || '')}">`
-                            : `<div class="w-2 h-2 rounded-full bg-primary"></div>`
-                        }
+        const html = data.map((day, dayIndex) => this.renderDayCard(day, dayIndex)).join('');
+        
+        resultsContainer.innerHTML = `<div class="space-y-4">${html}</div>`;
+    }
+    
+    renderDayCard(day, dayIndex) {
+        const totalHours = day.daySummary.totalTimeSpentSeconds / 3600;
+        const isCritical = totalHours < 4;
+        const isWarning = totalHours < 8 && totalHours >= 4;
+        
+        const criticalClass = isCritical ? 'worklog-day-critical' : '';
+        const warningClass = isWarning ? 'worklog-day-warning' : '';
+        const badgeClass = isCritical ? 'worklog-badge-critical' : 
+                          isWarning ? 'worklog-badge-warning' : 
+                          'bg-primary/10 text-primary';
+        const indicatorColor = isCritical ? 'bg-red-500' : isWarning ? 'bg-yellow-500' : 'bg-primary';
+        
+        const summaryIssues = day.issues.slice(0, 3);
+        const summaryHtml = summaryIssues.map(issue => `
+            <div class="flex items-start gap-3 p-3 rounded-lg bg-muted/50 hover:bg-muted/70 transition-colors">
+                <div class="flex-shrink-0 mt-0.5">
+                    ${issue.issueType?.iconUrl
+                        ? `<img src="${issue.issueType.iconUrl}" alt="${this.escapeHtml(issue.issueType.name || '')}" class="w-4 h-4" title="${this.escapeHtml(issue.issueType.name || '')}">`
+                        : `<div class="w-2 h-2 rounded-full bg-primary"></div>`
+                    }
+                </div>
+                <div class="flex-1 min-w-0">
+                    <div class="flex items-start justify-between gap-2">
+                        <h3 class="font-medium text-sm leading-tight text-foreground truncate">
+                            <span class="font-semibold text-primary">${this.escapeHtml(issue.issueKey)}</span>
+                            <span class="text-muted-foreground"> — ${this.escapeHtml(issue.issueSummary)}</span>
+                        </h3>
+                        <span class="flex-shrink-0 text-xs font-medium text-primary">${issue.worklogSummary.totalTimeSpentFormatted}</span>
                     </div>
-                    <div class="flex-1 min-w-0">
-                        <div class="flex items-start justify-between gap-2">
-                            <h3 class="font-medium text-sm leading-tight text-foreground truncate">
-                                <span class="font-semibold text-primary">${this.escapeHtml(issue.issueKey)}</span>
-                                <span class="text-muted-foreground"> — ${this.escapeHtml(issue.issueSummary)}</span>
-                            </h3>
-                            <span class="flex-shrink-0 text-xs font-medium text-primary">${issue.worklogSummary.totalTimeSpentFormatted}</span>
-                        </div>
-                        <div class="flex items-center gap-2 mt-1 flex-wrap">
-                            <span class="inline-flex items-center px-1.5 py-0.5 rounded text-xs ${this.getStatusClass(issue.status?.statusCategory)}">${this.escapeHtml(issue.status?.name || 'Unknown')}</span>
-                            ${issue.priority?.name ? `<span class="text-xs text-muted-foreground">${this.escapeHtml(issue.priority.name)}</span>` : ''}
-                            <span class="text-xs text-muted-foreground">${issue.worklogs.length} worklog${issue.worklogs.length !== 1 ? 's' : ''}</span>
-                        </div>
+                    <div class="flex items-center gap-2 mt-1 flex-wrap">
+                        <span class="inline-flex items-center px-1.5 py-0.5 rounded text-xs ${this.getStatusClass(issue.status?.statusCategory)}">${this.escapeHtml(issue.status?.name || 'Unknown')}</span>
+                        ${issue.priority?.name ? `<span class="text-xs text-muted-foreground">${this.escapeHtml(issue.priority.name)}</span>` : ''}
+                        <span class="text-xs text-muted-foreground">${issue.worklogs.length} worklog${issue.worklogs.length !== 1 ? 's' : ''}</span>
                     </div>
                 </div>
-            `).join('');
-            
-            const moreIssuesCount = day.issues.length > 3 ? day.issues.length - 3 : 0;
-            const moreIssuesHtml = moreIssuesCount > 0 ? `
-                <div class="text-center py-2">
-                    <span class="text-xs text-muted-foreground">+${moreIssuesCount} more issue${moreIssuesCount !== 1 ? 's' : ''}</span>
-                </div>
-            ` : '';
-            
-            const detailsIssuesHtml = day.issues.map(issue => {
-                const worklogsHtml = issue.worklogs.map(wl => `
-                    <div class="flex items-start gap-3 py-2 border-b border-border/50 last:border-0">
-                        <div class="flex-shrink-0 mt-1">
-                            <svg class="w-4 h-4 text-primary/60" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 8v4l3 3m6-3a9 9 0 11-18 0 9 9 0 0118 0z"></path>
-                            </svg>
-                        </div>
-                        <div class="flex-1">
-                            <div class="flex items-center gap-2 mb-1 flex-wrap">
-                                <span class="font-semibold text-sm text-primary">${wl.timeSpentFormatted}</span>
-                                ${wl.startedTime ? `<span class="text-xs text-muted-foreground">@ ${wl.startedTime}</span>` : ''}
-                                ${wl.author?.displayName ? `<span class="text-xs text-muted-foreground">by ${this.escapeHtml(wl.author.displayName)}</span>` : ''}
-                            </div>
-                            ${wl.comment ? `<p class="text-sm text-foreground/80 leading-relaxed">${this.escapeHtml(wl.comment)}</p>` : '<p class="text-xs text-muted-foreground italic">No comment</p>'}
-                            ${wl.updatedFormatted ? `<p class="text-xs text-muted-foreground mt-1">Updated: ${wl.updatedFormatted}</p>` : ''}
+            </div>
+        `).join('');
+        
+        const moreIssuesCount = day.issues.length > 3 ? day.issues.length - 3 : 0;
+        const moreIssuesHtml = moreIssuesCount > 0 ? `
+            <div class="text-center py-2">
+                <span class="text-xs text-muted-foreground">+${moreIssuesCount} more issue${moreIssuesCount !== 1 ? 's' : ''}</span>
+            </div>
+        ` : '';
+        
+        const detailsIssuesHtml = day.issues.map(issue => {
+            const worklogsHtml = issue.worklogs.map(wl => `
+                <div class="flex items-start gap-3 py-2 border-b border-border/50 last:border-0">
+                    <div class="flex-shrink-0 mt-1">
+                        <svg class="w-4 h-4 text-primary/60" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 8v4l3 3m6-3a9 9 0 11-18 0 9 9 0 0118 0z"></path>
+                        </svg>
+                    </div>
+                    <div class="flex-1">
+                        <div class="flex items-center gap-2 mb-1 flex-wrap">
+                            <span class="font-semibold text-sm text-primary">${wl.timeSpentFormatted}</span>
+                            ${wl.startedTime ? `<span class="text-xs text-muted-foreground">@ ${wl.startedTime}</span>` : ''}
+                            ${wl.author?.displayName ? `<span class="text-xs text-muted-foreground">by ${this.escapeHtml(wl.author.displayName)}</span>` : ''}
                         </div>
+                        ${wl.comment ? `<p class="text-sm text-foreground/80 leading-relaxed">${this.escapeHtml(wl.comment)}</p>` : '<p class="text-xs text-muted-foreground italic">No comment</p>'}
+                        ${wl.updatedFormatted ? `<p class="text-xs text-muted-foreground mt-1">Updated: ${wl.updatedFormatted}</p>` : ''}
                     </div>
-                `).join('');
+                </div>
+            `).join('');
 
-                const estimateVsActual = issue.originalEstimateFormatted
-                    ? `<span class="text-xs px-1.5 py-0.5 rounded bg-muted">${issue.worklogSummary.totalTimeSpentFormatted} / ${issue.originalEstimateFormatted} est.</span>`
-                    : '';
+            const estimateVsActual = issue.originalEstimateFormatted
+                ? `<span class="text-xs px-1.5 py-0.5 rounded bg-muted">${issue.worklogSummary.totalTimeSpentFormatted} / ${issue.originalEstimateFormatted} est.</span>`
+                : '';
 
-                return `
-                    <div class="rounded-lg border-l-4 border-primary bg-muted/30 p-4 hover:bg-muted/50 transition-colors">
-                        <div class="flex items-start justify-between mb-3">
-                            <div class="flex-1">
-                                <div class="flex items-center gap-2 mb-1">
-                                    ${issue.issueType?.iconUrl
-                                        ? `<img src="${issue.issueType.iconUrl}" alt="${this.escapeHtml(issue.issueType.name || '')}" class="w-4 h-4" title="${this.escapeHtml(issue.issueType.name || '')}">`
-                                        : ''
-                                    }
-                                    <h3 class="font-semibold text-base leading-tight text-foreground">
-                                        <span class="text-primary">${this.escapeHtml(issue.issueKey)}</span> — ${this.escapeHtml(issue.issueSummary)}
-                                    </h3>
-                                </div>
-                                <div class="flex items-center gap-2 mt-2 flex-wrap">
-                                    <span class="inline-flex items-center px-2 py-0.5 rounded text-xs font-medium ${this.getStatusClass(issue.status?.statusCategory)}">${this.escapeHtml(issue.status?.name || 'Unknown')}</span>
-                                    ${issue.priority?.name ? `
-                                        <span class="inline-flex items-center gap-1 text-xs text-muted-foreground">
-                                            ${issue.priority.iconUrl ? `<img src="${issue.priority.iconUrl}" alt="" class="w-3 h-3">` : ''}
-                                            ${this.escapeHtml(issue.priority.name)}
-                                        </span>
-                                    ` : ''}
-                                    ${issue.issueType?.name ? `<span class="text-xs text-muted-foreground">${this.escapeHtml(issue.issueType.name)}</span>` : ''}
-                                </div>
-                                <div class="flex items-center gap-4 mt-2 text-xs text-muted-foreground flex-wrap">
-                                    <span class="flex items-center gap-1" title="Reporter">
-                                        <svg class="w-3.5 h-3.5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M16 7a4 4 0 11-8 0 4 4 0 018 0zM12 14a7 7 0 00-7 7h14a7 7 0 00-7-7z"></path>
-                                        </svg>
-                                        Reporter: ${this.escapeHtml(issue.reportedBy?.displayName || 'Unknown')}
-                                    </span>
-                                    <span class="flex items-center gap-1" title="Assignee">
-                                        <svg class="w-3.5 h-3.5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5.121 17.804A13.937 13.937 0 0112 16c2.5 0 4.847.655 6.879 1.804M15 10a3 3 0 11-6 0 3 3 0 016 0zm6 2a9 9 0 11-18 0 9 9 0 0118 0z"></path>
-                                        </svg>
-                                        Assignee: ${this.escapeHtml(issue.assignee?.displayName || 'Unassigned')}
-                                    </span>
-                                    <span class="font-medium text-primary">${issue.worklogSummary.totalTimeSpentFormatted}</span>
-                                    ${estimateVsActual}
-                                </div>
-                            </div>
-                        </div>
-                        <div class="space-y-1 pl-4 border-l-2 border-primary/30">
-                            ${worklogsHtml}
-                        </div>
-                    </div>
-                `;
-            }).join('');
-            
             return `
-                <div class="group rounded-xl border bg-card text-card-foreground shadow-sm hover:shadow-md transition-all duration-200 ${criticalClass} ${warningClass}" data-day-card>
-                    <div class="p-5">
-                        <div class="flex items-center justify-between mb-4">
-                            <div class="flex items-center gap-3">
-                                <div class="flex-shrink-0 w-1 h-12 rounded-full ${indicatorColor}"></div>
-                                <div>
-                                    <h2 class="text-lg font-semibold tracking-tight text-foreground">${this.escapeHtml(day.workDateFormatted)}</h2>
-                                    <p class="text-xs text-muted-foreground mt-0.5">${day.issues.length} issue${day.issues.length !== 1 ? 's' : ''}</p>
-                                </div>
+                <div class="rounded-lg border-l-4 border-primary bg-muted/30 p-4 hover:bg-muted/50 transition-colors">
+                    <div class="flex items-start justify-between mb-3">
+                        <div class="flex-1">
+                            <div class="flex items-center gap-2 mb-1">
+                                ${issue.issueType?.iconUrl
+                                    ? `<img src="${issue.issueType.iconUrl}" alt="${this.escapeHtml(issue.issueType.name || '')}" class="w-4 h-4" title="${this.escapeHtml(issue.issueType.name || '')}">`
+                                    : ''
+                                }
+                                <h3 class="font-semibold text-base leading-tight text-foreground">
+                                    <span class="text-primary">${this.escapeHtml(issue.issueKey)}</span> — ${this.escapeHtml(issue.issueSummary)}
+                                </h3>
                             </div>
-                            <div class="flex items-center gap-3">
-                                <div class="inline-flex items-center rounded-lg px-3 py-1.5 text-sm font-semibold ${badgeClass}">
-                                    ${day.daySummary.totalTimeSpentFormatted}
-                                </div>
-                                <button type="button" 
-                                        class="day-details-toggle inline-flex items-center justify-center rounded-md border border-input bg-background px-3 py-1.5 text-xs font-medium text-foreground hover:bg-accent hover:text-accent-foreground transition-colors"
-                                        data-day-index="${dayIndex}">
-                                    <span class="toggle-text">View Details</span>
-                                    <svg class="toggle-icon ml-1.5 h-3.5 w-3.5 transition-transform" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 9l-7 7-7-7"></path>
-                                    </svg>
-                                </button>
+                            <div class="flex items-center gap-2 mt-2 flex-wrap">
+                                <span class="inline-flex items-center px-2 py-0.5 rounded text-xs font-medium ${this.getStatusClass(issue.status?.statusCategory)}">${this.escapeHtml(issue.status?.name || 'Unknown')}</span>
+                                ${issue.priority?.name ? `
+                                    <span class="inline-flex items-center gap-1 text-xs text-muted-foreground">
+                                        ${issue.priority.iconUrl ? `<img src="${issue.priority.iconUrl}" alt="" class="w-3 h-3">` : ''}
+                                        ${this.escapeHtml(issue.priority.name)}
+                                    </span>
+                                ` : ''}
+                                ${issue.issueType?.name ? `<span class="text-xs text-muted-foreground">${this.escapeHtml(issue.issueType.name)}</span>` : ''}
                             </div>
-                        </div>
-                        <div class="day-summary space-y-3">
-                            ${summaryHtml}
-                            ${moreIssuesHtml}
-                        </div>
-                        <div class="day-details hidden mt-4 pt-4 border-t">
-                            <div class="space-y-4">
-                                ${detailsIssuesHtml}
+                            <div class="flex items-center gap-4 mt-2 text-xs text-muted-foreground flex-wrap">
+                                <span class="flex items-center gap-1" title="Reporter">
+                                    <svg class="w-3.5 h-3.5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M16 7a4 4 0 11-8 0 4 4 0 018 0zM12 14a7 7 0 00-7 7h14a7 7 0 00-7-7z"></path>
+                                    </svg>
+                                    Reporter: ${this.escapeHtml(issue.reportedBy?.displayName || 'Unknown')}
+                                </span>
+                                <span class="flex items-center gap-1" title="Assignee">
+                                    <svg class="w-3.5 h-3.5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5.121 17.804A13.937 13.937 0 0112 16c2.5 0 4.847.655 6.879 1.804M15 10a3 3 0 11-6 0 3 3 0 016 0zm6 2a9 9 0 11-18 0 9 9 0 0118 0z"></path>
+                                    </svg>
+                                    Assignee: ${this.escapeHtml(issue.assignee?.displayName || 'Unassigned')}
+                                </span>
+                                <span class="font-medium text-primary">${issue.worklogSummary.totalTimeSpentFormatted}</span>
+                                ${estimateVsActual}
                             </div>
                         </div>
                     </div>
+                    <div class="space-y-1 pl-4 border-l-2 border-primary/30">
+                        ${worklogsHtml}
+                    </div>
                 </div>
             `;
         }).join('');
         
-        resultsContainer.innerHTML = `<div class="space-y-4">${html}</div>`;
-        this.attachDetailsToggleListeners();
+        return `
+            <div class="group rounded-xl border bg-card text-card-foreground shadow-sm hover:shadow-md transition-all duration-200 ${criticalClass} ${warningClass}" data-day-card>
+                <div class="p-5">
+                    <div class="flex items-center justify-between mb-4">
+                        <div class="flex items-center gap-3">
+                            <div class="flex-shrink-0 w-1 h-12 rounded-full ${indicatorColor}"></div>
+                            <div>
+                                <h2 class="text-lg font-semibold tracking-tight text-foreground">${this.escapeHtml(day.workDateFormatted)}</h2>
+                                <p class="text-xs text-muted-foreground mt-0.5">${day.issues.length} issue${day.issues.length !== 1 ? 's' : ''}</p>
+                            </div>
+                        </div>
+                        <div class="flex items-center gap-3">
+                            <div class="inline-flex items-center rounded-lg px-3 py-1.5 text-sm font-semibold ${badgeClass}">
+                                ${day.daySummary.totalTimeSpentFormatted}
+                            </div>
+                            <button type="button" 
+                                    class="day-details-toggle inline-flex items-center justify-center rounded-md border border-input bg-background px-3 py-1.5 text-xs font-medium text-foreground hover:bg-accent hover:text-accent-foreground transition-colors"
+                                    data-day-index="${dayIndex}">
+                                <span class="toggle-text">View Details</span>
+                                <svg class="toggle-icon ml-1.5 h-3.5 w-3.5 transition-transform" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 9l-7 7-7-7"></path>
+                                </svg>
+                            </button>
+                        </div>
+                    </div>
+                    <div class="day-summary space-y-3">
+                        ${summaryHtml}
+                        ${moreIssuesHtml}
+                    </div>
+                    <div class="day-details hidden mt-4 pt-4 border-t">
+                        <div class="space-y-4">
+                            ${detailsIssuesHtml}
+                        </div>
+                    </div>
+                </div>
+            </div>
+        `;
     }
     
     renderTableView(data, resultsContainer) {
@@ -622,35 +688,37 @@ class WorklogForm {
         resultsContainer.innerHTML = tableHtml;
     }
     
-    attachDetailsToggleListeners() {
-        const toggleButtons = document.querySelectorAll('.day-details-toggle');
-        toggleButtons.forEach(button => {
-            button.addEventListener('click', (e) => {
-                const dayIndex = button.getAttribute('data-day-index');
-                const dayCard = button.closest('[data-day-card]');
-                if (!dayCard) return;
-                
-                const detailsSection = dayCard.querySelector('.day-details');
-                const summarySection = dayCard.querySelector('.day-summary');
-                const toggleText = button.querySelector('.toggle-text');
-                const toggleIcon = button.querySelector('.toggle-icon');
+    attachDetailsToggleListener() {
+        // Delegated, so cards added while a summary streams in need no listeners of their own.
+        const resultsContainer = document.getElementById('resultsContainer');
+        if (!resultsContainer) return;
+        
+        resultsContainer.addEventListener('click', (e) => {
+            const button = e.target.closest('.day-details-toggle');
+            if (!button) return;
+            const dayCard = button.closest('[data-day-card]');
+            if (!dayCard) return;
+            
+            const detailsSection = dayCard.querySelector('.day-details');
+            const summarySection = dayCard.querySelector('.day-summary');
+            const toggleText = button.querySelector('.toggle-text');
+            const toggleIcon = button.querySelector('.toggle-icon');
+            
+            if (detailsSection && summarySection) {
+                const isHidden = detailsSection.classList.contains('hidden');
                 
-                if (detailsSection && summarySection) {
-                    const isHidden = detailsSection.classList.contains('hidden');
-                    
-                    if (isHidden) {
-                        detailsSection.classList.remove('hidden');
-                        summarySection.classList.add('hidden');
-                        if (toggleText) toggleText.textContent = 'Hide Details';
-                        if (toggleIcon) toggleIcon.style.transform = 'rotate(180deg)';
-                    } else {
-                        detailsSection.classList.add('hidden');
-                        summarySection.classList.remove('hidden');
-                        if (toggleText) toggleText.textContent = 'View Details';
-                        if (toggleIcon) toggleIcon.style.transform = 'rotate(0deg)';
-                    }
+                if (isHidden) {
+                    detailsSection.classList.remove('hidden');
+                    summarySection.classList.add('hidden');
+                    if (toggleText) toggleText.textContent = 'Hide Details';
+                    if (toggleIcon) toggleIcon.style.transform = 'rotate(180deg)';
+                } else {
+                    detailsSection.classList.add('hidden');
+                    summarySection.classList.remove('hidden');
+                    if (toggleText) toggleText.textContent = 'View Details';
+                    if (toggleIcon) toggleIcon.style.transform = 'rotate(0deg)';
                 }
-            });
+            }
         });
     }
     
@@ -0,0 +1,19 @@
+"""Shared test setup.
+
+``app.core.config`` refuses to import without Jira settings, so placeholder
+values are set before any test imports the app. Caches on disk are turned
+off unless a test points them at a temporary directory.
+"""
+
+import os
+
+for _name, _value in (
+    ("JIRA_DOMAIN", "tests.atlassian.net"),
+    ("JIRA_OAUTH_CLIENT_ID", "tests"),
+    ("JIRA_OAUTH_CLIENT_SECRET", "tests"),
+    ("WORKLOG_CACHE_PATH", ""),
+    ("TEMPLATE_CACHE_PATH", "")
+):
+    os.environ.setdefault(_name, _value)
+
+import app.core  # noqa: E402,F401  (wires the layers together before single modules are imported)
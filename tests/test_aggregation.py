@@ -0,0 +1,120 @@
+import random
+
+import pytest
+
+from app.core.exceptions import ValidationError
+from app.domain import aggregation
+from app.domain.aggregation import WorklogColumns
+from app.models.summary import DaySummary, IssueRecord, WorklogEntry, WorklogSummary
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+ISSUES = {
+    key: IssueRecord.from_jira({"key": key, "fields": {"summary": key, "status": {"name": status}}})
+    for key, status in (("PROJ-1", "Open"), ("PROJ-2", "Done"), ("OPS-1", "Open"))
+}
+
+# (day, issue, author, seconds)
+WORKLOGS = (
+    ("2026-01-30", "PROJ-1", "alice", 3600),
+    ("2026-01-30", "OPS-1", "bob", 1800),
+    ("2026-02-02", "PROJ-2", "alice", 7200),
+    ("2026-02-02", "PROJ-1", "bob", 900),
+    ("2026-02-03", "PROJ-1", "alice", 1800)
+)
+
+
+def make_summary() -> WorklogSummary:
+    authors = {}
+    days = {}
+    for number, (work_date, issue_key, author, seconds) in enumerate(WORKLOGS):
+        day = days.setdefault(work_date, DaySummary(work_date))
+        day.add(ISSUES[issue_key], WorklogEntry.from_jira({
+            "id": str(number),
+            "author": {"accountId": author, "displayName": author.title()},
+            "started": f"{work_date}T09:00:00.000+0000",
+            "timeSpentSeconds": seconds
+        }, authors))
+    return WorklogSummary([days[day] for day in sorted(days)])
+
+
+@pytest.fixture(params=["python", "numpy"])
+def engine(request, monkeypatch):
+    if request.param == "numpy":
+        if numpy is None:
+            pytest.skip("NumPy is not installed")
+        monkeypatch.setattr(aggregation, "np", numpy)
+    else:
+        monkeypatch.setattr(aggregation, "np", None)
+    return request.param
+
+
+def totals(rows, *dimensions):
+    return [(*(row[dimension] for dimension in dimensions), row["totalTimeSpentSeconds"], row["worklogCount"]) for row in rows]
+
+
+@pytest.mark.parametrize("dimension, expected", [
+    ("day", [("2026-01-30", 5400, 2), ("2026-02-02", 8100, 2), ("2026-02-03", 1800, 1)]),
+    ("week", [("2026-W05", 5400, 2), ("2026-W06", 9900, 3)]),
+    ("month", [("2026-01", 5400, 2), ("2026-02", 9900, 3)]),
+    ("issue", [("PROJ-1", 6300, 3), ("OPS-1", 1800, 1), ("PROJ-2", 7200, 1)]),
+    ("project", [("PROJ", 13500, 4), ("OPS", 1800, 1)]),
+    ("status", [("Open", 8100, 4), ("Done", 7200, 1)]),
+    ("author", [
+        ({"accountId": "alice", "displayName": "Alice"}, 12600, 3),
+        ({"accountId": "bob", "displayName": "Bob"}, 2700, 2)
+    ])
+])
+def test_rollup_by_each_dimension(engine, dimension, expected):
+    rows = WorklogColumns.from_summary(make_summary()).group_by(dimension)
+
+    assert totals(rows, dimension) == expected
+
+
+def test_rollup_by_several_dimensions_orders_by_each_in_turn(engine):
+    rows = WorklogColumns.from_summary(make_summary()).group_by("week", "author")
+
+    assert [(row["week"], row["author"]["accountId"], row["totalTimeSpentSeconds"]) for row in rows] == [
+        ("2026-W05", "alice", 3600),
+        ("2026-W05", "bob", 1800),
+        ("2026-W06", "alice", 9000),
+        ("2026-W06", "bob", 900)
+    ]
+    assert rows[2]["totalTimeSpentFormatted"] == "2h 30m"
+
+
+def test_rollup_without_dimensions_is_the_grand_total(engine):
+    rows = WorklogColumns.from_summary(make_summary()).group_by()
+
+    assert totals(rows) == [(15300, 5)]
+
+
+def test_rollup_of_an_empty_summary_has_no_rows(engine):
+    assert WorklogColumns.from_summary(WorklogSummary()).group_by("day") == []
+
+
+@pytest.mark.parametrize("dimensions", [("day", "day"), ("team",)])
+def test_unknown_or_repeated_dimensions_are_rejected(dimensions):
+    with pytest.raises(ValidationError):
+        WorklogColumns.from_summary(make_summary()).group_by(*dimensions)
+
+
+def test_numpy_and_python_sums_agree():
+    if numpy is None:
+        pytest.skip("NumPy is not installed")
+    rng = random.Random(13)
+    cardinalities = [7, 40, 3]
+    codes = [[rng.randrange(cardinality) for _ in range(5000)] for cardinality in cardinalities]
+    seconds = [60 * rng.randrange(1, 480) for _ in range(5000)]
+
+    vectorized = aggregation._sum_numpy(
+        [numpy.asarray(column, dtype=numpy.int64) for column in codes],
+        cardinalities,
+        numpy.asarray(seconds, dtype=numpy.int64)
+    )
+    folded = aggregation._sum_python(codes, seconds)
+
+    assert [(tuple(key), total, count) for key, total, count in vectorized] == folded
@@ -0,0 +1,222 @@
+import asyncio
+
+import pytest
+
+from app.core.exceptions import ExternalServiceError
+from app.core.jobs import JobRegistry
+from app.domain.repositories import async_worklog_repository
+from app.domain.repositories.async_worklog_repository import AsyncWorklogRepository
+from app.infrastructure.worklog_store import WorklogStore
+
+ME = "account-1"
+START_DATE, END_DATE = "2026-01-01", "2026-01-31"
+
+
+def issue(number: int) -> dict:
+    return {
+        "id": str(number),
+        "key": f"PROJ-{number}",
+        "fields": {"summary": f"Issue {number}", "updated": "2026-01-01T00:00:00.000+0000"}
+    }
+
+
+def worklog(worklog_id: int, issue_number: int, seconds: int = 3600, author: str = ME) -> dict:
+    return {
+        "id": str(worklog_id),
+        "issueId": str(issue_number),
+        "author": {"accountId": author, "displayName": author},
+        "started": "2026-01-05T09:00:00.000+0000",
+        "updated": "2026-01-05T10:00:00.000+0000",
+        "timeSpentSeconds": seconds
+    }
+
+
+class FakeJiraClient:
+    """Serves a fixed set of issues and worklogs, counting requests."""
+
+    def __init__(self, issues, worklogs, page_size=2):
+        self.issues = {item["key"]: item for item in issues}
+        self.worklogs = {item["key"]: [] for item in issues}
+        for wl in worklogs:
+            self.worklogs[f"PROJ-{wl['issueId']}"].append(wl)
+        self.page_size = page_size
+        # Issue key -> how many more field lookups including it fail.
+        self.lookup_failures = {}
+        # Issue keys whose worklog requests never answer.
+        self.hanging_issues = set()
+        self.updated_feed = []
+        self.issue_worklog_requests = 0
+        self.worklog_list_requests = 0
+        self._listing = 0
+        self.max_concurrent_listings = 0
+
+    def update(self, wl: dict) -> None:
+        worklogs = self.worklogs[f"PROJ-{wl['issueId']}"]
+        worklogs[:] = [existing for existing in worklogs if existing["id"] != wl["id"]] + [wl]
+
+    async def iter_issues(self, jql, fields, page_size):
+        if jql.startswith("key in"):
+            failing = [key for key, count in self.lookup_failures.items() if count > 0 and f'"{key}"' in jql]
+            for key in failing:
+                self.lookup_failures[key] -= 1
+            if failing:
+                raise ExternalServiceError(message="Failed to search issues", service_name="Jira API")
+            yield [item for key, item in self.issues.items() if f'"{key}"' in jql]
+            return
+        keys = list(self.issues)
+        for offset in range(0, len(keys), self.page_size):
+            await asyncio.sleep(0)
+            yield [
+                {"id": self.issues[key]["id"], "key": key, "fields": {"updated": self.issues[key]["fields"]["updated"]}}
+                for key in keys[offset:offset + self.page_size]
+            ]
+
+    async def iter_issue_worklogs(self, issue_key, started_after=None, started_before=None):
+        self.issue_worklog_requests += 1
+        await asyncio.sleep(60 if issue_key in self.hanging_issues else 0)
+        yield list(self.worklogs[issue_key])
+
+    async def iter_updated_worklogs(self, since):
+        for page in self.updated_feed:
+            yield [{"worklogId": int(wl["id"])} for wl in page]
+
+    async def iter_deleted_worklogs(self, since):
+        return
+        yield
+
+    async def get_worklogs_by_ids(self, worklog_ids):
+        self.worklog_list_requests += 1
+        self._listing += 1
+        self.max_concurrent_listings = max(self.max_concurrent_listings, self._listing)
+        await asyncio.sleep(0.01)
+        self._listing -= 1
+        by_id = {wl["id"]: wl for worklogs in self.worklogs.values() for wl in worklogs}
+        return [by_id[str(worklog_id)] for worklog_id in worklog_ids if str(worklog_id) in by_id]
+
+
+def total_seconds(summary) -> int:
+    return sum(day.seconds for day in summary.days)
+
+
+@pytest.fixture
+def jira():
+    return FakeJiraClient(
+        issues=[issue(n) for n in range(1, 5)],
+        worklogs=[worklog(100 + n, n) for n in range(1, 5)]
+    )
+
+
+@pytest.fixture
+def quick_retries(monkeypatch):
+    monkeypatch.setattr(async_worklog_repository, "WORKLOG_RETRY_BACKOFF_SECONDS", 0.001)
+
+
+def make_repository(jira, tmp_path=None, **options):
+    return AsyncWorklogRepository(
+        jira_client=jira,
+        max_workers=4,
+        store=WorklogStore(str(tmp_path / "worklogs.sqlite3")) if tmp_path else None,
+        cloud_id="cloud",
+        owner_account_id=ME,
+        **options
+    )
+
+
+def resync(repository):
+    return asyncio.run(repository.get_worklogs_by_date_range(ME, START_DATE, END_DATE, force_refresh=True))
+
+
+def summarize(repository):
+    return asyncio.run(repository.get_worklogs_by_date_range(ME, START_DATE, END_DATE))
+
+
+def summarize_and_retry(repository, jobs):
+    """Return the first summary and, once the retry job has finished, the job."""
+    async def main():
+        summary = await repository.get_worklogs_by_date_range(ME, START_DATE, END_DATE)
+        job = jobs.get(summary.retry_job_id, ("cloud", ME)) if summary.retry_job_id else None
+        if job is not None:
+            await jobs.wait(job, 5)
+        return summary, job
+
+    return asyncio.run(main())
+
+
+def test_sync_fetches_feed_pages_concurrently(jira, tmp_path):
+    repository = make_repository(jira, tmp_path)
+    assert total_seconds(resync(repository)) == 4 * 3600
+
+    changed = [worklog(101, 1, seconds=7200), worklog(102, 2, seconds=7200), worklog(900, 3, author="someone-else")]
+    for wl in changed:
+        jira.update(wl)
+    jira.updated_feed = [[wl] for wl in changed]
+    fetched_before = jira.issue_worklog_requests
+
+    summary = resync(repository)
+
+    assert total_seconds(summary) == 6 * 3600
+    assert jira.worklog_list_requests == 3
+    assert jira.max_concurrent_listings > 1
+    assert jira.issue_worklog_requests == fetched_before
+
+
+def test_sync_past_the_page_cap_refetches_the_cached_range(jira, tmp_path):
+    repository = make_repository(jira, tmp_path, sync_max_pages=2)
+    resync(repository)
+
+    jira.update(worklog(101, 1, seconds=7200))
+    jira.updated_feed = [[worklog(900 + n, 1, author="someone-else")] for n in range(5)]
+    fetched_before = jira.issue_worklog_requests
+
+    summary = resync(repository)
+
+    assert total_seconds(summary) == 5 * 3600
+    assert jira.worklog_list_requests <= 2
+    assert jira.issue_worklog_requests == fetched_before + 4
+
+
+def test_a_failed_field_lookup_is_retried(jira):
+    jira.lookup_failures = {"PROJ-1": 1}
+
+    summary = summarize(make_repository(jira))
+
+    assert summary.failed_issues == []
+    assert total_seconds(summary) == 4 * 3600
+
+
+def test_issues_whose_fields_cannot_be_looked_up_are_listed_as_failed(jira):
+    jira.lookup_failures = {"PROJ-1": 99}
+
+    summary = summarize(make_repository(jira))
+
+    # Issues are searched two to a page; only the page with the failed lookup is affected.
+    assert summary.failed_issues == ["PROJ-1", "PROJ-2"]
+    assert total_seconds(summary) == 2 * 3600
+
+
+def test_the_retry_job_looks_up_fields_it_could_not_before(jira, quick_retries):
+    jira.lookup_failures = {"PROJ-1": 2}
+    jobs = JobRegistry(max_entries=10, ttl_seconds=60)
+
+    summary, job = summarize_and_retry(make_repository(jira, retry_jobs=jobs, retry_attempts=2), jobs)
+
+    assert summary.failed_issues == ["PROJ-1", "PROJ-2"]
+    assert job.result.failed_issues == []
+    assert total_seconds(job.result) == 4 * 3600
+    assert {key: issue.issue.summary for day in job.result.days for key, issue in day.issues.items()} == {
+        f"PROJ-{n}": f"Issue {n}" for n in range(1, 5)
+    }
+
+
+def test_retries_give_up_on_an_issue_after_the_fetch_timeout(jira, quick_retries):
+    jira.hanging_issues = {"PROJ-3"}
+    jobs = JobRegistry(max_entries=10, ttl_seconds=60)
+    repository = make_repository(jira, retry_jobs=jobs, retry_attempts=2, issue_fetch_timeout=0.05)
+
+    summary, job = summarize_and_retry(repository, jobs)
+
+    assert summary.failed_issues == ["PROJ-3"]
+    assert job.done
+    assert job.result.failed_issues == ["PROJ-3"]
+    assert job.progress["issues"]["PROJ-3"] == {"status": "failed", "attempts": 3}
+    assert total_seconds(job.result) == 3 * 3600
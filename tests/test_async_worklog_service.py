@@ -0,0 +1,103 @@
+import asyncio
+
+from app.core.cache import TTLCache
+from app.core.singleflight import AsyncSingleFlight
+from app.domain.services.async_worklog_service import AsyncWorklogService
+from app.models.summary import WorklogSummary
+
+
+class FakeRepository:
+    def __init__(self, failed_issues=()):
+        self.calls = []
+        self._failed_issues = list(failed_issues)
+
+    async def get_worklogs_by_date_range(self, **kwargs):
+        self.calls.append(kwargs)
+        await asyncio.sleep(0.01)
+        return WorklogSummary([], list(self._failed_issues))
+
+
+def make_service(repository, cache=None):
+    return AsyncWorklogService(
+        repository,
+        user_account_id="me",
+        cloud_id="cloud",
+        single_flight=AsyncSingleFlight(),
+        summary_cache=cache if cache is not None else TTLCache(max_entries=10, ttl_seconds=60)
+    )
+
+
+def summarize(service, **kwargs):
+    return service.get_worklog_summary(start_date="2026-01-01", end_date="2026-01-31", **kwargs)
+
+
+def test_rollups_reuse_a_summary_fetched_just_before():
+    repository = FakeRepository()
+    service = make_service(repository)
+
+    async def main():
+        summary = await summarize(service)
+        await service.get_worklog_rollup(["week"], start_date="2026-01-01", end_date="2026-01-31")
+        await service.get_worklog_rollup(["project", "day"], start_date="2026-01-01", end_date="2026-01-31")
+        return summary, await summarize(service)
+
+    first, again = asyncio.run(main())
+
+    assert len(repository.calls) == 1
+    assert again is first
+
+
+def test_cached_summaries_are_not_shared_across_requests_that_differ():
+    repository = FakeRepository()
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+
+    async def main():
+        await summarize(make_service(repository, cache))
+        await summarize(make_service(repository, cache), project_keys=["PROJ"])
+        await summarize(make_service(repository, cache), account_id="someone-else")
+        await make_service(repository, cache).get_worklog_summary(start_date="2026-01-01", end_date="2026-01-30")
+
+    asyncio.run(main())
+
+    assert len(repository.calls) == 4
+
+
+def test_force_refresh_bypasses_and_replaces_the_cached_summary():
+    repository = FakeRepository()
+    service = make_service(repository)
+
+    async def main():
+        await summarize(service)
+        refreshed = await summarize(service, force_refresh=True)
+        return refreshed, await summarize(service)
+
+    refreshed, cached = asyncio.run(main())
+
+    assert len(repository.calls) == 2
+    assert cached is refreshed
+
+
+def test_partial_summaries_are_not_cached():
+    repository = FakeRepository(failed_issues=["PROJ-1"])
+    service = make_service(repository)
+
+    async def main():
+        await summarize(service)
+        await summarize(service)
+
+    asyncio.run(main())
+
+    assert len(repository.calls) == 2
+
+
+def test_expired_summaries_are_fetched_again():
+    repository = FakeRepository()
+    service = make_service(repository, TTLCache(max_entries=10, ttl_seconds=0))
+
+    async def main():
+        await summarize(service)
+        await summarize(service)
+
+    asyncio.run(main())
+
+    assert len(repository.calls) == 2
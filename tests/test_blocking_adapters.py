@@ -0,0 +1,135 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.cache import TTLCache
+from app.core.exceptions import ValidationError
+from app.core.loop_thread import LoopThread
+from app.core.singleflight import AsyncSingleFlight
+from app.domain.repositories.worklog_repository import WorklogRepository
+from app.domain.services.async_worklog_service import AsyncWorklogService
+from app.domain.services.worklog_service import WorklogService
+from app.infrastructure.jira_client import JiraClient
+from app.models.summary import WorklogSummary
+
+
+class FakeAsyncRepository:
+    def __init__(self):
+        self.calls = []
+        self.threads = set()
+
+    async def get_worklogs_by_date_range(self, **kwargs):
+        self.calls.append(kwargs)
+        self.threads.add(threading.current_thread().name)
+        await asyncio.sleep(0.01)
+        return WorklogSummary([])
+
+
+class FakeAsyncJiraClient:
+    def __init__(self):
+        self.closed_pages = False
+
+    async def iter_issues(self, jql, fields, page_size=100):
+        try:
+            for page in range(3):
+                await asyncio.sleep(0)
+                yield [{"key": f"PROJ-{page}"}]
+        finally:
+            self.closed_pages = True
+
+    async def get_worklogs_by_ids(self, worklog_ids):
+        return [{"id": worklog_id} for worklog_id in worklog_ids]
+
+
+@pytest.fixture
+def loop_thread():
+    loop_thread = LoopThread(name="test-blocking")
+    yield loop_thread
+    loop_thread.close()
+
+
+def make_service(repository, loop_thread):
+    async_service = AsyncWorklogService(
+        repository,
+        user_account_id="me",
+        cloud_id="cloud",
+        single_flight=AsyncSingleFlight(),
+        summary_cache=TTLCache(max_entries=10, ttl_seconds=60)
+    )
+    return WorklogService(async_service, loop_thread)
+
+
+def test_the_blocking_service_runs_the_async_service_on_the_loop_thread(loop_thread):
+    repository = FakeAsyncRepository()
+    service = make_service(repository, loop_thread)
+
+    summary = service.get_worklog_summary(start_date="2026-01-01", end_date="2026-01-31")
+    rollup = service.get_worklog_rollup(["week"], start_date="2026-01-01", end_date="2026-01-31")
+
+    assert isinstance(summary, WorklogSummary)
+    assert rollup == []
+    assert len(repository.calls) == 1
+    assert repository.threads == {"test-blocking"}
+
+
+def test_the_blocking_service_raises_the_async_services_errors(loop_thread):
+    service = make_service(FakeAsyncRepository(), loop_thread)
+
+    with pytest.raises(ValidationError):
+        service.get_worklog_summary(start_date="2026-01-31", end_date="2026-01-01")
+
+
+def test_concurrent_blocking_callers_share_one_fetch(loop_thread):
+    repository = FakeAsyncRepository()
+    service = make_service(repository, loop_thread)
+    threads = [
+        threading.Thread(target=service.get_worklog_summary, kwargs={"start_date": "2026-01-01", "end_date": "2026-01-31"})
+        for _ in range(4)
+    ]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(repository.calls) == 1
+
+
+def test_the_blocking_repository_passes_arguments_through(loop_thread):
+    repository = FakeAsyncRepository()
+
+    WorklogRepository(repository, loop_thread).get_worklogs_by_date_range(
+        "me", "2026-01-01", "2026-01-31", project_keys=["PROJ"]
+    )
+
+    assert repository.calls == [{
+        "account_id": "me",
+        "start_date": "2026-01-01",
+        "end_date": "2026-01-31",
+        "project_keys": ["PROJ"],
+        "issue_types": None,
+        "force_refresh": False
+    }]
+
+
+def test_the_blocking_client_iterates_pages_and_closes_abandoned_iterators(loop_thread):
+    async_client = FakeAsyncJiraClient()
+    client = JiraClient(async_client, loop_thread)
+
+    assert [page[0]["key"] for page in client.iter_issues("jql", ["summary"])] == ["PROJ-0", "PROJ-1", "PROJ-2"]
+    assert client.get_worklogs_by_ids([1, 2]) == [{"id": 1}, {"id": 2}]
+
+    async_client.closed_pages = False
+    pages = client.iter_issues("jql", ["summary"])
+    next(pages)
+    pages.close()
+    assert async_client.closed_pages
+
+
+def test_running_on_the_loop_thread_itself_is_refused(loop_thread):
+    async def nested():
+        loop_thread.run(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        loop_thread.run(nested())
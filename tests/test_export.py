@@ -0,0 +1,142 @@
+import csv
+import io
+import sys
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.app_config import create_app
+from app.core.dependencies import AuthenticatedUser, get_current_user
+from app.core.exceptions import ValidationError
+from app.presentation.api.v1.worklogs import get_worklog_service
+from app.utils import export
+from app.utils.export import iter_export, validate_export_format
+
+COLUMNS = (("name", str), ("count", int), ("hours", float))
+
+
+def rows(count):
+    return [(f"row-{n}", n, n / 2) for n in range(count)]
+
+
+def test_csv_cells_that_spreadsheets_would_run_are_neutralized():
+    body = b"".join(iter_export(
+        [("=SUM(A1:A9)", 1, 0.5), ("+1", 2, 1.0), ("-2", 3, 1.5), ("@cmd", 4, 2.0), ("plain", 5, 2.5)],
+        COLUMNS,
+        "csv"
+    ))
+
+    parsed = list(csv.reader(io.StringIO(body.decode("utf-8"))))
+
+    assert parsed[0] == ["name", "count", "hours"]
+    assert [row[0] for row in parsed[1:]] == ["'=SUM(A1:A9)", "'+1", "'-2", "'@cmd", "plain"]
+    assert parsed[1][1:] == ["1", "0.5"]
+
+
+def test_csv_is_written_a_chunk_of_rows_at_a_time(monkeypatch):
+    monkeypatch.setattr(export, "EXPORT_ROWS_PER_CHUNK", 2)
+
+    chunks = list(iter_export(rows(5), COLUMNS, "csv"))
+
+    assert len(chunks) == 3
+    assert b"".join(chunks).count(b"\r\n") == 6
+
+
+def test_xlsx_rolls_over_to_a_new_sheet_past_the_row_limit(monkeypatch):
+    pytest.importorskip("xlsxwriter")
+    # Header plus two rows per sheet
+    monkeypatch.setattr(export, "XLSX_MAX_ROWS", 3)
+
+    body = b"".join(iter_export(rows(5), COLUMNS, "xlsx"))
+
+    with zipfile.ZipFile(io.BytesIO(body)) as workbook:
+        sheets = sorted(name for name in workbook.namelist() if name.startswith("xl/worksheets/sheet"))
+        last_sheet = workbook.read(sheets[-1]).decode("utf-8")
+    assert len(sheets) == 3
+    assert last_sheet.count("<row ") == 2
+
+
+def test_xlsx_without_rows_still_has_the_header(monkeypatch):
+    pytest.importorskip("xlsxwriter")
+
+    body = b"".join(iter_export([], COLUMNS, "xlsx"))
+
+    with zipfile.ZipFile(io.BytesIO(body)) as workbook:
+        sheets = [name for name in workbook.namelist() if name.startswith("xl/worksheets/sheet")]
+        assert workbook.read(sheets[0]).decode("utf-8").count("<row ") == 1
+
+
+def test_parquet_is_streamed_one_row_group_per_chunk(monkeypatch):
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as parquet
+    monkeypatch.setattr(export, "EXPORT_ROWS_PER_CHUNK", 2)
+
+    chunks = list(iter_export(rows(5), COLUMNS, "parquet"))
+
+    assert len(chunks) == 3
+    assert all(chunks[:2])
+    table_file = parquet.ParquetFile(pyarrow.BufferReader(b"".join(chunks)))
+    assert table_file.metadata.num_row_groups == 3
+    assert [table_file.metadata.row_group(n).num_rows for n in range(3)] == [2, 2, 1]
+    table = table_file.read()
+    assert table.column("name").to_pylist() == [f"row-{n}" for n in range(5)]
+    assert table.schema.field("count").type == pyarrow.int64()
+
+
+def test_chunk_sink_keeps_counting_positions_across_drains():
+    sink = export._ChunkSink()
+    sink.write(b"abc")
+    assert sink.drain() == b"abc"
+    sink.write(memoryview(b"de"))
+
+    assert sink.tell() == 5
+    assert sink.drain() == b"de"
+    assert sink.drain() == b""
+
+
+@pytest.mark.parametrize("export_format, package", [("xlsx", "xlsxwriter"), ("parquet", "pyarrow")])
+def test_a_missing_package_is_a_validation_error(monkeypatch, export_format, package):
+    monkeypatch.setitem(sys.modules, package, None)
+
+    with pytest.raises(ValidationError, match=package):
+        validate_export_format(export_format)
+    with pytest.raises(ValidationError):
+        iter_export(rows(1), COLUMNS, export_format)
+
+
+def test_unknown_formats_are_rejected():
+    with pytest.raises(ValidationError):
+        validate_export_format("pdf")
+
+
+class RecordingService:
+    def __init__(self):
+        self.calls = []
+
+    async def get_worklog_summary(self, **kwargs):
+        self.calls.append(kwargs)
+        raise AssertionError("the summary should not be fetched")
+
+    async def get_team_summary(self, **kwargs):
+        self.calls.append(kwargs)
+        raise AssertionError("the team summary should not be fetched")
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/api/v1/jira-worklogs/summary/export", {"startDate": "2026-01-01", "endDate": "2026-03-31"}),
+    ("/api/v1/jira-worklogs/team-summary/export", {"accountIds": ["a", "b"], "startDate": "2026-01-01", "endDate": "2026-03-31"})
+])
+def test_exports_needing_a_missing_package_are_rejected_before_fetching(monkeypatch, path, body):
+    monkeypatch.setitem(sys.modules, "xlsxwriter", None)
+    service = RecordingService()
+    app = create_app()
+    app.dependency_overrides[get_current_user] = lambda: AuthenticatedUser("me", "Me", "", "token", "cloud")
+    app.dependency_overrides[get_worklog_service] = lambda: service
+
+    with TestClient(app) as client:
+        response = client.post(path, params={"format": "xlsx"}, json=body)
+
+    assert response.status_code == 400
+    assert "xlsxwriter" in response.json()["message"]
+    assert service.calls == []
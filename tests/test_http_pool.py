@@ -0,0 +1,45 @@
+import asyncio
+
+from app.infrastructure.http_pool import create_async_client
+
+
+def pool_limits(client):
+    pool = client._transport._pool
+    return pool._max_connections, pool._max_keepalive_connections, pool._keepalive_expiry
+
+
+def test_the_pool_limits_reach_the_transport():
+    client = create_async_client(max_connections=3, pool_maxsize=2, idle_timeout=7)
+    try:
+        assert pool_limits(client) == (3, 2, 7)
+    finally:
+        asyncio.run(client.aclose())
+
+
+def test_keep_alive_connections_are_capped_at_the_connection_limit():
+    client = create_async_client(max_connections=3, pool_maxsize=10, idle_timeout=7)
+    try:
+        assert pool_limits(client) == (3, 3, 7)
+    finally:
+        asyncio.run(client.aclose())
+
+
+def test_the_configured_pool_limits_reach_both_shared_clients(monkeypatch):
+    from app.core import container
+    from app.core.container import Container
+
+    monkeypatch.setattr(container, "JIRA_HTTP_MAX_CONNECTIONS", 4)
+    monkeypatch.setattr(container, "JIRA_HTTP_POOL_MAXSIZE", 3)
+    monkeypatch.setattr(container, "JIRA_HTTP_POOL_IDLE_SECONDS", 9)
+    monkeypatch.setattr(container, "_async_http_client", None)
+    monkeypatch.setattr(container, "_blocking_http_client", None)
+
+    request_loop_client = Container.get_async_http_client()
+    blocking_client = Container.get_jira_client(access_token="token", cloud_id="cloud").async_client._http_client
+    try:
+        assert blocking_client is not request_loop_client
+        assert pool_limits(request_loop_client) == (4, 3, 9)
+        assert pool_limits(blocking_client) == (4, 3, 9)
+    finally:
+        asyncio.run(request_loop_client.aclose())
+        asyncio.run(blocking_client.aclose())
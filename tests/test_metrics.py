@@ -0,0 +1,22 @@
+from fastapi.testclient import TestClient
+
+from app.core.app_config import create_app
+from app.core.dependencies import AuthenticatedUser, get_current_user
+
+
+def test_metrics_require_a_signed_in_session():
+    with TestClient(create_app()) as client:
+        response = client.get("/api/v1/metrics")
+
+    assert response.status_code == 401
+    assert "jiraRateLimit" not in response.text
+
+
+def test_signed_in_users_get_the_metrics():
+    app = create_app()
+    app.dependency_overrides[get_current_user] = lambda: AuthenticatedUser("me", "Me", "", "token", "cloud")
+    with TestClient(app) as client:
+        response = client.get("/api/v1/metrics")
+
+    assert response.status_code == 200
+    assert "rate" in response.json()["jiraRateLimit"]
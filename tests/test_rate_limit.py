@@ -0,0 +1,283 @@
+import asyncio
+import threading
+import time
+import types
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from app.core import rate_limit
+from app.core.rate_limit import RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", types.SimpleNamespace(monotonic=fake.monotonic, sleep=time.sleep))
+    return fake
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    in_a_minute = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(" 1.5 ") == 1.5
+    assert parse_retry_after("-4") == 0.0
+    assert 55 < parse_retry_after(in_a_minute) <= 60
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_429_pauses_all_traffic_for_retry_after_and_halves_the_rate(clock):
+    limiter = RateLimiter(rate=10, burst=5)
+
+    limiter.observe(429, {"Retry-After": "3"})
+
+    stats = limiter.stats()
+    assert stats["pausedForSeconds"] == 3.0
+    assert stats["rate"] == 5.0
+    assert stats["tokens"] == 0.0
+    assert stats["throttled"] == 1
+    assert limiter._dispatch(clock.now) == pytest.approx(3.0)
+
+
+def test_429_without_retry_after_pauses_for_the_penalty(clock):
+    limiter = RateLimiter(rate=10, burst=5)
+
+    limiter.observe(429, {})
+
+    assert limiter.stats()["pausedForSeconds"] == rate_limit.THROTTLE_PENALTY_SECONDS
+
+
+def test_503_is_a_throttle_only_with_retry_after(clock):
+    limiter = RateLimiter(rate=10, burst=5)
+
+    limiter.observe(503, {})
+    assert limiter.stats()["throttled"] == 0
+
+    limiter.observe(503, {"Retry-After": "2"})
+    assert limiter.stats()["throttled"] == 1
+    assert limiter.stats()["pausedForSeconds"] == 2.0
+
+
+def test_a_burst_of_429s_slows_the_rate_once(clock):
+    limiter = RateLimiter(rate=10, burst=5)
+
+    for _ in range(4):
+        limiter.observe(429, {"Retry-After": "1"})
+
+    assert limiter.stats()["rate"] == 5.0
+    assert limiter.stats()["throttled"] == 4
+
+
+def test_no_tokens_accrue_during_a_pause(clock):
+    limiter = RateLimiter(rate=10, burst=5)
+    limiter.observe(429, {"Retry-After": "2"})
+
+    clock.advance(2.5)
+
+    # Half a second at the halved rate, not a full bucket.
+    assert limiter.stats()["tokens"] == pytest.approx(2.5)
+
+
+def test_successful_responses_recover_the_rate_gradually_up_to_the_maximum(clock):
+    limiter = RateLimiter(rate=10, burst=5)
+    limiter.observe(429, {"Retry-After": "1"})
+    clock.advance(1)
+
+    limiter.observe(200, {})
+    assert limiter.stats()["rate"] == pytest.approx(5 + 10 * rate_limit.RECOVERY_STEP_FRACTION)
+
+    for _ in range(100):
+        limiter.observe(200, {})
+    assert limiter.stats()["rate"] == 10.0
+
+
+def test_errors_do_not_recover_the_rate(clock):
+    limiter = RateLimiter(rate=10, burst=5)
+    limiter.observe(429, {"Retry-After": "1"})
+
+    limiter.observe(500, {})
+    limiter.observe(404, {})
+
+    assert limiter.stats()["rate"] == 5.0
+
+
+def test_near_limit_headers_slow_the_rate_down_to_the_minimum(clock):
+    limiter = RateLimiter(rate=10, burst=5, min_rate=4)
+
+    limiter.observe(200, {"X-RateLimit-NearLimit": "true"})
+    assert limiter.stats()["rate"] == 8.0
+
+    limiter.observe(200, {"X-RateLimit-Remaining": "5", "X-RateLimit-Limit": "100"})
+    assert limiter.stats()["rate"] == pytest.approx(6.4)
+
+    for _ in range(10):
+        limiter.observe(200, {"X-RateLimit-NearLimit": "true"})
+    assert limiter.stats()["rate"] == 4.0
+
+
+def test_an_exhausted_budget_pauses_until_the_reset(clock):
+    limiter = RateLimiter(rate=10, burst=5)
+    reset = (datetime.now(timezone.utc) + timedelta(seconds=30)).isoformat()
+
+    limiter.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset})
+
+    assert 25 < limiter.stats()["pausedForSeconds"] <= 30
+
+
+def test_queued_keys_are_served_round_robin(clock):
+    limiter = RateLimiter(rate=10, burst=1)
+    limiter._tokens = 0.0
+    waiters = [rate_limit._Waiter(key) for key in ("big", "big", "big", "small", "other", "big")]
+    for waiter in waiters:
+        assert not limiter._take_or_enqueue(waiter, clock.now)
+
+    order = []
+    for _ in waiters:
+        # One token per step, so each dispatch grants exactly one waiter.
+        clock.advance(0.1)
+        limiter._dispatch(clock.now)
+        order.extend(waiter for waiter in waiters if waiter.granted and waiter not in order)
+
+    assert [waiter.key for waiter in order] == ["big", "small", "other", "big", "big", "big"]
+    assert order[0] is waiters[0] and order[3] is waiters[1]
+    assert limiter.stats()["queued"] == 0
+
+
+def test_a_caller_finding_tokens_goes_ahead_only_when_nobody_is_queued(clock):
+    limiter = RateLimiter(rate=10, burst=2)
+    limiter._tokens = 0.0
+    queued = rate_limit._Waiter("first")
+    assert not limiter._take_or_enqueue(queued, clock.now)
+
+    clock.advance(1)
+    assert not limiter._take_or_enqueue(rate_limit._Waiter("second"), clock.now)
+    assert limiter.stats()["queued"] == 2
+
+
+def test_disabled_limiter_never_waits():
+    limiter = RateLimiter(rate=0, burst=1)
+
+    for _ in range(1000):
+        limiter.acquire("key")
+    asyncio.run(limiter.acquire_async("key"))
+
+    assert limiter.stats()["granted"] == 0
+
+
+def test_async_callers_of_different_keys_are_served_fairly():
+    limiter = RateLimiter(rate=100, burst=1)
+    order = []
+
+    async def call(key):
+        await limiter.acquire_async(key)
+        order.append(key)
+
+    async def main():
+        await asyncio.gather(*(call(key) for key in ["big"] * 6 + ["small"] * 2))
+
+    asyncio.run(main())
+
+    # The first call takes the one token; the rest alternate between keys.
+    assert order == ["big", "big", "small", "big", "small", "big", "big", "big"]
+
+
+def test_threads_wait_for_the_pause_to_end():
+    limiter = RateLimiter(rate=100, burst=1)
+    limiter.observe(429, {"Retry-After": "0.2"})
+    waited = []
+
+    def call():
+        start = time.monotonic()
+        limiter.acquire("key")
+        waited.append(time.monotonic() - start)
+
+    thread = threading.Thread(target=call)
+    thread.start()
+    thread.join(5)
+
+    assert waited and waited[0] >= 0.19
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    limiter = RateLimiter(rate=1, burst=1)
+
+    async def main():
+        await limiter.acquire_async("first")
+        waiting = asyncio.create_task(limiter.acquire_async("second"))
+        await asyncio.sleep(0.05)
+        assert limiter.stats()["queued"] == 1
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        return limiter.stats()
+
+    stats = asyncio.run(main())
+
+    assert stats["queued"] == 0
+    assert stats["queuedClients"] == 0
+    assert stats["granted"] == 1
+
+
+def test_cancelled_waiter_returns_a_token_it_was_already_granted(clock):
+    limiter = RateLimiter(rate=10, burst=1)
+    limiter._tokens = 0.0
+    waiter = rate_limit._Waiter("key")
+    limiter._take_or_enqueue(waiter, clock.now)
+    clock.advance(0.1)
+    limiter._dispatch(clock.now)
+    assert waiter.granted and limiter.stats()["tokens"] == 0.0
+
+    limiter._abandon(waiter)
+
+    assert limiter.stats()["tokens"] == 1.0
+
+
+def test_send_async_retries_a_throttled_request_after_the_pause():
+    limiter = RateLimiter(rate=100, burst=10)
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0.1"}),
+        httpx.Response(200, json={"ok": True})
+    ]
+    sent = []
+
+    async def request():
+        sent.append(time.monotonic())
+        return responses[len(sent) - 1]
+
+    response = asyncio.run(limiter.send_async("key", request))
+
+    assert response.status_code == 200
+    assert len(sent) == 2
+    assert sent[1] - sent[0] >= 0.09
+    assert limiter.stats()["throttled"] == 1
+
+
+def test_send_async_gives_up_after_the_last_retry(monkeypatch):
+    monkeypatch.setattr(rate_limit, "retry_backoff", lambda attempt: 0)
+    limiter = RateLimiter(rate=100, burst=10)
+    sent = []
+
+    async def request():
+        sent.append(1)
+        return httpx.Response(502)
+
+    response = asyncio.run(limiter.send_async("key", request))
+
+    assert response.status_code == 502
+    assert len(sent) == rate_limit.JIRA_MAX_RETRIES + 1
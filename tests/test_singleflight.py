@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def wait_for_followers(group: SingleFlight, count: int) -> None:
+    deadline = time.monotonic() + 5
+    while group.stats()["coalesced"] < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_share_one_result():
+    group = SingleFlight()
+    release = threading.Event()
+    started = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"value": 42}
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(group.do, "key", fetch)]
+        started.wait(5)
+        futures += [pool.submit(group.do, "key", fetch) for _ in range(3)]
+        wait_for_followers(group, 3)
+        release.set()
+        results = [future.result(5) for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert group.stats() == {"inFlight": 0, "started": 1, "coalesced": 3}
+
+
+def test_concurrent_calls_share_one_error():
+    group = SingleFlight()
+    release = threading.Event()
+    started = threading.Event()
+
+    def fetch():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(group.do, "key", fetch)
+        started.wait(5)
+        follower = pool.submit(group.do, "key", fetch)
+        wait_for_followers(group, 1)
+        release.set()
+        with pytest.raises(ValueError, match="boom"):
+            leader.result(5)
+        with pytest.raises(ValueError, match="boom"):
+            follower.result(5)
+
+    assert group.stats()["inFlight"] == 0
+
+
+def test_calls_after_completion_run_again():
+    group = SingleFlight()
+    results = iter([1, 2])
+
+    assert group.do("key", lambda: next(results)) == 1
+    assert group.do("key", lambda: next(results)) == 2
+    assert group.stats() == {"inFlight": 0, "started": 2, "coalesced": 0}
+
+
+def test_async_concurrent_calls_share_one_result():
+    group = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ["shared"]
+
+    async def main():
+        return await asyncio.gather(*(group.do("key", fetch) for _ in range(5)), group.do("other", fetch))
+
+    *results, other = asyncio.run(main())
+
+    assert len(calls) == 2
+    assert all(result is results[0] for result in results)
+    assert other is not results[0]
+    assert group.stats() == {"inFlight": 0, "started": 2, "coalesced": 4}
+
+
+def test_async_concurrent_calls_share_one_error():
+    group = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise LookupError("missing")
+
+    async def main():
+        return await asyncio.gather(*(group.do("key", fetch) for _ in range(3)), return_exceptions=True)
+
+    errors = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert all(isinstance(error, LookupError) for error in errors)
+    assert group.stats()["inFlight"] == 0
+
+
+def test_async_cancelled_caller_does_not_cancel_the_others():
+    group = AsyncSingleFlight()
+    finished = []
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        finished.append(1)
+        return "done"
+
+    async def main():
+        first = asyncio.create_task(group.do("key", fetch))
+        second = asyncio.create_task(group.do("key", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == "done"
+    assert finished == [1]
+
+
+def test_async_call_is_cancelled_once_every_caller_has_gone():
+    group = AsyncSingleFlight()
+    cancelled = []
+
+    async def fetch():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+
+    async def main():
+        callers = [asyncio.create_task(group.do("key", fetch)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+        stats = group.stats()
+        # A new caller starts a fresh call rather than joining the cancelled one.
+        result = await group.do("key", _value)
+        return stats, result
+
+    stats, result = asyncio.run(main())
+
+    assert cancelled == [1]
+    assert stats["inFlight"] == 0
+    assert result == "fresh"
+
+
+async def _value():
+    return "fresh"
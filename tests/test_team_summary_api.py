@@ -0,0 +1,146 @@
+import asyncio
+import csv
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.app_config import create_app
+from app.core.dependencies import AuthenticatedUser, get_current_user
+from app.domain.repositories import async_worklog_repository
+from app.domain.repositories.async_worklog_repository import AsyncWorklogRepository
+from app.domain.services.async_worklog_service import AsyncWorklogService
+from app.presentation.api.v1.worklogs import get_worklog_service
+
+TEAM_SUMMARY = "/api/v1/jira-worklogs/team-summary"
+RANGE = {"startDate": "2026-01-01", "endDate": "2026-01-31"}
+
+ISSUES = [
+    {"id": "1", "key": "PROJ-1", "fields": {"summary": "=cmd", "updated": "2026-01-01T00:00:00.000+0000"}},
+    {"id": "2", "key": "PROJ-2", "fields": {"summary": "Second", "updated": "2026-01-01T00:00:00.000+0000"}}
+]
+WORKLOGS = {
+    "PROJ-1": [
+        {"id": "10", "author": {"accountId": "alice", "displayName": "Alice"}, "started": "2026-01-05T09:00:00.000+0000", "timeSpentSeconds": 3600},
+        {"id": "11", "author": {"accountId": "bob", "displayName": "Bob"}, "started": "2026-01-06T09:00:00.000+0000", "timeSpentSeconds": 1800}
+    ],
+    "PROJ-2": [
+        {"id": "20", "author": {"accountId": "alice", "displayName": "Alice"}, "started": "2026-01-06T09:00:00.000+0000", "timeSpentSeconds": 900},
+        {"id": "21", "author": {"accountId": "carol", "displayName": "Carol"}, "started": "2026-01-06T09:00:00.000+0000", "timeSpentSeconds": 600}
+    ]
+}
+
+
+class FakeJiraClient:
+    def __init__(self, group_pages=()):
+        self.group_pages = list(group_pages)
+        self.group_pages_read = 0
+        self.searches = 0
+        self.worklog_requests = []
+
+    async def iter_issues(self, jql, fields, page_size):
+        self.searches += 1
+        yield [dict(item) for item in ISSUES]
+
+    async def iter_issue_worklogs(self, issue_key, started_after=None, started_before=None):
+        self.worklog_requests.append(issue_key)
+        await asyncio.sleep(0)
+        yield list(WORKLOGS[issue_key])
+
+    async def iter_group_members(self, group_name):
+        for page in self.group_pages:
+            self.group_pages_read += 1
+            yield page
+
+
+@pytest.fixture
+def jira():
+    return FakeJiraClient(group_pages=[
+        [{"accountId": "alice", "displayName": "Alice A."}],
+        [{"accountId": "bob", "displayName": "Bob B."}]
+    ])
+
+
+@pytest.fixture
+def client(jira):
+    app = create_app()
+    app.dependency_overrides[get_current_user] = lambda: AuthenticatedUser("me", "Me", "", "token", "cloud")
+    app.dependency_overrides[get_worklog_service] = lambda: AsyncWorklogService(
+        AsyncWorklogRepository(jira, cloud_id="cloud", owner_account_id="me"),
+        user_account_id="me",
+        cloud_id="cloud"
+    )
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_team_summary_has_one_member_per_account_in_request_order(client, jira):
+    response = client.post(TEAM_SUMMARY, json={"accountIds": ["bob", "alice", "bob", "dave"], **RANGE})
+
+    assert response.status_code == 200
+    assert response.headers["X-Worklog-Status"] == "complete"
+    members = response.json()
+    assert [(m["accountId"], m["displayName"], m["totalTimeSpentSeconds"]) for m in members] == [
+        ("bob", "Bob", 1800),
+        ("alice", "Alice", 4500),
+        ("dave", "Unknown", 0)
+    ]
+    assert [day["workDate"] for day in members[1]["days"]] == ["2026-01-05", "2026-01-06"]
+    assert sorted(jira.worklog_requests) == ["PROJ-1", "PROJ-2"]
+
+
+def test_team_summary_of_a_group_uses_the_members_names(client):
+    response = client.post(TEAM_SUMMARY, json={"group": "team-platform", **RANGE})
+
+    assert response.status_code == 200
+    assert [(m["displayName"], m["totalTimeSpentSeconds"]) for m in response.json()] == [
+        ("Alice A.", 4500),
+        ("Bob B.", 1800)
+    ]
+
+
+def test_team_summary_streams_one_member_per_line(client):
+    response = client.post(TEAM_SUMMARY, params={"stream": "ndjson"}, json={"accountIds": ["alice", "carol"], **RANGE})
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [(line["accountId"], line["totalTimeSpentSeconds"]) for line in lines] == [("alice", 4500), ("carol", 600)]
+
+
+def test_groups_larger_than_the_account_limit_are_rejected(client, jira, monkeypatch):
+    monkeypatch.setattr(async_worklog_repository, "TEAM_SUMMARY_MAX_ACCOUNTS", 1)
+    jira.group_pages.append([{"accountId": "carol"}])
+
+    response = client.post(TEAM_SUMMARY, json={"group": "site-users", **RANGE})
+
+    assert response.status_code == 400
+    assert "more than 1 members" in response.json()["message"]
+    assert jira.group_pages_read == 2
+    assert jira.searches == 0 and jira.worklog_requests == []
+
+
+@pytest.mark.parametrize("body", [
+    {"accountIds": [f"account-{n}" for n in range(101)]},
+    {"accountIds": ["alice"], "group": "team-platform"},
+    {}
+])
+def test_invalid_team_selections_are_rejected(client, jira, body):
+    response = client.post(TEAM_SUMMARY, json={**body, **RANGE})
+
+    assert response.status_code == 400
+    assert jira.searches == 0
+
+
+def test_team_export_has_one_row_per_worklog_member_by_member(client):
+    response = client.post(f"{TEAM_SUMMARY}/export", json={"accountIds": ["carol", "alice"], **RANGE})
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == 'attachment; filename="team-worklogs-2026-01-01-2026-01-31.csv"'
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [(row["authorAccountId"], row["issueKey"], row["timeSpentSeconds"]) for row in rows] == [
+        ("carol", "PROJ-2", "600"),
+        ("alice", "PROJ-1", "3600"),
+        ("alice", "PROJ-2", "900")
+    ]
+    assert rows[1]["issueSummary"] == "'=cmd"
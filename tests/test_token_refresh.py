@@ -0,0 +1,116 @@
+import time
+
+import pytest
+from fastapi import Response
+from starlette.requests import Request
+
+from app.core import auth
+from app.core.cache import TTLCache
+from app.core.dependencies import get_current_user
+from app.core.exceptions import AuthenticationError
+from app.core.session import _encode_cookie_value, apply_session_cookies
+
+USER_INFO = '{"accountId": "me", "displayName": "Me", "cloudId": "cloud"}'
+
+
+class RotatingTokenServer:
+    """Issues tokens like Jira does with rotation: each refresh token works once."""
+
+    def __init__(self, expires_in: int = 3600):
+        self.expires_in = expires_in
+        self.valid = {"refresh-0"}
+        self.issued = 0
+
+    def refresh(self, refresh_token: str) -> dict:
+        if refresh_token not in self.valid:
+            raise AuthenticationError("Failed to refresh access token: invalid_grant")
+        self.valid.discard(refresh_token)
+        self.issued += 1
+        self.valid.add(f"refresh-{self.issued}")
+        return {
+            "access_token": f"access-{self.issued}",
+            "refresh_token": f"refresh-{self.issued}",
+            "expires_in": self.expires_in
+        }
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = RotatingTokenServer()
+    monkeypatch.setattr(auth, "_request_token_refresh", server.refresh)
+    monkeypatch.setattr(auth, "_refreshed_tokens", TTLCache(max_entries=10, ttl_seconds=3600))
+    return server
+
+
+def make_request(cookies: dict) -> Request:
+    header = "; ".join(f"{name}={value}" for name, value in cookies.items())
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/worklogs",
+        "query_string": b"",
+        "headers": [(b"cookie", header.encode())]
+    })
+
+
+def browser_cookies(access_token: str, refresh_token: str, expires_at: float) -> dict:
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_expires_at": str(int(expires_at)),
+        "user_info": _encode_cookie_value(USER_INFO)
+    }
+
+
+def send(cookies: dict):
+    """Run ``get_current_user`` for a request with ``cookies``; return the user and the cookies after it."""
+    request = make_request(cookies)
+    user = get_current_user(request)
+    response = Response()
+    apply_session_cookies(response, request)
+    updated = dict(cookies)
+    for header in response.headers.getlist("set-cookie"):
+        name, value = header.split(";", 1)[0].split("=", 1)
+        updated[name] = value
+    return user, updated
+
+
+def test_tokens_within_the_leeway_are_refreshed_into_the_same_response(server):
+    user, cookies = send(browser_cookies("access-0", "refresh-0", time.time() + 60))
+
+    assert user.access_token == "access-1"
+    assert cookies["access_token"] == "access-1"
+    assert cookies["refresh_token"] == "refresh-1"
+    assert float(cookies["token_expires_at"]) > time.time() + 3000
+
+
+def test_session_survives_an_idle_gap_past_the_refreshed_token_expiry(server, monkeypatch):
+    _, cookies = send(browser_cookies("access-0", "refresh-0", time.time() + 60))
+
+    # The user comes back after the new access token has expired, to a restarted process.
+    cookies["token_expires_at"] = str(int(time.time() - 600))
+    monkeypatch.setattr(auth, "_refreshed_tokens", TTLCache(max_entries=10, ttl_seconds=3600))
+    user, cookies = send(cookies)
+
+    assert user.access_token == "access-2"
+    assert cookies["refresh_token"] == "refresh-2"
+    assert server.issued == 2
+
+
+def test_requests_still_carrying_a_rotated_refresh_token_get_the_new_tokens(server):
+    old_cookies = browser_cookies("access-0", "refresh-0", time.time() + 60)
+
+    first, first_cookies = send(old_cookies)
+    second, second_cookies = send(old_cookies)
+
+    assert first.access_token == second.access_token == "access-1"
+    assert first_cookies["refresh_token"] == second_cookies["refresh_token"] == "refresh-1"
+    assert server.issued == 1
+
+
+def test_tokens_outside_the_leeway_are_left_alone(server):
+    user, cookies = send(browser_cookies("access-0", "refresh-0", time.time() + 3600))
+
+    assert user.access_token == "access-0"
+    assert cookies["refresh_token"] == "refresh-0"
+    assert server.issued == 0
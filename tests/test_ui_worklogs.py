@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from app.core.cache import StaleWhileRevalidateCache
+from app.core.container import Container
+from app.core.dependencies import AuthenticatedUser
+from app.models.summary import DaySummary, WorklogSummary
+from app.presentation.web import worklogs
+
+USER = AuthenticatedUser("me", "Me", "", "token", "cloud", "UTC")
+WEEK = ("2026-01-05", "2026-01-11")
+
+
+class FakeService:
+    def __init__(self, *summaries):
+        self.summaries = list(summaries)
+        self.calls = 0
+
+    async def get_worklog_summary(self, **kwargs):
+        self.calls += 1
+        return self.summaries.pop(0)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = StaleWhileRevalidateCache(max_entries=10, fresh_seconds=30, stale_seconds=600)
+    monkeypatch.setattr(Container, "get_ui_summary_cache", staticmethod(lambda: cache))
+    return cache
+
+
+def complete():
+    return WorklogSummary([DaySummary("2026-01-05")])
+
+
+def partial():
+    return WorklogSummary([DaySummary("2026-01-05")], ["PROJ-1"])
+
+
+async def peek_and_refresh(service):
+    """Peek at the week, then let the background refresh it started finish."""
+    result = worklogs._peek_week_summary(service, USER, *WEEK)
+    await asyncio.sleep(0.01)
+    return result
+
+
+def test_a_complete_week_is_refreshed_in_the_background_then_embedded(cache):
+    service = FakeService(complete())
+
+    async def main():
+        return await peek_and_refresh(service), await peek_and_refresh(service)
+
+    first, second = asyncio.run(main())
+
+    assert first == (None, False)
+    data, fresh = second
+    assert fresh
+    assert [day["workDate"] for day in data] == ["2026-01-05"]
+    assert service.calls == 1
+
+
+def test_a_partial_week_is_not_cached(cache):
+    service = FakeService(partial(), partial())
+
+    async def main():
+        return await peek_and_refresh(service), await peek_and_refresh(service)
+
+    first, second = asyncio.run(main())
+
+    assert first == second == (None, False)
+    assert service.calls == 2
+    assert cache.stats()["uncacheable"] == 2
+
+
+def test_a_partial_refresh_keeps_the_stale_complete_week(monkeypatch):
+    cache = StaleWhileRevalidateCache(max_entries=10, fresh_seconds=0, stale_seconds=600)
+    monkeypatch.setattr(Container, "get_ui_summary_cache", staticmethod(lambda: cache))
+    service = FakeService(complete(), partial(), partial())
+
+    async def main():
+        await peek_and_refresh(service)
+        return await peek_and_refresh(service), await peek_and_refresh(service)
+
+    stale, after_partial_refresh = asyncio.run(main())
+
+    assert stale[0] is not None and not stale[1]
+    assert after_partial_refresh == stale
+    assert service.calls == 3
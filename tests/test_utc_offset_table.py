@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.utils.helpers import UtcOffsetTable, ZoneInfo, get_offset_table
+
+RECORDED_OFFSETS = ("+0000", "+0530", "-0800", "+1000", "-0330", "+1345")
+
+
+def reference_date(timestamp: str, zone: ZoneInfo) -> str:
+    parsed = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%f%z")
+    return parsed.astimezone(zone).date().isoformat()
+
+
+def jira_timestamps(first_day: str, days: int, step_minutes: int = 20):
+    """Yield Jira timestamps every ``step_minutes`` of UTC time, in each recorded offset."""
+    start = datetime.strptime(first_day, "%Y-%m-%d").replace(tzinfo=timezone.utc) - timedelta(days=1)
+    for step in range((days + 2) * 24 * 60 // step_minutes):
+        instant = start + timedelta(minutes=step * step_minutes, seconds=7)
+        for offset in RECORDED_OFFSETS:
+            recorded = instant.astimezone(datetime.strptime(offset, "%z").tzinfo)
+            yield recorded.strftime("%Y-%m-%dT%H:%M:%S.000") + offset
+
+
+@pytest.mark.parametrize("zone_name, first_day, days", [
+    ("America/New_York", "2026-03-07", 3),      # spring forward at 02:00
+    ("America/New_York", "2026-10-31", 3),      # fall back at 02:00
+    ("Europe/London", "2026-03-28", 3),
+    ("Europe/London", "2026-10-24", 3),
+    ("Australia/Lord_Howe", "2026-04-04", 3),   # 30 minute change
+    ("Australia/Sydney", "2026-10-03", 3),      # southern hemisphere
+    ("America/Santiago", "2026-04-04", 3),      # change at midnight
+    ("Asia/Kathmandu", "2026-01-01", 2),        # no changes, +05:45
+])
+def test_local_dates_match_zone_conversion_across_offset_changes(zone_name, first_day, days):
+    zone = ZoneInfo(zone_name)
+    last_day = (datetime.strptime(first_day, "%Y-%m-%d") + timedelta(days=days - 1)).strftime("%Y-%m-%d")
+    table = UtcOffsetTable(zone, first_day, last_day)
+
+    mismatches = [
+        (timestamp, table.local_date(timestamp), reference_date(timestamp, zone))
+        for timestamp in jira_timestamps(first_day, days)
+        if table.local_date(timestamp) != reference_date(timestamp, zone)
+    ]
+
+    assert mismatches == []
+
+
+def test_transitions_are_found_to_the_minute():
+    zone = ZoneInfo("America/New_York")
+    table = UtcOffsetTable(zone, "2026-03-08", "2026-03-08")
+
+    # 02:00 EST on 8 March 2026 is 07:00 UTC.
+    change = int(datetime(2026, 3, 8, 7, tzinfo=timezone.utc).timestamp())
+    assert table._offset_at(change - 1) == -5 * 3600
+    assert table._offset_at(change) == -4 * 3600
+
+
+def test_worklogs_either_side_of_midnight_fall_on_the_right_day():
+    table = UtcOffsetTable(ZoneInfo("America/New_York"), "2026-11-01", "2026-11-01")
+
+    # Midnight in New York is 04:00 UTC before the change on 1 November and 05:00 after it.
+    assert table.local_date("2026-11-01T03:59:59.000+0000") == "2026-10-31"
+    assert table.local_date("2026-11-01T04:00:00.000+0000") == "2026-11-01"
+    assert table.local_date("2026-11-02T04:59:59.000+0000") == "2026-11-01"
+    assert table.local_date("2026-11-02T05:00:00.000+0000") == "2026-11-02"
+
+
+def test_other_timestamp_formats():
+    table = UtcOffsetTable(ZoneInfo("Asia/Kolkata"), "2026-01-05", "2026-01-05")
+
+    assert table.local_date("2026-01-05T20:00:00Z") == "2026-01-06"
+    assert table.local_date("2026-01-05T20:00:00+00:00") == "2026-01-06"
+    assert table.local_date("2026-01-05T20:00:00.123456+0000") == "2026-01-06"
+    assert table.local_date("2026-01-05T20:00:00.000+0000") == "2026-01-06"
+
+
+def test_timestamps_without_an_offset_are_taken_as_local_and_malformed_ones_keep_their_date():
+    table = UtcOffsetTable(ZoneInfo("Asia/Kolkata"), "2026-01-05", "2026-01-05")
+
+    assert table.local_date("2026-01-05T23:30:00.000") == "2026-01-05"
+    assert table.local_date("2026-01-05T23:30:00.000+99xx") == "2026-01-05"
+    assert table.local_date("2026-01-05") == "2026-01-05"
+
+
+def test_offset_tables_are_shared_and_unknown_zones_have_none():
+    assert get_offset_table("Europe/London", "2026-03-01", "2026-03-31") is get_offset_table(
+        "Europe/London", "2026-03-01", "2026-03-31"
+    )
+    assert get_offset_table("Not/A_Zone", "2026-03-01", "2026-03-31") is None
@@ -0,0 +1,39 @@
+from app.domain.repositories.worklog_repository_base import WorklogRepositoryBase
+
+
+def test_bulk_fetching_is_off_unless_enabled():
+    repository = WorklogRepositoryBase(jira_client=None, bulk_min_days=90, bulk_min_issues=200)
+
+    assert repository._per_issue_fetch_limit("2026-01-01", "2026-12-31") is None
+
+
+def test_enabled_bulk_fetching_applies_its_thresholds():
+    repository = WorklogRepositoryBase(jira_client=None, bulk_fetch=True, bulk_min_days=90, bulk_min_issues=200)
+
+    assert repository._per_issue_fetch_limit("2026-01-01", "2026-03-31") == 0
+    assert repository._per_issue_fetch_limit("2026-01-01", "2026-01-31") == 200
+    assert WorklogRepositoryBase(
+        jira_client=None, bulk_fetch=True, bulk_min_days=0, bulk_min_issues=0
+    )._per_issue_fetch_limit("2026-01-01", "2026-12-31") is None
+
+
+def test_failed_issues_are_listed_once_for_a_team_not_per_member():
+    repository = WorklogRepositoryBase(jira_client=None)
+    logged = {
+        "id": "1",
+        "author": {"accountId": "a", "displayName": "A"},
+        "started": "2026-01-05T09:00:00.000+0000",
+        "updated": "2026-01-05T09:00:00.000+0000",
+        "timeSpentSeconds": 3600
+    }
+    issue_worklogs = [
+        ({"key": "PROJ-1", "fields": {"summary": "Logged"}}, [logged]),
+        ({"key": "PROJ-2", "fields": {}}, None)
+    ]
+
+    team = repository._summarize_team(issue_worklogs, ["a", "b"], {}, "2026-01-01", "2026-01-31")
+
+    assert team.failed_issues == ["PROJ-2"]
+    assert [member.summary.failed_issues for member in team.members] == [[], []]
+    assert [member.seconds for member in team.members] == [3600, 0]
+    assert repository._summarize(issue_worklogs, "a", "2026-01-01", "2026-01-31").failed_issues == ["PROJ-2"]
@@ -0,0 +1,172 @@
+import pytest
+
+from app.domain.interfaces import Coverage
+from app.infrastructure.worklog_store import WorklogStore
+
+CLOUD, ACCOUNT = "cloud-1", "account-1"
+
+
+def issue(issue_id: int, summary: str = "") -> dict:
+    return {"id": str(issue_id), "key": f"PROJ-{issue_id}", "fields": {"summary": summary or f"Issue {issue_id}"}}
+
+
+def worklog(worklog_id: int, issue_id: int, started: str, seconds: int = 3600) -> dict:
+    return {
+        "id": str(worklog_id),
+        "issueId": str(issue_id),
+        "started": f"{started}T09:00:00.000+0000",
+        "timeSpentSeconds": seconds
+    }
+
+
+def keys(issue_worklogs) -> list:
+    return [item["key"] for item, _ in issue_worklogs]
+
+
+def worklog_ids(issue_worklogs) -> dict:
+    return {item["key"]: [wl["id"] for wl in worklogs] for item, worklogs in issue_worklogs}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return WorklogStore(str(tmp_path / "cache" / "worklogs.sqlite3"))
+
+
+@pytest.fixture
+def january(store):
+    store.replace_range(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31", [
+        (issue(10), [worklog(100, 10, "2026-01-05"), worklog(101, 10, "2026-01-20")]),
+        (issue(20), [worklog(200, 20, "2026-01-10")]),
+        (issue(30), [worklog(300, 30, "2026-01-25")])
+    ], synced_at=1000)
+    return store
+
+
+def test_a_synced_range_covers_the_dates_inside_it(january):
+    assert january.find_coverage(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31") == Coverage("2026-01-01", "2026-01-31", 1000)
+    assert january.find_coverage(CLOUD, ACCOUNT, "2026-01-10", "2026-01-12") == Coverage("2026-01-01", "2026-01-31", 1000)
+    assert january.find_coverage(CLOUD, ACCOUNT, "2026-01-10", "2026-02-02") is None
+    assert january.find_coverage(CLOUD, "account-2", "2026-01-10", "2026-01-12") is None
+    assert january.find_coverage("cloud-2", ACCOUNT, "2026-01-10", "2026-01-12") is None
+
+
+def test_sub_range_reads_return_only_worklogs_started_in_range(january):
+    assert worklog_ids(january.load(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31")) == {
+        "PROJ-10": ["100", "101"],
+        "PROJ-20": ["200"],
+        "PROJ-30": ["300"]
+    }
+    assert worklog_ids(january.load(CLOUD, ACCOUNT, "2026-01-06", "2026-01-20")) == {
+        "PROJ-10": ["101"],
+        "PROJ-20": ["200"]
+    }
+    assert january.load(CLOUD, ACCOUNT, "2026-01-26", "2026-01-31") == []
+
+
+def test_incremental_sync_updates_adds_and_moves_worklogs(january):
+    coverage = january.find_coverage(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31")
+
+    january.apply_sync(
+        CLOUD,
+        ACCOUNT,
+        coverage,
+        issues=[issue(20, "Renamed"), issue(40)],
+        updated_worklogs=[
+            worklog(200, 20, "2026-01-10", seconds=7200),
+            worklog(300, 30, "2026-01-02"),
+            worklog(400, 40, "2026-01-15")
+        ],
+        deleted_worklog_ids=[],
+        synced_at=2000
+    )
+
+    loaded = january.load(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31")
+    assert worklog_ids(loaded) == {
+        "PROJ-10": ["100", "101"],
+        "PROJ-20": ["200"],
+        "PROJ-30": ["300"],
+        "PROJ-40": ["400"]
+    }
+    by_key = {item["key"]: (item, worklogs) for item, worklogs in loaded}
+    assert by_key["PROJ-20"][0]["fields"]["summary"] == "Renamed"
+    assert by_key["PROJ-20"][1][0]["timeSpentSeconds"] == 7200
+    assert worklog_ids(january.load(CLOUD, ACCOUNT, "2026-01-01", "2026-01-03")) == {"PROJ-30": ["300"]}
+    assert january.find_coverage(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31").synced_at == 2000
+
+
+def test_incremental_sync_removes_deleted_worklogs(january):
+    coverage = january.find_coverage(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31")
+
+    january.apply_sync(CLOUD, ACCOUNT, coverage, [], [], deleted_worklog_ids=[101, 200, 999], synced_at=2000)
+
+    assert worklog_ids(january.load(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31")) == {
+        "PROJ-10": ["100"],
+        "PROJ-30": ["300"]
+    }
+
+
+def test_replacing_a_range_drops_worklogs_no_longer_in_it(january):
+    january.replace_range(CLOUD, ACCOUNT, "2026-01-01", "2026-01-15", [
+        (issue(10), [worklog(100, 10, "2026-01-05")])
+    ], synced_at=3000)
+
+    assert worklog_ids(january.load(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31")) == {
+        "PROJ-10": ["100", "101"],
+        "PROJ-30": ["300"]
+    }
+    # The wider range is still recorded; the newer one wins where both apply.
+    assert january.find_coverage(CLOUD, ACCOUNT, "2026-01-02", "2026-01-03").synced_at == 3000
+    assert january.find_coverage(CLOUD, ACCOUNT, "2026-01-02", "2026-01-20").synced_at == 1000
+
+
+def test_replacing_a_range_supersedes_the_ranges_inside_it(january):
+    january.replace_range(CLOUD, ACCOUNT, "2025-12-01", "2026-02-28", [], synced_at=3000)
+
+    assert january.find_coverage(CLOUD, ACCOUNT, "2026-01-10", "2026-01-12") == Coverage("2025-12-01", "2026-02-28", 3000)
+    assert january.load(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31") == []
+
+
+def test_accounts_and_sites_are_kept_apart(january):
+    january.replace_range(CLOUD, "account-2", "2026-01-01", "2026-01-31", [
+        (issue(10), [worklog(500, 10, "2026-01-05")])
+    ], synced_at=1000)
+    january.replace_range("cloud-2", ACCOUNT, "2026-01-01", "2026-01-31", [], synced_at=1000)
+
+    assert worklog_ids(january.load(CLOUD, "account-2", "2026-01-01", "2026-01-31")) == {"PROJ-10": ["500"]}
+    assert keys(january.load(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31")) == ["PROJ-10", "PROJ-20", "PROJ-30"]
+    assert january.load("cloud-2", ACCOUNT, "2026-01-01", "2026-01-31") == []
+
+
+def test_data_survives_reopening_the_store(tmp_path):
+    path = str(tmp_path / "worklogs.sqlite3")
+    WorklogStore(path).replace_range(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31", [
+        (issue(10), [worklog(100, 10, "2026-01-05")])
+    ], synced_at=1000)
+
+    reopened = WorklogStore(path)
+
+    assert reopened.find_coverage(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31").synced_at == 1000
+    assert worklog_ids(reopened.load(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31")) == {"PROJ-10": ["100"]}
+
+
+def test_issues_keep_their_order_across_syncs(january):
+    coverage = january.find_coverage(CLOUD, ACCOUNT, "2026-01-01", "2026-01-31")
+
+    # Only the changed issues come back from an incremental sync, in Jira's order.
+    january.apply_sync(
+        CLOUD,
+        ACCOUNT,
+        coverage,
+        issues=[issue(30), issue(50), issue(20)],
+        updated_worklogs=[worklog(301, 30, "2026-01-26"), worklog(500, 50, "2026-01-03"), worklog(201, 20, "2026-01-11")],
+        deleted_worklog_ids=[],
+        synced_at=2000
+    )
+    january.replace_range(CLOUD, ACCOUNT, "2026-02-01", "2026-02-28", [
+        (issue(60), [worklog(600, 60, "2026-02-01")]),
+        (issue(10), [worklog(102, 10, "2026-02-02")])
+    ], synced_at=2000)
+
+    assert keys(january.load(CLOUD, ACCOUNT, "2026-01-01", "2026-02-28")) == [
+        "PROJ-10", "PROJ-20", "PROJ-30", "PROJ-50", "PROJ-60"
+    ]